@@ -0,0 +1,27 @@
+"""Optional mypyc build of the hot modules.
+
+Set `WHITESPACESV_MYPYC=1` to compile the parser, serializer and their helpers
+with mypyc, which must be installed in the build environment, e.g.
+`pip install mypy && WHITESPACESV_MYPYC=1 pip install --no-build-isolation .`.
+Without it, the pure-Python package is built.
+"""
+
+from __future__ import annotations
+
+import os
+
+from setuptools import setup
+
+COMPILED_MODULES = [
+    "whitespacesv/parser.py",
+    "whitespacesv/serializer.py",
+    "whitespacesv/txt.py",
+    "whitespacesv/utils.py",
+]
+
+if os.environ.get("WHITESPACESV_MYPYC", "0") == "1":
+    from mypyc.build import mypycify
+
+    setup(ext_modules=mypycify(COMPILED_MODULES, opt_level="3"))
+else:
+    setup()
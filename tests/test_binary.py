@@ -0,0 +1,60 @@
+"""Tests for the whitespacesv.binary module."""
+
+from __future__ import annotations
+
+import pytest
+
+from whitespacesv.binary import PREAMBLE, decode_lines, encode_lines, encode_values
+from whitespacesv.line import WsvLine
+from whitespacesv.parser import parse_lines
+
+TEXT = """\
+a b  c #comment
+"" - "-" "x y"
+#only a comment
+
+"a"/"b" "c""d" äöü 💡
+"""
+
+
+def test_round_trip() -> None:
+    lines = parse_lines(TEXT + '"' + "x" * 300 + '"\n')
+    decoded = decode_lines(encode_lines(lines))
+    assert [line.values for line in decoded] == [line.values for line in lines]  # noqa: PD011
+    assert all(line.whitespaces is None and line.comment is None for line in decoded)
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [
+        ([], b"\x00"),
+        ([None], b"\x01\x00"),
+        (["", "ab"], b"\x02\x04ab\x00"),
+        (["ä"], b"\x04\xc3\xa4\x00"),
+        (["x" * 200], b"\xca\x01" + b"x" * 200 + b"\x00"),
+    ],
+)
+def test_encode_values(values: list[str | None], expected: bytes) -> None:
+    assert encode_values(values) == expected
+    assert decode_lines(PREAMBLE + expected) == [WsvLine(values)]
+
+
+@pytest.mark.parametrize(
+    ("data", "message"),
+    [
+        (b"WSVL2", "Invalid binary WSV preamble"),
+        # the upstream BinaryWSV preamble
+        (b"BW1\x00", "Invalid binary WSV preamble"),
+        (PREAMBLE + b"\x80", "Truncated binary WSV varint"),
+        (PREAMBLE + b"\x05ab", "Truncated binary WSV value"),
+        (PREAMBLE + b"\x01", "Truncated binary WSV line"),
+    ],
+)
+def test_decode_errors(data: bytes, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        decode_lines(data)
+
+
+def test_empty() -> None:
+    assert encode_lines([]) == PREAMBLE
+    assert decode_lines(PREAMBLE) == []
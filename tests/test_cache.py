@@ -0,0 +1,143 @@
+"""Tests for the whitespacesv.cache module."""
+
+from __future__ import annotations
+
+import os
+import pickle
+from typing import TYPE_CHECKING
+
+import pytest
+
+from whitespacesv import cache as cache_module
+from whitespacesv.cache import DocumentCache
+from whitespacesv.document import WsvDocument
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from whitespacesv.line import WsvLine
+
+TEXT = 'a "b c"  #x\n- d\n'
+
+
+def _fail(*_: object) -> Iterator[WsvLine]:
+    raise AssertionError("file parsed")
+
+
+def test_next_to_source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "table.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    cache = DocumentCache()
+
+    doc = WsvDocument.load(path, cache=cache)
+    assert cache.snapshot_path(path) == tmp_path / "table.txt.wsvcache"
+    assert cache.snapshot_path(path).exists()
+
+    with monkeypatch.context() as patch:
+        patch.setattr(cache_module, "iter_lines", _fail)
+        cached = WsvDocument.load(path, cache=cache)
+    assert cached == doc
+    assert cached.to_string() == TEXT
+    assert not cached.lines[0].dirty
+
+    path.write_text("e\n", encoding="utf-8")
+    assert WsvDocument.load(path, cache=cache) == WsvDocument.parse("e\n")
+
+
+def test_use_hash(tmp_path: Path) -> None:
+    path = tmp_path / "table.txt"
+    path.write_text("a\n", encoding="utf-8")
+    stat = path.stat()
+    cache = DocumentCache(tmp_path / "cache", use_hash=True)
+    assert WsvDocument.load(path, cache=cache) == WsvDocument.parse("a\n")
+
+    # same size and modification time
+    path.write_text("b\n", encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert WsvDocument.load(path, cache=cache) == WsvDocument.parse("b\n")
+
+
+def test_corrupt_snapshot(tmp_path: Path) -> None:
+    path = tmp_path / "table.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    cache = DocumentCache(tmp_path / "cache")
+    cache.load_lines(path)
+
+    cache.snapshot_path(path).write_bytes(b"invalid")
+    assert WsvDocument(cache.load_lines(path)) == WsvDocument.parse(TEXT)
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        # a class which no longer exists raises AttributeError
+        b"cwhitespacesv.line\n_Missing\n.",
+        # rows of another layout raise TypeError
+        pickle.dumps((1, None, [1])),
+    ],
+)
+def test_stale_snapshot(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, content: bytes) -> None:
+    path = tmp_path / "table.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    cache = DocumentCache(tmp_path / "cache")
+    signature = cache._signature(path)  # noqa: SLF001
+    cache.snapshot_path(path).write_bytes(content.replace(b"None", repr(signature).encode()))
+    monkeypatch.setattr(cache_module, "_VERSION", 1)
+    assert WsvDocument(cache.load_lines(path)) == WsvDocument.parse(TEXT)
+
+
+def test_concurrent_eviction(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "table.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    cache = DocumentCache(tmp_path / "cache")
+    cache.load_lines(path)
+
+    read_snapshot = cache_module._read_snapshot  # noqa: SLF001
+
+    def evicting_read_snapshot(snapshot: Path, signature: tuple[int, int, None]) -> object:
+        lines = read_snapshot(snapshot, signature)
+        # evicted by another process before it is marked as recently used
+        snapshot.unlink()
+        return lines
+
+    with monkeypatch.context() as patch:
+        patch.setattr(cache_module, "_read_snapshot", evicting_read_snapshot)
+        assert WsvDocument(cache.load_lines(path)) == WsvDocument.parse(TEXT)
+
+    glob = type(tmp_path).glob
+
+    def glob_with_missing(self: Path, pattern: str) -> Iterator[Path]:
+        # listed but evicted by another process before it is inspected
+        yield self / ("missing" + pattern.lstrip("*"))
+        yield from glob(self, pattern)
+
+    monkeypatch.setattr(type(tmp_path), "glob", glob_with_missing)
+    cache.max_size = 0
+    cache.load_lines(path)
+    assert not cache.snapshot_path(path).exists()
+
+
+def test_evict(tmp_path: Path) -> None:
+    paths = [tmp_path / f"{ix}.txt" for ix in range(3)]
+    for path in paths:
+        path.write_text(TEXT, encoding="utf-8")
+
+    cache = DocumentCache(tmp_path / "cache", max_size=0)
+    cache.load_lines(paths[0])
+    assert not list((tmp_path / "cache").iterdir())
+
+    cache.max_size = None
+    for path in paths[:2]:
+        cache.load_lines(path)
+    size = cache.snapshot_path(paths[0]).stat().st_size
+    os.utime(cache.snapshot_path(paths[0]), ns=(0, 0))
+    os.utime(cache.snapshot_path(paths[1]), ns=(0, 0))
+
+    # a cache hit marks the first snapshot as recently used
+    cache.load_lines(paths[0])
+    cache.max_size = 2 * size + size // 2
+    cache.load_lines(paths[2])
+    assert cache.snapshot_path(paths[0]).exists()
+    assert not cache.snapshot_path(paths[1]).exists()
+    assert cache.snapshot_path(paths[2]).exists()
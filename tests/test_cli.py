@@ -0,0 +1,138 @@
+"""Tests for the whitespacesv.cli module."""
+
+from __future__ import annotations
+
+import io
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from whitespacesv.cli import main
+
+ASSETS = Path(__file__).parent / "assets"
+TEXT = 'a   "b c" #x\n\n#comment\n- d\n'
+
+
+@pytest.fixture
+def wsv_file(tmp_path: Path) -> Path:
+    path = tmp_path / "table.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    return path
+
+
+def test_validate(wsv_file: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["validate", str(wsv_file)]) == 0
+
+    wsv_file.write_text('a\n"b\n', encoding="utf-8")
+    assert main(["validate", str(wsv_file)]) == 1
+    assert capsys.readouterr().err == "whitespacesv validate: String not closed (2, 3)\n"
+
+
+def test_stats(wsv_file: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["stats", str(wsv_file)]) == 0
+    assert capsys.readouterr().out == (
+        "lines 4\nvalues 4\nnulls 1\ncomments 2\nempty 1\ncolumns 2\n"
+    )
+
+
+@pytest.mark.parametrize(
+    ("mode", "expected"),
+    [
+        ("preserve", TEXT),
+        ("compact", 'a "b c"\n\n\n- d\n'),
+        ("pretty", 'a\t"b c"\t#x\n\n#comment\n-\td\n'),
+    ],
+)
+def test_format(wsv_file: Path, tmp_path: Path, mode: str, expected: str) -> None:
+    output = tmp_path / "out.txt.gz"
+    assert main(["format", "--mode", mode, str(wsv_file), "-o", str(output)]) == 0
+    assert main(["format", "--mode", "preserve", str(output), "-o", str(tmp_path / "out.txt")]) == 0
+    assert (tmp_path / "out.txt").read_text(encoding="utf-8") == expected
+
+
+def test_stdin(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    monkeypatch.setattr(sys, "stdin", io.StringIO(TEXT))
+    assert main(["format"]) == 0
+    assert capsys.readouterr().out == 'a "b c"\n\n\n- d\n'
+
+
+def test_convert(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    wsv_path = tmp_path / "table.txt"
+    assert (
+        main(
+            [
+                "convert",
+                "--from",
+                "csv",
+                "--to",
+                "wsv",
+                str(ASSETS / "table.csv"),
+                "-o",
+                str(wsv_path),
+            ]
+        )
+        == 0
+    )
+    assert main(["convert", "--to", "tsv", "--none-value", "NA", str(wsv_path)]) == 0
+    assert capsys.readouterr().out.startswith("TestCol\tTestCol2\tTestCol3\n1\t2\t3\n")
+
+    assert main(["convert", "--from", "csv", "--to", "tsv", str(wsv_path)]) == 1
+    assert "Conversion is only supported between WSV and CSV/TSV" in capsys.readouterr().err
+
+
+def test_head(wsv_file: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["head", "-n", "2", str(wsv_file)]) == 0
+    assert capsys.readouterr().out == 'a   "b c" #x\n\n'
+
+
+def test_count(wsv_file: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["count", str(wsv_file)]) == 0
+    assert capsys.readouterr().out == "2\n"
+    assert main(["count", "--empty", "--comments", str(wsv_file)]) == 0
+    assert capsys.readouterr().out == "4\n"
+
+    assert main(["count", str(wsv_file.with_name("missing.txt"))]) == 1
+    assert "No such file or directory" in capsys.readouterr().err
+
+
+def test_sort(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    path = tmp_path / "table.txt"
+    path.write_text("id n\nb 10\na 9\n", encoding="utf-8")
+    assert main(["sort", "--header", "-k", "n", "--numeric", "-r", str(path)]) == 0
+    assert capsys.readouterr().out == "id n\nb 10\na 9\n"
+    assert main(["sort", "-k", "1", str(path)]) == 0
+    assert capsys.readouterr().out == "b 10\na 9\nid n\n"
+
+    assert main(["sort", "-k", "n", str(path)]) == 1
+    assert capsys.readouterr().err == "whitespacesv sort: A key column name requires a header\n"
+
+
+def test_module(wsv_file: Path) -> None:
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "whitespacesv", "count", str(wsv_file)],
+        capture_output=True,
+        check=True,
+        text=True,
+        cwd=Path(__file__).parent.parent,
+    )
+    assert result.stdout == "2\n"
+
+
+def test_broken_pipe(tmp_path: Path) -> None:
+    path = tmp_path / "table.txt"
+    path.write_text("a b c\n" * 100_000, encoding="utf-8")
+    with subprocess.Popen(  # noqa: S603
+        [sys.executable, "-m", "whitespacesv", "head", "-n", "100000", str(path)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=Path(__file__).parent.parent,
+    ) as process:
+        assert process.stdout is not None
+        assert process.stderr is not None
+        # like `| head -1`
+        assert process.stdout.readline() == b"a b c\n"
+        process.stdout.close()
+        assert process.stderr.read() == b""
+        assert process.wait() == 1
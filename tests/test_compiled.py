@@ -0,0 +1,18 @@
+"""Tests for the optional mypyc build.
+
+The whole test suite is the parity suite of the compiled build: run it once
+with the pure-Python modules and once after building with `WHITESPACESV_MYPYC=1`
+and `WHITESPACESV_EXPECT_COMPILED=1` set.
+"""
+
+from __future__ import annotations
+
+import os
+
+from whitespacesv import COMPILED, parser, serializer, txt, utils
+
+
+def test_compiled() -> None:
+    modules = [parser, serializer, txt, utils]
+    assert [not str(module.__file__).endswith(".py") for module in modules] == [COMPILED] * 4
+    assert os.environ.get("WHITESPACESV_EXPECT_COMPILED", "0") == str(int(COMPILED))
@@ -0,0 +1,69 @@
+"""Tests for the whitespacesv.convert module."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from whitespacesv.convert import csv_to_wsv, wsv_to_csv
+from whitespacesv.document import WsvDocument
+
+ASSETS = Path(__file__).parent / "assets"
+
+
+def test_table(tmp_path: Path) -> None:
+    wsv_path = tmp_path / "table.txt"
+    csv_path = tmp_path / "table.csv"
+
+    assert csv_to_wsv(ASSETS / "table.csv", wsv_path) == 4
+    assert (
+        WsvDocument.load(wsv_path)
+        .to_pandas()
+        .equals(WsvDocument.load(ASSETS / "table.txt").to_pandas())
+    )
+
+    assert wsv_to_csv(ASSETS / "table.txt", csv_path) == 4
+    assert csv_path.read_text(encoding="utf-8") == (ASSETS / "table.csv").read_text(
+        encoding="utf-8"
+    )
+
+
+@pytest.mark.parametrize(
+    ("empty_as_none", "expected"), [(True, 'a - "b c"\n'), (False, 'a "" "b c"\n')]
+)
+def test_csv_to_wsv_empty(empty_as_none: bool, expected: str) -> None:
+    dst = io.StringIO()
+    csv_to_wsv(io.StringIO('a,,"b c"\n'), dst, empty_as_none=empty_as_none)
+    assert dst.getvalue() == expected
+
+
+def test_csv_to_wsv_special() -> None:
+    dst = io.StringIO()
+    csv_to_wsv(io.StringIO('a\t"x\ny"\t"q"""\t#\n'), dst, delimiter="\t")
+    assert WsvDocument.parse(dst.getvalue()).lines[0].values == ["a", "x\ny", 'q"', "#"]  # noqa: PD011
+
+
+def test_wsv_to_csv() -> None:
+    dst = io.StringIO()
+    src = io.StringIO('#header\na - "b,c"\n\n"x"/"y" ""\n')
+    assert wsv_to_csv(src, dst, none_value="NA") == 2
+    assert dst.getvalue() == 'a,NA,"b,c"\n"x\ny",\n'
+
+    dst = io.StringIO()
+    src.seek(0)
+    assert wsv_to_csv(src, dst, delimiter="\t", skip_empty=False) == 4
+    assert dst.getvalue() == '\na\t\tb,c\n\n"x\ny"\t\n'
+
+
+def test_compressed(tmp_path: Path) -> None:
+    wsv_path = tmp_path / "table.txt.gz"
+    csv_path = tmp_path / "table.csv.gz"
+    csv_to_wsv(ASSETS / "table.csv", wsv_path, compression=None)
+    wsv_to_csv(ASSETS / "table.txt", csv_path)
+    csv_to_wsv(csv_path, wsv_path)
+    assert (
+        WsvDocument.load(wsv_path).to_string("compact")
+        == "TestCol TestCol2 TestCol3\n1 2 3\n2 3 4\n3 4 5\n"
+    )
@@ -0,0 +1,116 @@
+"""Tests for the whitespacesv.diff module."""
+
+from __future__ import annotations
+
+import io
+import random
+from typing import TYPE_CHECKING
+
+import pytest
+
+from whitespacesv.diff import DiffOp, _diff_ids, diff_files, diff_lines
+from whitespacesv.document import WsvDocument
+from whitespacesv.line import WsvLine
+from whitespacesv.parser import parse_lines
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+OLD = "a 1\nb 2 #x\nc 3\nd  4\ne 5\n"
+NEW = "a 1\nb 2\nx 9\nd 4\ne 5\nf 6\n"
+
+
+def _apply(a: list[int], b: list[int], ops: list[DiffOp]) -> list[int]:
+    result: list[int] = []
+    a_ix = b_ix = 0
+    for op in ops:
+        assert (op.a_start, op.b_start) == (a_ix, b_ix)
+        if op.tag == "equal":
+            assert a[op.a_start : op.a_end] == b[op.b_start : op.b_end]
+            result.extend(a[op.a_start : op.a_end])
+        else:
+            assert op.a_start < op.a_end or op.b_start < op.b_end
+            result.extend(b[op.b_start : op.b_end])
+        a_ix, b_ix = op.a_end, op.b_end
+    assert (a_ix, b_ix) == (len(a), len(b))
+    return result
+
+
+def test_diff_lines() -> None:
+    old, new = parse_lines(OLD), parse_lines(NEW)
+    assert diff_lines(old, new) == [
+        DiffOp("equal", 0, 2, 0, 2),
+        DiffOp("replace", 2, 3, 2, 3),
+        DiffOp("equal", 3, 5, 3, 5),
+        DiffOp("insert", 5, 5, 5, 6),
+    ]
+    assert diff_lines(old, new, "preserve") == [
+        DiffOp("equal", 0, 1, 0, 1),
+        DiffOp("replace", 1, 4, 1, 4),
+        DiffOp("equal", 4, 5, 4, 5),
+        DiffOp("insert", 5, 5, 5, 6),
+    ]
+    assert diff_lines(old, []) == [DiffOp("delete", 0, 5, 0, 0)]
+    assert diff_lines([], []) == []
+
+
+def test_diff_line_equality() -> None:
+    # quoting is not part of line equality, whitespaces and comments are in preserve mode
+    old = parse_lines('"a" b\n"-" -\nc  d #x\n')
+    new = parse_lines('a "b"\n"-" -\nc d #x\n')
+    assert [x == y for x, y in zip(old, new)] == [True, True, False]
+    assert diff_lines(old, new, "preserve") == [
+        DiffOp("equal", 0, 2, 0, 2),
+        DiffOp("replace", 2, 3, 2, 3),
+    ]
+    assert diff_lines(old, new) == [DiffOp("equal", 0, 3, 0, 3)]
+
+    # null and dash, missing and empty whitespaces differ
+    assert diff_lines(parse_lines("-\n"), parse_lines('"-"\n'))[0].tag == "replace"
+    assert diff_lines([WsvLine(["a"])], [WsvLine(["a"], [])], "preserve")[0].tag == "replace"
+
+    with pytest.raises(ValueError, match="Invalid diff mode: pretty"):
+        diff_lines(old, new, "pretty")  # type: ignore[arg-type]
+
+
+def test_document_diff(tmp_path: Path) -> None:
+    old, new = WsvDocument.parse(OLD), WsvDocument.parse(NEW)
+    assert old.diff(new) == diff_lines(old.lines, new.lines)
+    assert old.diff(old, "preserve") == [DiffOp("equal", 0, 5, 0, 5)]
+
+    path = tmp_path / "old.txt.gz"
+    old.save(path)
+    assert diff_files(path, io.StringIO(NEW), "preserve") == old.diff(new, "preserve")
+
+
+def test_diff_ids_random() -> None:
+    rng = random.Random(0)  # noqa: S311
+    for ix in range(1000):
+        # few values give repeated lines, many values give unique anchors
+        values = 6 if ix % 2 else 50
+        a = [rng.randrange(values) for _ in range(rng.randrange(30))]
+        b = list(a)
+        for _ in range(rng.randrange(5)):
+            pos = rng.randrange(len(b) + 1)
+            if rng.random() < 0.5 and pos < len(b):
+                del b[pos]
+            else:
+                b.insert(pos, rng.randrange(values + 2))
+        ops = _diff_ids(a, b)
+        assert _apply(a, b, ops) == b
+        # adjacent operations are merged
+        assert all(
+            first.tag != "equal" or second.tag != "equal" for first, second in zip(ops, ops[1:])
+        )
+
+
+def test_diff_ids_large() -> None:
+    a = list(range(200_000))
+    b = [*a[:1000], -1, *a[1000:150_000], *a[150_001:]]
+    assert _diff_ids(a, b) == [
+        DiffOp("equal", 0, 1000, 0, 1000),
+        DiffOp("insert", 1000, 1000, 1000, 1001),
+        DiffOp("equal", 1000, 150_000, 1001, 150_001),
+        DiffOp("delete", 150_000, 150_001, 150_001, 150_001),
+        DiffOp("equal", 150_001, 200_000, 150_001, 200_000),
+    ]
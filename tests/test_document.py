@@ -3,15 +3,20 @@
 # ruff: noqa: PD901
 from __future__ import annotations
 
+import io
+import multiprocessing
 import tempfile
 from pathlib import Path
 from typing import Literal
 
 import pandas as pd
 import pytest
+from typing_extensions import Buffer, override
 
+import whitespacesv.document as document_module
 from whitespacesv.document import WsvDocument
 from whitespacesv.line import WsvLine
+from whitespacesv.utils import WsvParserError
 
 
 def test_init() -> None:
@@ -80,6 +85,19 @@ def test_load() -> None:
         Path(file.name).write_text("a b c", encoding="utf-8")
         with pytest.raises(ValueError, match=r"Empty file or no new line at the end"):
             WsvDocument.load(file.name)
+        # the missing new line is raised before the invalid last line is parsed
+        Path(file.name).write_text('a\nb "c', encoding="utf-8")
+        with pytest.raises(ValueError, match=r"Empty file or no new line at the end"):
+            WsvDocument.load(file.name)
+
+        # the index of the error is relative to the document
+        Path(file.name).write_text('a\nb c "d\n', encoding="utf-8")
+        with pytest.raises(WsvParserError) as exc_info:
+            WsvDocument.load(file.name)
+        with pytest.raises(WsvParserError) as parse_exc_info:
+            WsvDocument.parse('a\nb c "d\n')
+        assert str(exc_info.value) == str(parse_exc_info.value)
+        assert exc_info.value.ix == parse_exc_info.value.ix > len("a\nb c")
 
     with tempfile.NamedTemporaryFile() as file:
         doc = WsvDocument([line])
@@ -100,3 +118,157 @@ def test_from_pandas() -> None:
 
     assert doc == expected_doc
     assert doc_wo_header == expected_doc_wo_header
+
+
+def test_from_lines_unchecked() -> None:
+    lines = [WsvLine(["a", "b"]), WsvLine([], comment="c")]
+    document = WsvDocument.from_lines_unchecked(lines)
+    assert document.lines is lines
+    assert document == WsvDocument(lines)
+
+
+def test_extend_rows() -> None:
+    document = WsvDocument([WsvLine(["a"])])
+    document.extend_rows([["b", None], ("c",)])
+    assert document == WsvDocument([WsvLine(["a"]), WsvLine(["b", None]), WsvLine(["c"])])
+    assert document.serialize("compact") == ["a", "b -", "c"]
+
+
+def test_serialize_preserves_source() -> None:
+    text = '"a"\t b  #comment\n"x y" - \n'
+    doc = WsvDocument.parse(text)
+    assert doc.to_string() == text
+    assert doc.to_string("compact") == 'a b\n"x y" -\n'
+
+    doc.lines[0].values[1] = "c"  # noqa: PD011
+    assert doc.serialize() == ["a\t c  #comment", '"x y" - ']
+
+
+def test_save_append(tmp_path: Path) -> None:
+    path = tmp_path / "log.txt"
+    WsvDocument([WsvLine(["a", "b"])]).save(path, append=True)
+    WsvDocument([WsvLine(["c", None])]).save(path, append=True)
+    assert path.read_text(encoding="utf-8") == "a b\nc -\n"
+    assert WsvDocument.load(path) == WsvDocument.parse("a b\nc -\n")
+
+    path.write_text("a b", encoding="utf-8")
+    with pytest.raises(ValueError, match="Can't append to a file without new line at the end"):
+        WsvDocument([WsvLine(["c"])]).save(path, append=True)
+
+
+@pytest.mark.parametrize("mode", ["preserve", "compact", "pretty"])
+def test_save_workers(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, mode: Literal["preserve", "compact", "pretty"]
+) -> None:
+    monkeypatch.setattr(document_module, "_SAVE_RANGE", 7)
+    doc = WsvDocument.parse("".join(f'{ix} "x y"  #c{ix}\n\n' for ix in range(100)))
+    doc.lines[3].values.append("a longer value")  # noqa: PD011
+    path = tmp_path / "table.txt"
+    doc.save(path, mode, workers=3)
+    assert path.read_text(encoding="utf-8") == doc.to_string(mode)
+    assert not document_module._SAVE_LINES  # noqa: SLF001
+
+    doc.save(path, mode, append=True, workers=2)
+    assert path.read_text(encoding="utf-8") == doc.to_string(mode) * 2
+
+    with pytest.raises(ValueError, match="Invalid number of workers: 0"):
+        doc.save(path, mode, workers=0)
+
+    # serial without the fork start method
+    monkeypatch.setattr(multiprocessing, "get_all_start_methods", lambda: ["spawn"])
+    doc.save(path, mode, workers=2)
+    assert path.read_text(encoding="utf-8") == doc.to_string(mode)
+
+
+@pytest.mark.parametrize("mode", ["preserve", "compact", "pretty"])
+def test_to_bytes(mode: Literal["preserve", "compact", "pretty"]) -> None:
+    doc = WsvDocument.parse('a  \u00e4 #c\n\n- "x y"\n' * 1000)
+    doc.lines[1].values.append("b")  # noqa: PD011
+    assert doc.to_bytes(mode) == doc.to_string(mode).encode("utf-8")
+    assert WsvDocument().to_bytes(mode) == b"\n"
+
+
+def test_dump() -> None:
+    class Output(io.BytesIO):
+        writes = 0
+
+        @override
+        def write(self, data: Buffer, /) -> int:
+            self.writes += 1
+            return super().write(data)
+
+    doc = WsvDocument([WsvLine([str(ix), "\u00e4"]) for ix in range(5000)])
+    output = Output()
+    doc.dump(output, "compact", buffer_size=10_000)
+    assert output.getvalue() == doc.to_string("compact").encode("utf-8")
+    assert 1 < output.writes < 10
+
+
+@pytest.mark.parametrize("mode", ["preserve", "compact", "pretty"])
+def test_dump_not_memoized(mode: Literal["preserve", "compact", "pretty"]) -> None:
+    doc = WsvDocument.parse('a "b c" #x\n-\n' * 2000)
+    doc.lines[0].values.append("d")  # noqa: PD011
+    expected = doc.to_string(mode).encode("utf-8")
+    doc = WsvDocument.parse('a "b c" #x\n-\n' * 2000)
+    doc.lines[0].values.append("d")  # noqa: PD011
+    assert doc.to_bytes(mode) == expected
+    for line in doc.lines:
+        assert not line._serialized  # noqa: SLF001
+        assert line._serialized_values is None  # noqa: SLF001
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz"])
+def test_compressed(tmp_path: Path, suffix: str) -> None:
+    path = tmp_path / f"table{suffix}"
+    doc = WsvDocument.parse('a "b c"\n- d #x\n')
+    doc.save(path)
+    assert WsvDocument.load(path) == doc
+    assert WsvDocument.load(path).to_string() == doc.to_string()
+
+    WsvDocument([WsvLine(["e"])]).save(path, append=True)
+    assert WsvDocument.load(path).lines[-1] == WsvLine(["e"], [None])
+
+    path.unlink()
+    doc.save(path, append=True, compression=None)
+    assert WsvDocument.load(path, compression=None) == doc
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+@pytest.mark.parametrize("ordered", [True, False])
+def test_load_many(tmp_path: Path, executor: Literal["thread", "process"], ordered: bool) -> None:
+    paths = [tmp_path / f"{ix}.txt" for ix in range(5)]
+    for ix, path in enumerate(paths):
+        path.write_text(f"a {ix}\n", encoding="utf-8")
+    paths[2].write_text("a", encoding="utf-8")
+    paths.append(tmp_path / "missing.txt")
+
+    results = list(WsvDocument.load_many(paths, workers=2, executor=executor, ordered=ordered))
+    if ordered:
+        assert [result.path for result in results] == paths
+    results.sort(key=lambda result: str(result.path))
+
+    for ix, result in enumerate(results[:5]):
+        if ix == 2:
+            assert result.document is None
+            assert isinstance(result.error, ValueError)
+        else:
+            assert result.error is None
+            assert result.document == WsvDocument.parse(f"a {ix}\n")
+            assert result.document.to_string() == f"a {ix}\n"
+    assert isinstance(results[5].error, FileNotFoundError)
+
+
+def test_load_many_invalid_executor() -> None:
+    with pytest.raises(ValueError, match="Invalid executor: fiber"):
+        list(WsvDocument.load_many([], executor="fiber"))  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("suffix", [".bwsv", ".bwsv.gz"])
+def test_binary(tmp_path: Path, suffix: str) -> None:
+    doc = WsvDocument.parse('a "b c" #x\n- ""\n')
+    expected = WsvDocument([WsvLine(["a", "b c"]), WsvLine([None, ""])])
+    assert WsvDocument.from_binary(doc.to_binary()) == expected
+
+    path = tmp_path / f"table{suffix}"
+    doc.save_binary(path)
+    assert WsvDocument.load_binary(path) == expected
@@ -0,0 +1,41 @@
+"""Tests for the whitespacesv.fingerprint module."""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+from whitespacesv.document import WsvDocument
+from whitespacesv.fingerprint import fingerprint_file, fingerprint_lines
+from whitespacesv.line import WsvLine
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+TEXT = '#header\na  "b c"\n\n- d #x\n'
+
+
+def test_logical(tmp_path: Path) -> None:
+    document = WsvDocument.parse(TEXT)
+    fingerprint = document.fingerprint()
+    assert fingerprint == fingerprint_lines([WsvLine(["a", "b c"]), WsvLine([None, "d"])])
+    assert fingerprint == WsvDocument.parse('a\t"b c" #y\n\u3000-\td\n').fingerprint()
+    assert len(fingerprint) == 128
+
+    path = tmp_path / "table.txt.bz2"
+    document.save(path)
+    assert fingerprint_file(path) == fingerprint
+    assert fingerprint_file(io.StringIO(TEXT)) == fingerprint
+
+    # the values, their order, nulls and line breaks count
+    for text in ['a "b c"\n"-" d\n', 'a "b c" -\nd\n', 'a "b c"\n- d\n-\n', '"b c" a\n- d\n']:
+        assert WsvDocument.parse(text).fingerprint() != fingerprint, text
+
+
+def test_exact() -> None:
+    document = WsvDocument.parse(TEXT)
+    fingerprint = document.fingerprint(logical=False)
+    assert fingerprint != document.fingerprint()
+    assert fingerprint_file(io.StringIO(TEXT), logical=False) == fingerprint
+    assert WsvDocument.parse(TEXT.replace("  ", " ")).fingerprint(logical=False) != fingerprint
+    assert WsvDocument.parse(TEXT.replace("#x", "")).fingerprint(logical=False) != fingerprint
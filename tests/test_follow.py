@@ -0,0 +1,116 @@
+"""Tests for the whitespacesv.follow module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from whitespacesv.follow import FollowCheckpoint, WsvFollower
+from whitespacesv.line import WsvLine
+from whitespacesv.utils import WsvParserError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+def _append(path: Path, content: str) -> None:
+    with path.open("a", encoding="utf-8", newline="\n") as file:
+        file.write(content)
+
+
+def test_poll(tmp_path: Path) -> None:
+    path = tmp_path / "log.txt"
+    path.write_bytes(b"\xef\xbb\xbfa b\nc")
+
+    follower = WsvFollower(path)
+    assert list(follower.poll()) == [WsvLine(["a", "b"], [None, " "])]
+    assert follower.offset == 7
+    assert list(follower.poll()) == []
+
+    _append(path, ' "d e"\nf\n')
+    assert list(follower.poll()) == [WsvLine(["c", "d e"], [None, " "]), WsvLine(["f"], [None])]
+    assert follower.offset == path.stat().st_size
+
+
+def test_resume(tmp_path: Path) -> None:
+    path = tmp_path / "log.txt"
+    path.write_text("a\nb\n", encoding="utf-8")
+
+    follower = WsvFollower(path)
+    lines = follower.poll()
+    assert next(lines) == WsvLine(["a"], [None])
+    checkpoint = follower.offset
+    assert checkpoint == 2
+
+    resumed = WsvFollower(path, offset=checkpoint)
+    assert list(resumed.poll()) == [WsvLine(["b"], [None])]
+
+
+def test_resume_checkpoint(tmp_path: Path) -> None:
+    path = tmp_path / "log.txt"
+    path.write_text("a\nb\n", encoding="utf-8")
+
+    follower = WsvFollower(path)
+    assert len(list(follower.poll())) == 2
+    checkpoint = follower.checkpoint
+    assert checkpoint == FollowCheckpoint(4, 2, path.stat().st_ino)
+
+    _append(path, 'c\n"d\n')
+    resumed = WsvFollower(path, checkpoint)
+    with pytest.raises(WsvParserError, match=r"String not closed \(4, 3\)"):
+        list(resumed.poll())
+    assert resumed.checkpoint == FollowCheckpoint(6, 3, checkpoint.inode)
+
+
+def test_replaced(tmp_path: Path) -> None:
+    path = tmp_path / "log.txt"
+    path.write_text("a\n", encoding="utf-8")
+    follower = WsvFollower(path)
+    assert len(list(follower.poll())) == 1
+
+    # the replacement is larger than the offset
+    other = tmp_path / "other.txt"
+    other.write_text("b\nc\n", encoding="utf-8")
+    other.replace(path)
+    assert list(follower.poll()) == [WsvLine(["b"], [None]), WsvLine(["c"], [None])]
+
+    other.write_text("d\ne\n", encoding="utf-8")
+    other.replace(path)
+    resumed = WsvFollower(path, FollowCheckpoint(4, 2, follower.checkpoint.inode))
+    assert len(list(resumed.poll())) == 2
+
+
+def test_truncated(tmp_path: Path) -> None:
+    path = tmp_path / "log.txt"
+    path.write_text("a b c\n", encoding="utf-8")
+    follower = WsvFollower(path)
+    assert len(list(follower.poll())) == 1
+
+    path.write_text("d\n", encoding="utf-8")
+    assert list(follower.poll()) == [WsvLine(["d"], [None])]
+
+
+def test_parser_error(tmp_path: Path) -> None:
+    path = tmp_path / "log.txt"
+    path.write_text('a\n"b\n', encoding="utf-8")
+    follower = WsvFollower(path)
+    with pytest.raises(WsvParserError, match=r"String not closed \(2, 3\)"):
+        list(follower.poll())
+    assert follower.offset == 2
+
+
+def test_follow(tmp_path: Path) -> None:
+    path = tmp_path / "log.txt"
+    path.write_text("a\n", encoding="utf-8")
+    follower = WsvFollower(path, poll_interval=0)
+
+    polls = iter([False, True])
+
+    def stop() -> bool:
+        stopped = next(polls)
+        if not stopped:
+            _append(path, "b\n")
+        return stopped
+
+    assert list(follower.follow(stop)) == [WsvLine(["a"], [None]), WsvLine(["b"], [None])]
@@ -0,0 +1,163 @@
+"""Tests for the whitespacesv.index module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+
+from whitespacesv import index as index_module
+from whitespacesv.index import WsvIndexedFile
+from whitespacesv.line import WsvLine
+from whitespacesv.parser import parse_line
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+TEXT = '\ufeffid name\n#comment\n1 a\n"2 x" "b c"\n- d\n3\n1 e #x\n'
+
+
+@pytest.fixture
+def wsv_file(tmp_path: Path) -> Path:
+    path = tmp_path / "table.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    return path
+
+
+def _append(path: Path, content: str) -> None:
+    with path.open("a", encoding="utf-8", newline="\n") as file:
+        file.write(content)
+
+
+def test_get(wsv_file: Path) -> None:
+    with WsvIndexedFile(wsv_file, key="id", header=True) as indexed:
+        assert len(indexed) == 3
+        assert "2 x" in indexed
+        assert indexed.get("1") == WsvLine(["1", "e"], [None, " ", " "], "x")
+        assert indexed.get("2 x") == WsvLine(["2 x", "b c"], [None, " "])
+        assert indexed.get("3") == WsvLine(["3"], [None])
+        assert indexed.get("4") is None
+        assert indexed.index_path == wsv_file.with_name("table.txt.wsvindex")
+        assert indexed.header == ["id", "name"]
+
+        assert indexed.get_all("1") == [
+            WsvLine(["1", "a"], [None, " "]),
+            WsvLine(["1", "e"], [None, " ", " "], "x"),
+        ]
+        assert indexed.get_all("3") == [WsvLine(["3"], [None])]
+        assert indexed.get_all("4") == []
+
+
+def test_column_index(wsv_file: Path, tmp_path: Path) -> None:
+    indexed = WsvIndexedFile(wsv_file, key=1, index_path=tmp_path / "other.idx")
+    assert indexed.header is None
+    assert sorted(indexed._offsets) == ["a", "b c", "d", "e", "name"]  # noqa: SLF001
+    assert indexed.get("name") == WsvLine(["id", "name"], [None, " "])
+    indexed.close()
+    indexed.close()
+
+
+def test_invalid_key(wsv_file: Path) -> None:
+    with pytest.raises(ValueError, match="A key column name requires a header"):
+        WsvIndexedFile(wsv_file, key="id")
+    with pytest.raises(ValueError, match="Key column not in header: other"):
+        WsvIndexedFile(wsv_file, key="other", header=True)
+
+
+def test_incremental(wsv_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    WsvIndexedFile(wsv_file, header=True)
+    _append(wsv_file, "4 f\n5")
+
+    parsed: list[str] = []
+
+    def counting_parse_line(text: str, line_ix: int = 0) -> WsvLine:
+        parsed.append(text)
+        return parse_line(text, line_ix)
+
+    monkeypatch.setattr(index_module, "parse_line", counting_parse_line)
+    # the stored index is loaded and only the appended line is indexed
+    indexed = WsvIndexedFile(wsv_file, header=True)
+    assert "4" in indexed
+    assert "5" not in indexed
+    assert parsed == []
+
+    _append(wsv_file, ' "g h"\n')
+    indexed.refresh()
+    assert parsed == ['5 "g h"']
+    assert indexed.get("5") == WsvLine(["5", "g h"], [None, " "])
+    indexed.close()
+
+
+def test_rebuild(wsv_file: Path) -> None:
+    indexed = WsvIndexedFile(wsv_file, header=True)
+    wsv_file.write_text(TEXT.replace("3", "9"), encoding="utf-8")
+    indexed.refresh()
+    assert "3" not in indexed
+    assert "9" in indexed
+
+    wsv_file.write_text("id\n7\n", encoding="utf-8")
+    indexed.refresh()
+    assert list(indexed._offsets) == ["7"]  # noqa: SLF001
+
+    # an index with other options is not reused
+    assert "id" in WsvIndexedFile(wsv_file)
+
+
+def test_replaced(wsv_file: Path, tmp_path: Path) -> None:
+    indexed = WsvIndexedFile(wsv_file, header=True)
+    assert indexed.get("1") == WsvLine(["1", "e"], [None, " ", " "], "x")
+
+    # the replacement starts with the indexed content, only the inode differs
+    other = tmp_path / "other.txt"
+    other.write_text(TEXT + "2 f\n", encoding="utf-8")
+    other.replace(wsv_file)
+    indexed.refresh()
+    assert indexed.get("2") == WsvLine(["2", "f"], [None, " "])
+
+    other.write_text("id name\n2 g\n1 h\n", encoding="utf-8")
+    other.replace(wsv_file)
+    indexed.refresh()
+    assert indexed.get("1") == WsvLine(["1", "h"], [None, " "])
+    assert indexed.get("2") == WsvLine(["2", "g"], [None, " "])
+    assert "3" not in indexed
+    indexed.close()
+
+    # the stored index detects the replacement too
+    other.write_text("id name\n5 i\n", encoding="utf-8")
+    other.replace(wsv_file)
+    with WsvIndexedFile(wsv_file, header=True) as reopened:
+        assert list(reopened._offsets) == ["5"]  # noqa: SLF001
+
+
+def test_appended_records(wsv_file: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(index_module, "_MAX_RECORDS", 3)
+    indexed = WsvIndexedFile(wsv_file, header=True)
+    index_size = indexed.index_path.stat().st_size
+
+    _append(wsv_file, "4 f\n")
+    indexed.refresh()
+    # only the new offset is appended
+    assert index_size < indexed.index_path.stat().st_size < 2 * index_size
+    _append(wsv_file, "5 g\n")
+    indexed.refresh()
+    assert indexed._records == 3  # noqa: SLF001
+
+    # a truncated last record is ignored and the line is indexed again
+    with indexed.index_path.open("r+b") as file:
+        file.truncate(indexed.index_path.stat().st_size - 2)
+    reloaded = WsvIndexedFile(wsv_file, header=True)
+    assert reloaded.get("5") == WsvLine(["5", "g"], [None, " "])
+    assert reloaded._records == 3  # noqa: SLF001
+
+    # the index is rewritten compactly after too many records
+    _append(wsv_file, "6 h\n")
+    reloaded.refresh()
+    assert reloaded._records == 1  # noqa: SLF001
+    _append(wsv_file, "1 i\n")
+    reloaded.refresh()
+    with WsvIndexedFile(wsv_file, header=True) as compacted:
+        assert sorted(compacted._offsets) == ["1", "2 x", "3", "4", "5", "6"]  # noqa: SLF001
+        assert [line.values[1] for line in compacted.get_all("1")] == ["a", "e", "i"]  # noqa: PD011
+        assert compacted.header == ["id", "name"]
+    indexed.close()
+    reloaded.close()
@@ -0,0 +1,98 @@
+"""Tests for the whitespacesv.join module."""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+import pytest
+
+from whitespacesv.index import WsvIndexedFile
+from whitespacesv.join import join
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+LEFT = "#orders\nid user amount\n1 u1 10\n2 u2 20\n3 u3 30\n4 - 40\n5 u1\n"
+RIGHT = "user name\nu1 Ann\nu2 Bob\nu2 Ben\n- Nobody\nu4 Dan\n"
+
+
+@pytest.fixture
+def files(tmp_path: Path) -> tuple[Path, Path]:
+    left, right = tmp_path / "left.txt", tmp_path / "right.txt"
+    left.write_text(LEFT, encoding="utf-8")
+    right.write_text(RIGHT, encoding="utf-8")
+    return left, right
+
+
+def test_inner(files: tuple[Path, Path]) -> None:
+    left, right = files
+    output = io.StringIO()
+    assert join(left, right, output, "user") == 4
+    assert output.getvalue() == (
+        "id user amount name\n1 u1 10 Ann\n2 u2 20 Bob\n2 u2 20 Ben\n5 u1 - Ann\n"
+    )
+
+    # the smaller right file is streamed in file order
+    (left.parent / "big.txt").write_text(RIGHT + "u5 Eve\n" * 100, encoding="utf-8")
+    output = io.StringIO()
+    assert join(io.StringIO(LEFT), io.StringIO(RIGHT), output, ["user"]) == 4
+    streamed = io.StringIO()
+    assert join(right, left.parent / "big.txt", streamed, "user") == 6
+    assert streamed.getvalue().splitlines()[1:] == [
+        "u1 Ann Ann",
+        "u2 Bob Bob",
+        "u2 Ben Bob",
+        "u2 Bob Ben",
+        "u2 Ben Ben",
+        "u4 Dan Dan",
+    ]
+
+    swapped = io.StringIO()
+    assert join(right, left, swapped, "user") == 4
+    assert swapped.getvalue() == (
+        "user name id amount\nu1 Ann 1 10\nu2 Bob 2 20\nu2 Ben 2 20\nu1 Ann 5 -\n"
+    )
+
+
+def test_left(files: tuple[Path, Path], tmp_path: Path) -> None:
+    left, right = files
+    dst = tmp_path / "joined.txt.gz"
+    assert join(left, right, dst, "user", how="left") == 6
+
+    output = io.StringIO()
+    join(dst, io.StringIO("id amount flag\n4 40 x\n"), output, ["id", "amount"], how="left")
+    assert output.getvalue().splitlines()[-3:] == ["3 u3 30 - -", "4 - 40 - x", "5 u1 - Ann -"]
+
+
+def test_index(files: tuple[Path, Path]) -> None:
+    left, right = files
+    hashed = io.StringIO()
+    join(left, right, hashed, "user", how="left")
+    with WsvIndexedFile(right, "user", header=True) as index:
+        output = io.StringIO()
+        # the right file is only read through the index
+        assert join(left, io.StringIO(), output, "user", how="left", index=index) == 6
+        assert output.getvalue() == hashed.getvalue()
+        assert output.getvalue().splitlines()[2:4] == ["2 u2 20 Bob", "2 u2 20 Ben"]
+
+    with (
+        WsvIndexedFile(right, 1, header=True) as index,
+        pytest.raises(ValueError, match="The index must be on the single join column"),
+    ):
+        join(left, right, io.StringIO(), "user", index=index)
+    with (
+        WsvIndexedFile(right, 0) as index,
+        pytest.raises(ValueError, match="The index must have a header"),
+    ):
+        join(left, right, io.StringIO(), "user", index=index)
+
+
+def test_invalid(files: tuple[Path, Path]) -> None:
+    left, right = files
+    with pytest.raises(ValueError, match="Invalid join: outer"):
+        join(left, right, io.StringIO(), "user", how="outer")  # type: ignore[arg-type]
+    with pytest.raises(ValueError, match="Join column not in header: name"):
+        join(left, right, io.StringIO(), "name")
+    with pytest.raises(ValueError, match="File has no header"):
+        join(io.StringIO("#empty\n"), right, io.StringIO(), "user")
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+from typing import Callable, Literal
+
 import pytest
 
 from whitespacesv.line import WsvLine
@@ -47,3 +51,118 @@ def test_eq() -> None:
 def test_repr() -> None:
     line = WsvLine(["a", "b", "c"], [" ", None], "comment")
     assert repr(line) == "Line(['a', 'b', 'c'], [' ', None], comment)"
+
+
+def test_source() -> None:
+    line = WsvLine(["a", None], [None, "  "], "c", source=('x\n"a"  - #c\n', 2, 11))
+    assert not line.dirty
+    assert line.source == '"a"  - #c'
+
+    assert WsvLine(["a"]).dirty
+    assert WsvLine(["a"]).source is None
+
+
+@pytest.mark.parametrize(
+    "mutate",
+    [
+        lambda line: line.values.append("b"),
+        lambda line: line.values.extend(["b"]),
+        lambda line: line.values.insert(0, "b"),
+        lambda line: line.values.pop(),
+        lambda line: line.values.remove("a"),
+        lambda line: line.values.clear(),
+        lambda line: line.values.sort(),
+        lambda line: line.values.reverse(),
+        lambda line: line.values.__setitem__(0, "b"),
+        lambda line: line.values.__setitem__(slice(0, 1), ["b", "c"]),
+        lambda line: line.values.__delitem__(0),
+        lambda line: line.values.__iadd__(["b"]),
+        lambda line: line.values.__imul__(2),
+        lambda line: line.whitespaces.append(" "),
+        lambda line: setattr(line, "values", ["b"]),
+        lambda line: setattr(line, "whitespaces", [" "]),
+        lambda line: setattr(line, "comment", "other"),
+    ],
+)
+def test_mutation_marks_dirty(mutate: Callable[[WsvLine], object]) -> None:
+    line = WsvLine(["a"], [None], None, source=("a", 0, 1))
+    mutate(line)
+    assert line.dirty
+    assert line.source is None
+
+
+def test_setters_validate() -> None:
+    line = WsvLine(["a"])
+    with pytest.raises(ValueError, match="Whitespace value contains non whitespace"):
+        line.whitespaces = ["x"]
+    with pytest.raises(ValueError, match="Line feed in comment is not allowed"):
+        line.comment = "a\nb"
+    assert line.whitespaces is None
+    assert line.comment is None
+
+
+def test_from_trusted() -> None:
+    line = WsvLine.from_trusted(["a", None], [" ", "  ", None], "c")
+    assert line == WsvLine(["a", None], [" ", "  ", None], "c")
+    # the parts are not validated
+    assert WsvLine.from_trusted(["a"], ["x"]).whitespaces == ["x"]
+
+    line.values.append("b")  # noqa: PD011
+    assert line.serialize() == " a  - b#c"
+
+
+def test_pickle() -> None:
+    text = 'x\n"a"  - #c\n'
+    line = WsvLine(["a", None], [None, "  ", " "], "c", source=(text, 2, 11))
+    restored = pickle.loads(pickle.dumps(line))
+    assert restored == line
+    assert restored.source == '"a"  - #c'
+    assert type(pickle.loads(pickle.dumps(line.values))) is list
+
+    restored.values.append("b")
+    assert restored.dirty
+    assert pickle.loads(pickle.dumps(restored)).dirty
+
+
+@pytest.mark.parametrize(
+    ("mode", "expected"), [("preserve", 'a\t"b c" -#x'), ("compact", 'a "b c" -')]
+)
+def test_serialize(mode: Literal["preserve", "compact"], expected: str) -> None:
+    line = WsvLine(["a", "b c", None], [None, "\t", " "], "x")
+    assert line.serialize(mode) == expected
+    assert line.serialize(mode) is line.serialize(mode)
+    assert line.serialized_values() == ["a", '"b c"', "-"]
+
+    with pytest.raises(ValueError, match="Pretty serialization requires the whole document"):
+        line.serialize("pretty")  # type: ignore[arg-type]
+
+
+def test_serialize_cache_invalidation() -> None:
+    line = WsvLine(['"a"'], [None, " "], None, source=('""""a"""" ', 0, 10))
+    assert line.serialize() == '""""a"""" '
+    assert line.serialize("compact") == '"""a"""'
+
+    line.values[0] = "b"
+    assert line.serialize() == "b "
+    assert line.serialize("compact") == "b"
+    assert line.serialized_values() == ["b"]
+
+    line.comment = "c"
+    assert line.serialize() == "b #c"
+    line.whitespaces = None
+    assert line.serialize() == "b#c"
+
+
+def test_tracking_overhead() -> None:
+    line = WsvLine.from_trusted(["a"], [None, " "], None, ("a ", 0, 2))
+    assert not hasattr(line, "__dict__")
+    assert line.memory_usage().caches == 0
+    line.serialize("compact", cache=False)
+    assert line.memory_usage().caches == 0
+    line.serialize("compact")
+    assert line.memory_usage().caches > 0
+
+    copied = copy.copy(line)
+    copied.whitespaces[0] = "\t"  # type: ignore[index]
+    assert copied.dirty
+    assert not line.dirty
@@ -0,0 +1,82 @@
+"""Tests for the whitespacesv.memory module."""
+
+from __future__ import annotations
+
+import struct
+import sys
+import tracemalloc
+
+import pytest
+
+from whitespacesv.document import WsvDocument
+from whitespacesv.line import WsvLine
+from whitespacesv.memory import MemoryUsage, estimate_memory, memory_usage
+
+TEXT = "".join(f'{ix} "x y" abc{ix % 10}  #comment\n\n' for ix in range(1000))
+
+
+def test_line_memory_usage() -> None:
+    line = WsvDocument.parse("a  b #c\n").lines[0]
+    usage = line.memory_usage()
+    assert usage.values > 0
+    assert usage.whitespaces > 0
+    assert usage.comments > 0
+    assert usage.sources > 0
+    assert usage.total == sum(usage)
+
+    shallow = line.memory_usage(deep=False)
+    assert shallow.values == shallow.whitespaces == shallow.comments == shallow.sources == 0
+    assert shallow.overhead == usage.overhead
+
+    line.serialize("compact")
+    assert line.memory_usage().caches > usage.caches
+
+    line.values.append("d")  # noqa: PD011
+    assert line.memory_usage().sources == 0
+
+
+def test_memory_usage_by() -> None:
+    doc = WsvDocument.parse(TEXT)
+    usage = doc.memory_usage()
+    lines = doc.memory_usage(by="line")
+    columns = doc.memory_usage(True, "column")
+    assert len(lines) == len(doc.lines)
+    assert len(columns) == 3
+    totals = [sum(parts) for parts in zip(*lines)]
+    assert totals[:5] == list(usage[:5])
+    assert usage.overhead - totals[5] == sys.getsizeof(doc.lines)
+    assert sum(column.values for column in columns) == usage.values
+    assert doc.memory_usage(deep=False, by="column")[0] == MemoryUsage(
+        0, 0, 0, 0, 0, 1000 * struct.calcsize("P")
+    )
+
+    with pytest.raises(ValueError, match="Invalid memory usage grouping: row"):
+        memory_usage(doc.lines, by="row")  # type: ignore[call-overload]
+
+
+def test_memory_usage_traced() -> None:
+    tracemalloc.start()
+    try:
+        doc = WsvDocument.parse(TEXT)
+        doc.serialize("compact")
+        traced = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    usage = doc.memory_usage()
+    # the text was allocated before tracing
+    assert usage.total - usage.sources == pytest.approx(traced, rel=0.2)
+
+
+def test_estimate_memory() -> None:
+    estimate = WsvDocument.parse(TEXT).estimate_memory()
+    assert estimate.columnar < estimate.interned < estimate.values_only < estimate.current
+
+    empty = estimate_memory([])
+    assert empty.current == empty.values_only == empty.interned == empty.columnar
+
+    lines = [WsvLine(["a", "b"]), WsvLine(["a", None])]
+    estimate = estimate_memory(lines)
+    # the lists of the lines are over-allocated
+    assert estimate.values_only == pytest.approx(estimate.current, rel=0.1)
+    assert estimate.interned < estimate.values_only
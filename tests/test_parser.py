@@ -2,11 +2,26 @@
 
 from __future__ import annotations
 
+import random
+
 import pytest
+from typing_extensions import override
 
+from whitespacesv.handler import WsvHandler
 from whitespacesv.line import WsvLine
-from whitespacesv.parser import _parse_line, _parse_value_wrapper, _try_parse_comment
-from whitespacesv.utils import WsvCharIterator
+from whitespacesv.parser import (
+    TokenKind,
+    _parse_line,
+    _parse_value_wrapper,
+    _try_parse_comment,
+    decode_string,
+    iter_tokens,
+    parse_events,
+    parse_line,
+    parse_lines,
+    parse_stream,
+)
+from whitespacesv.utils import WsvCharIterator, WsvParserError
 
 
 @pytest.mark.parametrize(
@@ -31,3 +46,111 @@ def test_parse_line() -> None:
     it = WsvCharIterator("")
     line = _parse_line(it)
     assert line == WsvLine([], [None], None)
+
+
+def test_parse_line_source() -> None:
+    text = 'a  "b" #c\n'
+    line = _parse_line(WsvCharIterator(text))
+    assert not line.dirty
+    assert line.source == 'a  "b" #c'
+
+
+def test_parse_line_public() -> None:
+    assert parse_line('a "b c" -#x') == WsvLine(["a", "b c", None], [None, " ", " "], "x")
+    # an empty comment is a comment
+    assert parse_line("a #").comment == ""
+    with pytest.raises(ValueError, match="Line feed in line is not allowed"):
+        parse_line("a\nb")
+    with pytest.raises(WsvParserError, match=r"String not closed \(4, 5\)") as exc_info:
+        parse_line('a "b', line_ix=3)
+    assert exc_info.value.message == "String not closed"
+
+
+def test_parse_stream() -> None:
+    lines = parse_stream(["a b\n", "#c\n", "d"])
+    assert next(lines) == WsvLine(["a", "b"], [None, " "])
+    assert list(lines) == [WsvLine([], [None, None], "c"), WsvLine(["d"], [None])]
+
+    with pytest.raises(WsvParserError, match=r"Invalid double quote in value \(2, 2\)") as exc_info:
+        list(parse_stream(["a\n", 'b"\n']))
+    # the index is relative to the joined lines like for a whole document
+    with pytest.raises(WsvParserError) as document_exc_info:
+        parse_lines('a\nb"\n')
+    assert exc_info.value.ix == document_exc_info.value.ix == 3
+
+
+class _LineBuilder(WsvHandler):
+    def __init__(self) -> None:
+        self.lines: list[tuple[list[str | None], str | None]] = []
+        self.values: list[str | None] = []
+        self.comment: str | None = None
+
+    @override
+    def on_value(self, value: str | None) -> None:
+        self.values.append(value)
+
+    @override
+    def on_comment(self, comment: str) -> None:
+        self.comment = comment
+
+    @override
+    def on_line_end(self) -> None:
+        self.lines.append((self.values, self.comment))
+        self.values, self.comment = [], None
+
+
+def test_iter_tokens() -> None:
+    text = 'a  "b ""c""" - #x\n\n"/""z"\t-x#'
+    assert [(kind.value, text[start:end]) for kind, start, end in iter_tokens(text)] == [
+        ("value", "a"),
+        ("whitespace", "  "),
+        ("string", '"b ""c"""'),
+        ("whitespace", " "),
+        ("null", "-"),
+        ("whitespace", " "),
+        ("comment", "#x"),
+        ("line_end", "\n"),
+        ("line_end", "\n"),
+        ("string", '"/""z"'),
+        ("whitespace", "\t"),
+        ("value", "-x"),
+        ("comment", "#"),
+        ("line_end", ""),
+    ]
+    assert list(iter_tokens("")) == []
+    assert [kind for kind, _, _ in iter_tokens("\n")] == [TokenKind.LINE_END]
+
+
+@pytest.mark.parametrize(
+    ("token", "expected"),
+    [
+        ('""', ""),
+        ('"a b"', "a b"),
+        ('"""/"""', '"/"'),
+        ('""""/""""', '"\n"'),
+        ('""/""/""', "\n\n"),
+        ('"x"""', 'x"'),
+    ],
+)
+def test_decode_string(token: str, expected: str) -> None:
+    assert decode_string(token) == expected
+
+
+def test_parse_events_parity() -> None:
+    rng = random.Random(0)  # noqa: S311
+    parts = ["a", "b", "-", " ", "\t", "\u3000", '"', '""', '"/"', "#", "\n", "x y"]
+    for _ in range(3000):
+        text = "".join(rng.choices(parts, k=rng.randrange(12)))
+        try:
+            expected = [(line.values, line.comment) for line in parse_lines(text)]  # noqa: PD011
+        except WsvParserError as exc:
+            expected_error = str(exc), exc.ix
+            with pytest.raises(WsvParserError) as info:
+                parse_events(text, _LineBuilder())
+            assert (str(info.value), info.value.ix) == expected_error
+            continue
+
+        builder = _LineBuilder()
+        parse_events(text, builder)
+        assert builder.lines == expected, text
+        assert "".join(text[start:end] for _, start, end in iter_tokens(text)) == text
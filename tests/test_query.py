@@ -0,0 +1,118 @@
+"""Tests for the whitespacesv.query module."""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+import pytest
+
+from whitespacesv.query import AggregateFunction, group_by, iter_rows, select
+from whitespacesv.txt import TxtDocument
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+TEXT = """#log
+host status bytes
+a 200 10
+b 500 -
+
+a 404 30 #x
+c 200
+b 200 5.5
+"""
+
+
+@pytest.fixture
+def wsv_file(tmp_path: Path) -> Path:
+    path = tmp_path / "log.txt.gz"
+    TxtDocument(TEXT).save(path)
+    return path
+
+
+def test_iter_rows(wsv_file: Path) -> None:
+    rows = list(iter_rows(wsv_file))
+    assert rows[0] == ["host", "status", "bytes"]
+    assert rows[4] == ["c", "200", None]
+    assert len(rows) == 6
+
+    # the line number is 1-based and counts lines without values
+    with pytest.raises(ValueError, match=r"Row has more values than the header \(4\)"):
+        list(iter_rows(io.StringIO("a b\n\nc d\ne f g\n")))
+    with pytest.raises(ValueError, match="Header must not contain null values"):
+        list(iter_rows(io.StringIO("a -\n")))
+
+
+def test_select(wsv_file: Path) -> None:
+    assert list(select(wsv_file, ["bytes", "host"])) == [
+        ["10", "a"],
+        [None, "b"],
+        ["30", "a"],
+        [None, "c"],
+        ["5.5", "b"],
+    ]
+    assert list(select(wsv_file, where=lambda row: row["status"] == "200")) == [
+        ["a", "200", "10"],
+        ["c", "200", None],
+        ["b", "200", "5.5"],
+    ]
+    with pytest.raises(ValueError, match="Column not in header: other"):
+        list(select(wsv_file, ["other"]))
+
+
+def test_group_by(wsv_file: Path) -> None:
+    aggregates: dict[str, tuple[AggregateFunction, str | None]] = {
+        "rows": ("count", None),
+        "hosts": ("count", "host"),
+        "values": ("count", "bytes"),
+        "total": ("sum", "bytes"),
+        "min": ("min", "bytes"),
+        "max": ("max", "bytes"),
+        "mean": ("mean", "bytes"),
+    }
+    assert group_by(wsv_file, ["status"], aggregates) == {
+        ("200",): {
+            "rows": 3,
+            "hosts": 3,
+            "values": 2,
+            "total": 15.5,
+            "min": 5.5,
+            "max": 10.0,
+            "mean": 7.75,
+        },
+        ("500",): {
+            "rows": 1,
+            "hosts": 1,
+            "values": 0,
+            "total": 0.0,
+            "min": None,
+            "max": None,
+            "mean": None,
+        },
+        ("404",): {
+            "rows": 1,
+            "hosts": 1,
+            "values": 1,
+            "total": 30.0,
+            "min": 30.0,
+            "max": 30.0,
+            "mean": 30.0,
+        },
+    }
+
+    assert group_by(
+        wsv_file, [], {"total": ("sum", "bytes")}, where=lambda row: row["host"] != "a"
+    ) == {(): {"total": 5.5}}
+    assert group_by(wsv_file, ["host", "status"], {"rows": ("count", None)})[("a", "404")] == {
+        "rows": 1
+    }
+
+
+def test_group_by_invalid(wsv_file: Path) -> None:
+    with pytest.raises(ValueError, match="Invalid aggregate function: median"):
+        group_by(wsv_file, [], {"median": ("median", "bytes")})  # type: ignore[dict-item]
+    with pytest.raises(ValueError, match="Column not in header: other"):
+        group_by(wsv_file, ["other"], {})
+    with pytest.raises(ValueError, match="could not convert string to float"):
+        group_by(wsv_file, [], {"max": ("max", "host")})
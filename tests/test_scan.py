@@ -0,0 +1,84 @@
+"""Tests for the whitespacesv.scan module."""
+
+from __future__ import annotations
+
+import io
+from collections import Counter
+from typing import TYPE_CHECKING
+
+import pytest
+
+from whitespacesv.line import WsvLine
+from whitespacesv.parser import parse_lines
+from whitespacesv.scan import count_rows, head, sample
+from whitespacesv.txt import TxtDocument
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+TEXT = "\ufeff#header\na b\n  \n\u3000#indented comment\n\u3000c\n\nd #x\n"
+
+
+@pytest.fixture
+def wsv_file(tmp_path: Path) -> Path:
+    path = tmp_path / "table.txt"
+    TxtDocument(TEXT).save(path)
+    return path
+
+
+@pytest.mark.parametrize(
+    ("skip_empty", "skip_comment_only", "expected"),
+    [(True, True, 3), (False, True, 5), (True, False, 5), (False, False, 7)],
+)
+def test_count_rows(
+    wsv_file: Path, skip_empty: bool, skip_comment_only: bool, expected: int
+) -> None:
+    assert count_rows(wsv_file, skip_empty, skip_comment_only) == expected
+
+    lines = parse_lines(TEXT.removeprefix("\ufeff"))
+    assert expected == sum(
+        bool(line.values)  # noqa: PD011
+        or (not skip_empty and line.comment is None)
+        or (not skip_comment_only and line.comment is not None)
+        for line in lines
+    )
+
+
+def test_count_rows_file() -> None:
+    assert count_rows(io.BytesIO(b"a\nb")) == 2
+    assert count_rows(io.BytesIO(b"a\nb"), False, False) == 2
+    assert count_rows(io.BytesIO(b""), False, False) == 0
+
+
+def test_count_rows_compressed(tmp_path: Path) -> None:
+    path = tmp_path / "table.txt.bz2"
+    TxtDocument(TEXT).save(path)
+    assert count_rows(path) == 3
+    assert count_rows(path, False, False) == 7
+
+
+def test_head(wsv_file: Path) -> None:
+    assert head(wsv_file, 2) == [
+        WsvLine([], [None, None], "header"),
+        WsvLine(["a", "b"], [None, " "]),
+    ]
+    assert len(head(wsv_file, 100)) == 7
+
+
+def test_sample(wsv_file: Path) -> None:
+    rows = sample(wsv_file, 5, seed=0)
+    assert [line.values for line in rows] == [["a", "b"], ["c"], ["d"]]  # noqa: PD011
+
+    rows = sample(wsv_file, 2, seed=1, skip_comment_only=False)
+    assert len(rows) == 2
+    assert rows == sorted(rows, key=lambda line: TEXT.index(line.source or ""))
+
+
+def test_sample_uniform() -> None:
+    data = b"".join(f"{ix}\n".encode() for ix in range(10))
+    counts: Counter[str | None] = Counter()
+    for seed in range(2000):
+        for line in sample(io.BytesIO(data), 2, seed=seed):
+            counts[line.values[0]] += 1  # noqa: PD011
+    assert len(counts) == 10
+    assert all(300 < count < 500 for count in counts.values())
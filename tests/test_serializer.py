@@ -6,6 +6,9 @@ import pytest
 
 from whitespacesv.line import WsvLine
 from whitespacesv.serializer import (
+    column_widths,
+    merge_column_widths,
+    prettify_values,
     serialize_line,
     serialize_value,
     serialize_values_with_whitespace,
@@ -55,3 +58,18 @@ def test_serialize_line(
     else:
         assert serialize_line(values, whitespaces, comment) == with_whitespace + hashed_comment
         assert serialize_values_with_whitespace(values, line.whitespaces) == with_whitespace
+
+
+def test_prettify_values_jagged() -> None:
+    values = [["a", "bb"], [], ["ccc"]]
+    assert prettify_values(values, [None, "x", None]) == ["a  \tbb", "#x", "ccc"]
+
+
+def test_column_widths() -> None:
+    values = [["a", "bb"], [], ["ccc"]]
+    assert column_widths(values) == [3, 2]
+    assert prettify_values(values[:1], [None], [3, 2]) == ["a  \tbb"]
+
+    widths = [1, 4]
+    merge_column_widths(widths, [3, 2, 5])
+    assert widths == [3, 4, 5]
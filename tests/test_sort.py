@@ -0,0 +1,79 @@
+"""Tests for the whitespacesv.sort module."""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+import pytest
+
+from whitespacesv.sort import sort_file
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+TEXT = "#file\nid   n\n#c\nb  10\nc 9 #x\n-  2\n\na\n#end\n"
+
+
+@pytest.fixture
+def wsv_file(tmp_path: Path) -> Path:
+    path = tmp_path / "table.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("memory_limit", [1, 1000, 1 << 20])
+@pytest.mark.parametrize(
+    ("key", "numeric", "reverse", "expected"),
+    [
+        (0, False, False, "-  2\n\na\n#c\nb  10\nc 9 #x\n"),
+        ("n", False, True, "c 9 #x\n-  2\n#c\nb  10\n\na\n"),
+        ("n", True, False, "\na\n-  2\nc 9 #x\n#c\nb  10\n"),
+        ([1, "id"], False, False, "\na\n#c\nb  10\n-  2\nc 9 #x\n"),
+    ],
+)
+def test_sort_file(  # noqa: PLR0913
+    wsv_file: Path,
+    tmp_path: Path,
+    memory_limit: int,
+    key: int | str | list[int | str],
+    numeric: bool,
+    reverse: bool,
+    expected: str,
+) -> None:
+    dst = tmp_path / "sorted.txt.gz"
+    count = sort_file(
+        wsv_file,
+        dst,
+        key,
+        numeric=numeric,
+        reverse=reverse,
+        header=True,
+        memory_limit=memory_limit,
+        temp_dir=tmp_path,
+    )
+    assert count == 4
+
+    output = io.StringIO()
+    sort_file(dst, output, key, numeric, reverse, header=True)
+    assert output.getvalue() == "#file\nid   n\n" + expected + "#end\n"
+    # the temporary runs are removed
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["sorted.txt.gz", "table.txt"]
+
+
+def test_stable(tmp_path: Path) -> None:
+    src = io.StringIO("".join(f"{ix % 3} {ix}\n" for ix in range(30)))
+    output = io.StringIO()
+    assert sort_file(src, output, memory_limit=2000, mode="compact", temp_dir=tmp_path) == 30
+    rows = [line.split() for line in output.getvalue().splitlines()]
+    assert rows == sorted(rows, key=lambda row: row[0])
+    assert [int(row[1]) for row in rows] == [*range(0, 30, 3), *range(1, 30, 3), *range(2, 30, 3)]
+
+
+def test_invalid_key(wsv_file: Path) -> None:
+    with pytest.raises(ValueError, match="A key column name requires a header"):
+        sort_file(wsv_file, io.StringIO(), "n")
+    with pytest.raises(ValueError, match="Key column not in header: other"):
+        sort_file(wsv_file, io.StringIO(), "other", header=True)
+    with pytest.raises(ValueError, match="could not convert string to float"):
+        sort_file(wsv_file, io.StringIO(), numeric=True)
@@ -0,0 +1,88 @@
+"""Tests for the whitespacesv.stream module."""
+
+from __future__ import annotations
+
+import io
+from typing import TYPE_CHECKING
+
+import pytest
+
+from whitespacesv.document import WsvDocument
+from whitespacesv.line import WsvLine
+from whitespacesv.stream import WsvWriter, iter_lines
+from whitespacesv.txt import TxtDocument
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.mark.parametrize("suffix", [".txt", ".gz"])
+def test_iter_lines(tmp_path: Path, suffix: str) -> None:
+    path = tmp_path / f"table{suffix}"
+    TxtDocument('\ufeffa "b c"\n\n- #x\n').save(path)
+
+    lines = iter_lines(path)
+    assert next(lines) == WsvLine(["a", "b c"], [None, " "])
+    assert list(lines) == [WsvLine([], [None]), WsvLine([None], [None, " "], "x")]
+
+
+def test_iter_lines_bom_character(tmp_path: Path) -> None:
+    path = tmp_path / "table.txt"
+    # a zero width no-break space after the BOM is part of the first value
+    path.write_bytes("\ufeff\ufeffa b\n".encode())
+    assert list(iter_lines(path)) == [WsvLine(["\ufeffa", "b"], [None, " "])]
+
+
+@pytest.mark.parametrize("encoding", ["utf-16-le", "utf-32-be"])
+def test_iter_lines_encodings(tmp_path: Path, encoding: str) -> None:
+    path = tmp_path / "table.txt"
+    path.write_bytes('\ufeffa "b c"\n\u00e4 #x\n'.encode(encoding))
+    assert list(iter_lines(path)) == [
+        WsvLine(["a", "b c"], [None, " "]),
+        WsvLine(["\u00e4"], [None, " "], "x"),
+    ]
+
+
+def test_writer_append_encoding(tmp_path: Path) -> None:
+    path = tmp_path / "table.txt"
+    path.write_bytes("\ufeffa b\n".encode("utf-16-be"))
+    with WsvWriter(path, append=True) as writer:
+        writer.write_values(["c", None])
+    WsvDocument([WsvLine(["d e"])]).save(path, append=True)
+    assert path.read_bytes() == '\ufeffa b\nc -\n"d e"\n'.encode("utf-16-be")
+
+
+@pytest.mark.parametrize("content", ["", "\ufeff", "a\nb"])
+def test_iter_lines_no_new_line(tmp_path: Path, content: str) -> None:
+    path = tmp_path / "table.txt"
+    TxtDocument(content).save(path)
+    with pytest.raises(ValueError, match="Empty file or no new line at the end"):
+        list(iter_lines(path))
+
+
+def test_iter_lines_file() -> None:
+    lines = iter_lines(io.StringIO("a\nb\n"))
+    assert list(lines) == [WsvLine(["a"], [None]), WsvLine(["b"], [None])]
+
+
+@pytest.mark.parametrize("suffix", [".txt", ".xz"])
+def test_writer(tmp_path: Path, suffix: str) -> None:
+    path = tmp_path / f"table{suffix}"
+    doc = WsvDocument.parse('"a"  b #x\n')
+    with WsvWriter(path) as writer:
+        writer.write_lines(doc.lines)
+        writer.write_values([None, "c d"])
+    with WsvWriter(path, "compact", append=True) as writer:
+        writer.write_line(doc.lines[0])
+    assert TxtDocument.load(path).text == '"a"  b #x\n- "c d"\na b\n'
+
+
+def test_writer_file() -> None:
+    file = io.StringIO()
+    with WsvWriter(file) as writer:
+        writer.write_values(["a"])
+    assert not file.closed
+    assert file.getvalue() == "a\n"
+
+    with pytest.raises(ValueError, match="Pretty serialization requires the whole document"):
+        WsvWriter(file, "pretty")  # type: ignore[arg-type]
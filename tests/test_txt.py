@@ -2,11 +2,27 @@
 
 from __future__ import annotations
 
+import codecs
+import gzip
 import tempfile
+from typing import TYPE_CHECKING
 
 import pytest
 
-from whitespacesv.txt import TxtCharIterator, TxtDocument, chars_to_ords, ords_to_chars
+from whitespacesv.txt import (
+    TxtCharIterator,
+    TxtDocument,
+    chars_to_ords,
+    detect_encoding,
+    detect_file_encoding,
+    ends_with_new_line,
+    infer_compression,
+    open_binary,
+    ords_to_chars,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.mark.parametrize(("chars", "expected_result"), [("abc", [97, 98, 99]), ("", [])])
@@ -59,3 +75,94 @@ def test_get_line_info(text: str, steps: int, expected: tuple[int, int]) -> None
     for _ in range(steps):
         it.forward()
     assert it.get_line_info() == expected
+
+
+def test_append_and_ends_with_new_line(tmp_path: Path) -> None:
+    path = tmp_path / "file.txt"
+    path.write_bytes(b"")
+    assert not ends_with_new_line(path)
+
+    TxtDocument("a").save(path, append=True)
+    assert not ends_with_new_line(path)
+    TxtDocument("b\n").save(path, append=True)
+    assert ends_with_new_line(path)
+    assert path.read_text(encoding="utf-8") == "ab\n"
+
+
+@pytest.mark.parametrize(
+    ("name", "compression"),
+    [("a.gz", "gzip"), ("a.bz2", "bz2"), ("a.XZ", "xz"), ("a.lzma", "xz"), ("a.txt", None)],
+)
+def test_infer_compression(name: str, compression: str | None) -> None:
+    assert infer_compression(name) == compression
+
+
+@pytest.mark.parametrize("suffix", [".gz", ".bz2", ".xz", ".txt"])
+def test_compressed_save_load(tmp_path: Path, suffix: str) -> None:
+    path = tmp_path / f"file{suffix}"
+    TxtDocument("a\nb").save(path)
+    assert not ends_with_new_line(path)
+    TxtDocument("\n").save(path, append=True)
+    assert ends_with_new_line(path)
+    assert TxtDocument.load(path).text == "a\nb\n"
+
+    with open_binary(path) as file:
+        assert file.read() == b"a\nb\n"
+    assert (path.read_bytes() == b"a\nb\n") == (suffix == ".txt")
+
+
+def test_explicit_compression(tmp_path: Path) -> None:
+    path = tmp_path / "file.data"
+    TxtDocument("abc").save(path, compression="gzip")
+    assert gzip.decompress(path.read_bytes()) == b"abc"
+    assert TxtDocument.load(path, compression="gzip").text == "abc"
+
+    with pytest.raises(ValueError, match="Invalid compression: zip"):
+        open_binary(path, compression="zip")  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    ("prefix", "expected"),
+    [
+        (codecs.BOM_UTF32_LE + b"a", ("utf-32-le", 4)),
+        (codecs.BOM_UTF32_BE, ("utf-32-be", 4)),
+        (codecs.BOM_UTF8 + b"a", ("utf-8", 3)),
+        (codecs.BOM_UTF16_LE + b"a\x00", ("utf-16-le", 2)),
+        (codecs.BOM_UTF16_BE, ("utf-16-be", 2)),
+        (b"abcd", ("utf-8", 0)),
+        (b"", ("utf-8", 0)),
+    ],
+)
+def test_detect_encoding(prefix: bytes, expected: tuple[str, int]) -> None:
+    assert detect_encoding(prefix) == expected
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-16-le", "utf-16-be", "utf-32-le", "utf-32-be"])
+@pytest.mark.parametrize("suffix", ["", ".gz"])
+def test_load_encodings(tmp_path: Path, encoding: str, suffix: str) -> None:
+    text = "a \u00e4\n\U0001f600 -\n"
+    path = tmp_path / f"doc.txt{suffix}"
+    content = ("\ufeff" + text).encode(encoding)
+    path.write_bytes(gzip.compress(content) if suffix else content)
+    assert TxtDocument.load(path).text == text
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "utf-16-le", "utf-16-be", "utf-32-le", "utf-32-be"])
+@pytest.mark.parametrize("suffix", ["", ".gz"])
+def test_append_encodings(tmp_path: Path, encoding: str, suffix: str) -> None:
+    path = tmp_path / f"doc.txt{suffix}"
+    content = "\ufeffa b\n".encode(encoding)
+    path.write_bytes(gzip.compress(content) if suffix else content)
+    assert detect_file_encoding(path) == encoding
+    assert ends_with_new_line(path)
+
+    TxtDocument("c \u00e4\n").save(path, append=True)
+    assert TxtDocument.load(path).text == "a b\nc \u00e4\n"
+    assert ends_with_new_line(path)
+
+    TxtDocument("d").save(path, append=True)
+    assert not ends_with_new_line(path)
+
+
+def test_detect_missing_file_encoding(tmp_path: Path) -> None:
+    assert detect_file_encoding(tmp_path / "missing.txt") == "utf-8"
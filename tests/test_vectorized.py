@@ -0,0 +1,46 @@
+"""Tests for the whitespacesv.vectorized module."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from whitespacesv.parser import parse_lines
+from whitespacesv.utils import WsvParserError
+from whitespacesv.vectorized import parse_lines_vectorized
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "\n",
+        "\n\n",
+        "a",
+        "a\n",
+        " a  b \n-\t1.5\n",
+        "\u3000x\u3000y\nä -x\n",
+        'a "b c" #x\n1 2\n   \n#only\n',
+    ],
+)
+def test_parse_lines_vectorized(text: str) -> None:
+    lines = parse_lines_vectorized(text)
+    assert lines == parse_lines(text)
+    assert [line.serialize() for line in lines] == text.split("\n")[: len(lines)]
+
+
+def test_parity() -> None:
+    rng = random.Random(0)  # noqa: S311
+    parts = ["a", "1.5", "-", " ", "  ", "\t", "\u3000", "ä", '"', '"x y"', "#", "\n"]
+    for _ in range(3000):
+        text = "".join(rng.choices(parts, k=rng.randrange(15)))
+        try:
+            expected = parse_lines(text)
+        except WsvParserError as exc:
+            expected_error = str(exc), exc.ix
+            with pytest.raises(WsvParserError) as info:
+                parse_lines_vectorized(text)
+            assert (str(info.value), info.value.ix) == expected_error
+            continue
+        assert parse_lines_vectorized(text) == expected, text
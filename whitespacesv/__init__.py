@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+from whitespacesv import parser as _parser
 from whitespacesv.document import WsvDocument
 from whitespacesv.utils import reinfer_types
 
 __version__ = "0.1.0"
-__all__ = ["WsvDocument", "reinfer_types"]
+__all__ = ["COMPILED", "WsvDocument", "reinfer_types"]
+
+# True if the parser was compiled with mypyc, for more information see setup.py
+COMPILED = not str(_parser.__file__).endswith(".py")
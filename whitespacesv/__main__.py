@@ -0,0 +1,10 @@
+"""Runs the command-line interface with `python -m whitespacesv`."""
+
+from __future__ import annotations
+
+import sys
+
+from whitespacesv.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
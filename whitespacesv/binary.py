@@ -0,0 +1,110 @@
+"""The binary module contains the encoder and decoder of the binary WSV format.
+
+The binary format is private to this package, a compact interchange form
+which only stores the values. It is not the upstream BinaryWSV format,
+whose `BW1` preamble and varint layout it deliberately does not use,
+so other tools won't mistake the data for BinaryWSV.
+
+The data starts with the `WSVL1` preamble followed by the lines.
+Each value is prefixed with an unsigned LEB128 varint:
+0 marks the end of a line, 1 marks a null value and
+n >= 2 marks a utf-8 encoded string of n - 2 bytes.
+Decoding therefore needs no quote, escape or whitespace handling.
+"""
+
+# ruff: noqa: PLR2004
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from whitespacesv.line import WsvLine
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+PREAMBLE = b"WSVL1"
+
+_LINE_BREAK = b"\x00"
+_NULL = b"\x01"
+_SMALL_VARINTS = [bytes((value,)) for value in range(0x80)]
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encodes the unsigned integer as LEB128 varint."""
+    if value < 0x80:
+        return _SMALL_VARINTS[value]
+
+    result = bytearray()
+    while value >= 0x80:
+        result.append((value & 0x7F) | 0x80)
+        value >>= 7
+    result.append(value)
+    return bytes(result)
+
+
+def _read_varint(data: bytes, ix: int) -> tuple[int, int]:
+    """Reads the LEB128 varint at the index and returns it with the next index."""
+    result = 0
+    shift = 0
+    while True:
+        if ix >= len(data):
+            raise ValueError("Truncated binary WSV varint")
+        byte = data[ix]
+        ix += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, ix
+        shift += 7
+
+
+def encode_values(values: Iterable[str | None]) -> bytes:
+    """Encodes the values of a line including the line break marker."""
+    parts: list[bytes] = []
+    for value in values:
+        if value is None:
+            parts.append(_NULL)
+            continue
+        encoded = value.encode("utf-8")
+        parts.append(_encode_varint(len(encoded) + 2))
+        parts.append(encoded)
+    parts.append(_LINE_BREAK)
+    return b"".join(parts)
+
+
+def encode_lines(lines: Iterable[WsvLine]) -> bytes:
+    """Encodes the values of the lines to binary WSV, whitespaces and comments are dropped."""
+    return PREAMBLE + b"".join(encode_values(line.values) for line in lines)  # noqa: PD011
+
+
+def decode_lines(data: bytes) -> list[WsvLine]:
+    """Decodes binary WSV to lines without whitespaces and comments."""
+    if not data.startswith(PREAMBLE):
+        raise ValueError("Invalid binary WSV preamble")
+
+    lines: list[WsvLine] = []
+    values: list[str | None] = []
+    size = len(data)
+    ix = len(PREAMBLE)
+    while ix < size:
+        marker = data[ix]
+        if marker < 0x80:
+            ix += 1
+        else:
+            marker, ix = _read_varint(data, ix)
+
+        if marker == 0:
+            lines.append(WsvLine.from_trusted(values))
+            values = []
+        elif marker == 1:
+            values.append(None)
+        else:
+            end = ix + marker - 2
+            if end > size:
+                raise ValueError("Truncated binary WSV value")
+            values.append(data[ix:end].decode("utf-8"))
+            ix = end
+
+    if values:
+        raise ValueError("Truncated binary WSV line")
+
+    return lines
@@ -0,0 +1,176 @@
+"""The cache module contains an on-disk cache of parsed WSV files."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from typing_extensions import TypeAlias
+
+from whitespacesv.line import WsvLine
+from whitespacesv.stream import iter_lines
+
+if TYPE_CHECKING:
+    from whitespacesv.txt import CompressionOption, StrPath
+
+_SUFFIX = ".wsvcache"
+_VERSION = 1
+_CHUNK_SIZE = 1024 * 1024
+
+_Signature: TypeAlias = "tuple[int, int, str | None]"
+_Row: TypeAlias = "tuple[list[str | None], list[str | None] | None, str | None, str | None]"
+
+
+class DocumentCache:
+    """An opt-in on-disk cache of parsed WSV files.
+
+    A binary snapshot of the parsed lines is stored next to the source or in a cache
+    directory. It is keyed by the size and modification time of the source and
+    optionally by a hash of its content. The snapshot is rebuilt when the source changes.
+    In a cache directory, the least recently used snapshots are evicted
+    when the total size exceeds the budget.
+    """
+
+    def __init__(
+        self,
+        directory: StrPath | None = None,
+        max_size: int | None = 256 * 1024 * 1024,
+        use_hash: bool = False,
+    ) -> None:
+        """Initializes the cache.
+
+        Args:
+            directory:
+                The directory to store the snapshots in.
+                If not provided, the snapshots are stored next to the sources
+                and are never evicted.
+            max_size:
+                The size budget of the cache directory in bytes, None for no limit
+            use_hash:
+                Whether to also key the snapshots by a hash of the source content.
+                This detects changes which keep the size and modification time,
+                but reads the whole source on each load.
+        """
+        self.directory = Path(directory) if directory is not None else None
+        self.max_size = max_size
+        self.use_hash = use_hash
+
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def snapshot_path(self, file_path: StrPath) -> Path:
+        """The path of the snapshot of the file."""
+        path = Path(file_path)
+        if self.directory is None:
+            return path.with_name(path.name + _SUFFIX)
+
+        key = hashlib.sha256(str(path.resolve()).encode("utf-8")).hexdigest()
+        return self.directory / (key + _SUFFIX)
+
+    def _signature(self, path: Path) -> _Signature:
+        """The size, modification time and optional content hash of the file."""
+        stat = path.stat()
+        if not self.use_hash:
+            return stat.st_size, stat.st_mtime_ns, None
+
+        digest = hashlib.blake2b()
+        with path.open("rb") as file:
+            while chunk := file.read(_CHUNK_SIZE):
+                digest.update(chunk)
+        return stat.st_size, stat.st_mtime_ns, digest.hexdigest()
+
+    def load_lines(
+        self, file_path: StrPath, compression: CompressionOption = "infer"
+    ) -> list[WsvLine]:
+        """Loads the lines of the file from its snapshot or parses and caches them.
+
+        Args:
+            file_path:
+                The path to the file to load
+            compression:
+                The compression of the file,
+                for more information see `whitespacesv.txt.open_binary`
+
+        Returns:
+            The lines of the file
+        """
+        path = Path(file_path)
+        snapshot = self.snapshot_path(path)
+        signature = self._signature(path)
+
+        lines = _read_snapshot(snapshot, signature)
+        if lines is not None:
+            # mark as recently used, the snapshot may have been evicted concurrently
+            with contextlib.suppress(FileNotFoundError):
+                os.utime(snapshot)
+            return lines
+
+        lines = list(iter_lines(path, compression))
+        _write_snapshot(snapshot, signature, lines)
+        self._evict()
+        return lines
+
+    def _evict(self) -> None:
+        """Removes the least recently used snapshots until the budget is met."""
+        if self.directory is None or self.max_size is None:
+            return
+
+        snapshots = []
+        for path in self.directory.glob("*" + _SUFFIX):
+            # the snapshot may have been evicted concurrently
+            with contextlib.suppress(FileNotFoundError):
+                snapshots.append((path, path.stat()))
+        snapshots.sort(key=lambda snapshot: snapshot[1].st_mtime_ns)
+
+        total = sum(stat.st_size for _, stat in snapshots)
+        for path, stat in snapshots:
+            if total <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total -= stat.st_size
+
+
+def _read_snapshot(snapshot: Path, signature: _Signature) -> list[WsvLine] | None:
+    """The lines of the snapshot or None if it is missing, stale or unreadable."""
+    try:
+        with snapshot.open("rb") as file:
+            version, stored_signature, rows = pickle.load(file)
+            if version != _VERSION or tuple(stored_signature) != signature:
+                return None
+            return [
+                WsvLine.from_trusted(
+                    values,
+                    whitespaces,
+                    comment,
+                    (source, 0, len(source)) if source is not None else None,
+                )
+                for values, whitespaces, comment, source in rows
+            ]
+    # a corrupt snapshot or one of another layout can raise almost anything, it is re-parsed
+    except Exception:  # noqa: BLE001
+        return None
+
+
+def _write_snapshot(snapshot: Path, signature: _Signature, lines: list[WsvLine]) -> None:
+    """Writes the snapshot atomically."""
+    rows: list[_Row] = [
+        (
+            list(line.values),  # noqa: PD011
+            list(line.whitespaces) if line.whitespaces is not None else None,
+            line.comment,
+            line.source,
+        )
+        for line in lines
+    ]
+
+    with tempfile.NamedTemporaryFile(
+        "wb", dir=snapshot.parent, prefix=snapshot.name, suffix=".tmp", delete=False
+    ) as file:
+        pickle.dump((_VERSION, signature, rows), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    Path(file.name).replace(snapshot)
@@ -0,0 +1,187 @@
+"""The command-line interface of the whitespacesv package.
+
+All subcommands read and write line by line, `-` stands for stdin or stdout.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from itertools import islice
+from typing import TYPE_CHECKING
+
+from whitespacesv.convert import csv_to_wsv, wsv_to_csv
+from whitespacesv.document import WsvDocument
+from whitespacesv.scan import count_rows
+from whitespacesv.sort import sort_file
+from whitespacesv.stream import WsvWriter, iter_lines, open_source
+from whitespacesv.utils import WsvParserError
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from whitespacesv.stream import StrPathOrFile
+
+_DELIMITERS = {"csv": ",", "tsv": "\t"}
+
+
+def _input(path: str) -> StrPathOrFile:
+    return sys.stdin if path == "-" else path
+
+
+def _output(path: str) -> StrPathOrFile:
+    return sys.stdout if path == "-" else path
+
+
+def _validate(args: argparse.Namespace) -> None:
+    for _ in iter_lines(_input(args.input)):
+        pass
+
+
+def _stats(args: argparse.Namespace) -> None:
+    stats = {"lines": 0, "values": 0, "nulls": 0, "comments": 0, "empty": 0, "columns": 0}
+    for line in iter_lines(_input(args.input)):
+        values = line.values  # noqa: PD011
+        stats["lines"] += 1
+        stats["values"] += len(values)
+        stats["nulls"] += values.count(None)
+        stats["comments"] += line.comment is not None
+        stats["empty"] += not values and line.comment is None
+        stats["columns"] = max(stats["columns"], len(values))
+
+    with WsvWriter(_output(args.output), "compact") as writer:
+        for key, value in stats.items():
+            writer.write_values([key, str(value)])
+
+
+def _format(args: argparse.Namespace) -> None:
+    lines = iter_lines(_input(args.input))
+    if args.mode == "pretty":
+        # the column widths depend on all lines
+        content = WsvDocument(list(lines)).to_string("pretty")
+        with open_source(_output(args.output), "w") as file:
+            file.write(content)
+        return
+
+    with WsvWriter(_output(args.output), args.mode) as writer:
+        writer.write_lines(lines)
+
+
+def _convert(args: argparse.Namespace) -> None:
+    if args.source == args.target or "wsv" not in {args.source, args.target}:
+        raise ValueError("Conversion is only supported between WSV and CSV/TSV")
+
+    if args.source == "wsv":
+        wsv_to_csv(
+            _input(args.input), _output(args.output), _DELIMITERS[args.target], args.none_value
+        )
+    else:
+        csv_to_wsv(_input(args.input), _output(args.output), _DELIMITERS[args.source])
+
+
+def _head(args: argparse.Namespace) -> None:
+    with WsvWriter(_output(args.output)) as writer:
+        writer.write_lines(islice(iter_lines(_input(args.input)), args.lines))
+
+
+def _count(args: argparse.Namespace) -> None:
+    source = sys.stdin.buffer if args.input == "-" else args.input
+    count = count_rows(source, not args.empty, not args.comments)
+    with open_source(_output(args.output), "w") as file:
+        file.write(f"{count}\n")
+
+
+def _sort(args: argparse.Namespace) -> None:
+    keys = [int(key) if key.isdigit() else key for key in args.key or ["0"]]
+    sort_file(
+        _input(args.input),
+        _output(args.output),
+        keys,
+        numeric=args.numeric,
+        reverse=args.reverse,
+        header=args.header,
+    )
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="whitespacesv", description="Process WSV files line by line."
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add(name: str, help_text: str) -> argparse.ArgumentParser:
+        subparser = subparsers.add_parser(name, help=help_text, description=help_text)
+        subparser.add_argument("input", nargs="?", default="-", help="input file, - for stdin")
+        subparser.add_argument("-o", "--output", default="-", help="output file, - for stdout")
+        return subparser
+
+    add("validate", "Check that the file is valid WSV.").set_defaults(func=_validate)
+    add("stats", "Count lines, values, nulls, comments and empty lines.").set_defaults(func=_stats)
+
+    format_parser = add("format", "Reformat the file.")
+    format_parser.add_argument(
+        "-m", "--mode", choices=["preserve", "compact", "pretty"], default="compact"
+    )
+    format_parser.set_defaults(func=_format)
+
+    convert_parser = add("convert", "Convert between WSV and CSV/TSV.")
+    convert_parser.add_argument(
+        "-f", "--from", dest="source", choices=["wsv", "csv", "tsv"], default="wsv"
+    )
+    convert_parser.add_argument(
+        "-t", "--to", dest="target", choices=["wsv", "csv", "tsv"], default="csv"
+    )
+    convert_parser.add_argument(
+        "--none-value", default="", help="field written for null values in CSV/TSV"
+    )
+    convert_parser.set_defaults(func=_convert)
+
+    head_parser = add("head", "Print the first lines.")
+    head_parser.add_argument("-n", "--lines", type=int, default=10)
+    head_parser.set_defaults(func=_head)
+
+    count_parser = add("count", "Count the rows without parsing.")
+    count_parser.add_argument("--empty", action="store_true", help="also count empty lines")
+    count_parser.add_argument(
+        "--comments", action="store_true", help="also count comment-only lines"
+    )
+    count_parser.set_defaults(func=_count)
+
+    sort_parser = add("sort", "Sort the rows by columns in bounded memory.")
+    sort_parser.add_argument(
+        "-k", "--key", action="append", help="index or header name of a key column, repeatable"
+    )
+    sort_parser.add_argument("--numeric", action="store_true", help="compare keys as numbers")
+    sort_parser.add_argument("-r", "--reverse", action="store_true", help="sort descending")
+    sort_parser.add_argument("--header", action="store_true", help="keep the first row first")
+    sort_parser.set_defaults(func=_sort)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Runs the command-line interface.
+
+    Args:
+        argv:
+            The arguments, defaults to `sys.argv[1:]`
+
+    Returns:
+        The exit code
+    """
+    args = _parser().parse_args(argv)
+    try:
+        args.func(args)
+        # a closed pipe may only show up when the buffered output is flushed
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # the reader stopped early, e.g. `head`. The rest of the output goes to devnull,
+        # so flushing it at exit doesn't fail again, see the docs of the signal module
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except (OSError, ValueError, WsvParserError) as exc:
+        sys.stderr.write(f"whitespacesv {args.command}: {exc}\n")
+        return 1
+    return 0
@@ -0,0 +1,109 @@
+"""The convert module contains streaming converters between CSV/TSV and WSV."""
+
+from __future__ import annotations
+
+import csv
+import io
+import os
+from contextlib import nullcontext
+from typing import IO, TYPE_CHECKING
+
+from whitespacesv.stream import WsvWriter, iter_lines
+from whitespacesv.txt import open_binary
+
+if TYPE_CHECKING:
+    from contextlib import AbstractContextManager
+
+    from whitespacesv.stream import StrPathOrFile
+    from whitespacesv.txt import CompressionOption
+
+
+def _open_csv(
+    source: StrPathOrFile, write: bool, compression: CompressionOption
+) -> AbstractContextManager[IO[str]]:
+    """Opens a path as CSV file as recommended by the `csv` module."""
+    if isinstance(source, (str, os.PathLike)):
+        binary = open_binary(source, "wb" if write else "rb", compression)
+        return io.TextIOWrapper(binary, encoding="utf-8", newline="")
+    return nullcontext(source)
+
+
+def csv_to_wsv(
+    src: StrPathOrFile,
+    dst: StrPathOrFile,
+    delimiter: str = ",",
+    empty_as_none: bool = True,
+    compression: CompressionOption = "infer",
+) -> int:
+    """Converts a CSV/TSV file to WSV in constant memory.
+
+    Args:
+        src:
+            The path to the CSV file or an open text file
+        dst:
+            The path to the WSV file or an open text file
+        delimiter:
+            The delimiter of the CSV file, e.g. a tab for TSV
+        empty_as_none:
+            Whether empty fields are converted to None (`-`) or empty strings (`""`)
+        compression:
+            The compression of both files,
+            for more information see `whitespacesv.txt.open_binary`
+
+    Returns:
+        The number of converted rows
+    """
+    rows = 0
+    with (
+        _open_csv(src, False, compression) as csv_file,
+        WsvWriter(dst, "compact", compression=compression) as writer,
+    ):
+        for row in csv.reader(csv_file, delimiter=delimiter):
+            if empty_as_none:
+                writer.write_values([field or None for field in row])
+            else:
+                writer.write_values(row)
+            rows += 1
+    return rows
+
+
+def wsv_to_csv(
+    src: StrPathOrFile,
+    dst: StrPathOrFile,
+    delimiter: str = ",",
+    none_value: str = "",
+    skip_empty: bool = True,
+    compression: CompressionOption = "infer",
+) -> int:
+    r"""Converts a WSV file to CSV/TSV with '\\n' line endings in constant memory.
+
+    Comments are dropped.
+
+    Args:
+        src:
+            The path to the WSV file or an open text file
+        dst:
+            The path to the CSV file or an open text file
+        delimiter:
+            The delimiter of the CSV file, e.g. a tab for TSV
+        none_value:
+            The field written for None values
+        skip_empty:
+            Whether lines without values, e.g. empty or comment lines, are skipped
+        compression:
+            The compression of both files,
+            for more information see `whitespacesv.txt.open_binary`
+
+    Returns:
+        The number of converted rows
+    """
+    rows = 0
+    with _open_csv(dst, True, compression) as csv_file:
+        writer = csv.writer(csv_file, delimiter=delimiter, lineterminator="\n")
+        for line in iter_lines(src, compression):
+            values = line.values  # noqa: PD011
+            if skip_empty and not values:
+                continue
+            writer.writerow([none_value if value is None else value for value in values])
+            rows += 1
+    return rows
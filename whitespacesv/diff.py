@@ -0,0 +1,274 @@
+"""The diff module contains a line diff of WSV documents and files.
+
+Each line is reduced to a fixed-size digest and the digest sequences are compared
+with a patience diff: common prefixes and suffixes are skipped, lines unique
+in both sequences anchor the alignment and the regions between anchors are
+diffed recursively.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from bisect import bisect_left
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import TYPE_CHECKING, Literal, NamedTuple
+
+from typing_extensions import TypeAlias
+
+from whitespacesv.binary import encode_values
+from whitespacesv.stream import iter_lines
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from whitespacesv.line import WsvLine
+    from whitespacesv.stream import StrPathOrFile
+    from whitespacesv.txt import CompressionOption
+
+DiffMode: TypeAlias = Literal["compact", "preserve"]
+
+_Region: TypeAlias = "tuple[int, int, int, int]"
+
+# the largest region without anchors diffed with difflib instead of replaced
+_MAX_QUADRATIC = 1_000_000
+# the size of the line digests in bytes, collisions are negligible
+_DIGEST_SIZE = 16
+
+
+class DiffOp(NamedTuple):
+    """An operation turning lines of the old into lines of the new document.
+
+    The operations cover both documents in order, like `difflib` opcodes.
+
+    Attributes:
+        tag:
+            `equal`, `insert`, `delete` or `replace`
+        a_start:
+            The start index in the old lines
+        a_end:
+            The end index in the old lines
+        b_start:
+            The start index in the new lines
+        b_end:
+            The end index in the new lines
+    """
+
+    tag: Literal["equal", "insert", "delete", "replace"]
+    a_start: int
+    a_end: int
+    b_start: int
+    b_end: int
+
+
+def _key(line: WsvLine, mode: DiffMode) -> int:
+    """The digest of the values or, in `preserve` mode, of all parts compared by line equality."""
+    encoded = encode_values(line.values)  # noqa: PD011
+    if mode == "preserve":
+        whitespaces = line.whitespaces
+        # the encoded values end with a line break marker, so the parts can't run together
+        encoded += b"\x00" if whitespaces is None else b"\x01" + encode_values(whitespaces)
+        encoded += encode_values([line.comment])
+    digest = hashlib.blake2b(encoded, digest_size=_DIGEST_SIZE).digest()
+    return int.from_bytes(digest, "little")
+
+
+def _keys(lines: Iterable[WsvLine], mode: DiffMode) -> list[int]:
+    """Maps the lines to integer digests, equal lines get the same digest."""
+    if mode not in ("compact", "preserve"):
+        raise ValueError(f"Invalid diff mode: {mode}")
+    return [_key(line, mode) for line in lines]
+
+
+def _longest_increasing(pairs: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """The longest subsequence of the pairs, sorted by the first, increasing in the second."""
+    second = [j for _, j in pairs]
+    if second == sorted(second):
+        return pairs
+
+    tails: list[int] = []
+    tail_ixs: list[int] = []
+    previous = [-1] * len(pairs)
+    for ix, (_, j) in enumerate(pairs):
+        pos = bisect_left(tails, j)
+        if pos == len(tails):
+            tails.append(j)
+            tail_ixs.append(ix)
+        else:
+            tails[pos] = j
+            tail_ixs[pos] = ix
+        previous[ix] = tail_ixs[pos - 1] if pos else -1
+
+    result = []
+    ix = tail_ixs[-1] if tail_ixs else -1
+    while ix != -1:
+        result.append(pairs[ix])
+        ix = previous[ix]
+    result.reverse()
+    return result
+
+
+def _anchors(a: list[int], b: list[int], region: _Region) -> list[tuple[int, int]]:
+    """The aligned positions of the lines unique in both parts of the region."""
+    a_lo, a_hi, b_lo, b_hi = region
+    a_counts = Counter(a[a_lo:a_hi])
+    b_counts = Counter(b[b_lo:b_hi])
+    b_unique = {key: j for j, key in enumerate(b[b_lo:b_hi], b_lo) if b_counts[key] == 1}
+    pairs = [
+        (i, b_unique[key])
+        for i, key in enumerate(a[a_lo:a_hi], a_lo)
+        if a_counts[key] == 1 and key in b_unique
+    ]
+    return _longest_increasing(pairs)
+
+
+def _common_size(a: list[int], b: list[int], region: _Region, suffix: bool) -> int:
+    """The size of the common prefix or suffix of the region.
+
+    The slices are compared with exponentially growing steps, so long
+    unchanged runs are skipped at the speed of list comparisons.
+    """
+    a_lo, a_hi, b_lo, b_hi = region
+    limit = min(a_hi - a_lo, b_hi - b_lo)
+    size = 0
+    step = 1
+    while size < limit:
+        step = min(step, limit - size)
+        if suffix:
+            equal = a[a_hi - size - step : a_hi - size] == b[b_hi - size - step : b_hi - size]
+        else:
+            equal = a[a_lo + size : a_lo + size + step] == b[b_lo + size : b_lo + size + step]
+        if equal:
+            size += step
+            step *= 2
+        elif step == 1:
+            break
+        else:
+            step //= 2
+    return size
+
+
+def _trim(
+    a: list[int], b: list[int], region: _Region, blocks: list[tuple[int, int, int]]
+) -> _Region:
+    """Adds the common prefix and suffix to the blocks and returns the remaining region."""
+    a_lo, a_hi, b_lo, b_hi = region
+    size = _common_size(a, b, region, suffix=False)
+    if size:
+        blocks.append((a_lo, b_lo, size))
+        a_lo += size
+        b_lo += size
+    size = _common_size(a, b, (a_lo, a_hi, b_lo, b_hi), suffix=True)
+    if size:
+        a_hi -= size
+        b_hi -= size
+        blocks.append((a_hi, b_hi, size))
+    return a_lo, a_hi, b_lo, b_hi
+
+
+def _matching_blocks(a: list[int], b: list[int]) -> list[tuple[int, int, int]]:
+    """The sorted matching blocks (i, j, size) of the id sequences."""
+    blocks: list[tuple[int, int, int]] = []
+    regions: list[_Region] = [(0, len(a), 0, len(b))]
+    while regions:
+        a_lo, a_hi, b_lo, b_hi = region = _trim(a, b, regions.pop(), blocks)
+        if a_lo == a_hi or b_lo == b_hi:
+            continue
+
+        anchors = _anchors(a, b, region)
+        if anchors:
+            # consecutive anchors form one block, the gaps between them are new regions
+            run_i, run_j, size = anchors[0][0], anchors[0][1], 0
+            for i, j in anchors:
+                if (i, j) != (run_i + size, run_j + size):
+                    blocks.append((run_i, run_j, size))
+                    run_i, run_j, size = i, j, 0
+                if size == 0 and (a_lo < i or b_lo < j):
+                    regions.append((a_lo, i, b_lo, j))
+                size += 1
+                a_lo, b_lo = i + 1, j + 1
+            blocks.append((run_i, run_j, size))
+            regions.append((a_lo, a_hi, b_lo, b_hi))
+        elif (a_hi - a_lo) * (b_hi - b_lo) <= _MAX_QUADRATIC:
+            matcher = SequenceMatcher(None, a[a_lo:a_hi], b[b_lo:b_hi], autojunk=False)
+            blocks.extend(
+                (a_lo + i, b_lo + j, size) for i, j, size in matcher.get_matching_blocks() if size
+            )
+        # otherwise the region is replaced as a whole
+
+    blocks.sort()
+    return blocks
+
+
+def _diff_ids(a: list[int], b: list[int]) -> list[DiffOp]:
+    """The operations turning the id sequence a into b."""
+    ops: list[DiffOp] = []
+    i = j = 0
+    for block_i, block_j, size in [*_matching_blocks(a, b), (len(a), len(b), 0)]:
+        if i < block_i and j < block_j:
+            ops.append(DiffOp("replace", i, block_i, j, block_j))
+        elif i < block_i:
+            ops.append(DiffOp("delete", i, block_i, j, j))
+        elif j < block_j:
+            ops.append(DiffOp("insert", i, i, j, block_j))
+
+        if size:
+            last = ops[-1] if ops else None
+            if last is not None and last.tag == "equal" and last.a_end == block_i:
+                ops[-1] = last._replace(a_end=block_i + size, b_end=block_j + size)
+            else:
+                ops.append(DiffOp("equal", block_i, block_i + size, block_j, block_j + size))
+        i, j = block_i + size, block_j + size
+    return ops
+
+
+def diff_lines(
+    a: Sequence[WsvLine], b: Sequence[WsvLine], mode: DiffMode = "compact"
+) -> list[DiffOp]:
+    """Computes the operations turning the old into the new lines.
+
+    Args:
+        a:
+            The old lines
+        b:
+            The new lines
+        mode:
+            If `compact`, lines with the same values are equal.
+            If `preserve`, the whitespaces and comments must be equal too,
+            like `WsvLine` equality, values may be quoted differently.
+
+    Returns:
+        The operations covering both sequences in order
+    """
+    return _diff_ids(_keys(a, mode), _keys(b, mode))
+
+
+def diff_files(
+    a: StrPathOrFile,
+    b: StrPathOrFile,
+    mode: DiffMode = "compact",
+    compression: CompressionOption = "infer",
+) -> list[DiffOp]:
+    """Computes the operations turning the lines of the old into the new file.
+
+    The files are streamed, only a fixed-size digest per line is kept in memory.
+
+    Args:
+        a:
+            The path to the old file or an open text file
+        b:
+            The path to the new file or an open text file
+        mode:
+            If `compact`, lines with the same values are equal.
+            If `preserve`, the whitespaces and comments must be equal too,
+            like `WsvLine` equality, values may be quoted differently.
+        compression:
+            The compression of both files,
+            for more information see `whitespacesv.txt.open_binary`
+
+    Returns:
+        The operations covering the lines of both files in order
+    """
+    return _diff_ids(
+        _keys(iter_lines(a, compression), mode), _keys(iter_lines(b, compression), mode)
+    )
@@ -2,28 +2,100 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal
+import gc
+import io
+import itertools
+import multiprocessing
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Literal, NamedTuple, overload
 
 from typing_extensions import Self, override
 
+from whitespacesv.binary import decode_lines, encode_lines
+from whitespacesv.diff import diff_lines
+from whitespacesv.fingerprint import fingerprint_lines
 from whitespacesv.line import WsvLine
+from whitespacesv.memory import estimate_memory, memory_usage
 from whitespacesv.parser import parse_lines
 from whitespacesv.serializer import (
     SerializationMode,
+    column_widths,
+    merge_column_widths,
     prettify_values,
-    serialize_line,
-    serialize_value,
 )
-from whitespacesv.txt import StrPath, TxtDocument
+from whitespacesv.stream import iter_lines
+from whitespacesv.txt import StrPath, detect_file_encoding, ends_with_new_line, open_binary
 from whitespacesv.utils import reinfer_types
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
+    from concurrent.futures import Executor, Future
 
     import pandas as pd
 
+    from whitespacesv.cache import DocumentCache
+    from whitespacesv.diff import DiffMode, DiffOp
+    from whitespacesv.memory import MemoryEstimate, MemoryUsage, MemoryUsageBy
+    from whitespacesv.txt import CompressionOption
+
 SM = SerializationMode
 
+# the number of lines serialized at once when dumping
+_DUMP_SLICE = 1024
+
+# the number of lines serialized at once by a worker of a parallel save
+_SAVE_RANGE = 64 * 1024
+
+# the lines of running parallel saves, inherited by the forked workers
+_SAVE_LINES: dict[int, list[WsvLine]] = {}
+_SAVE_KEYS = itertools.count()
+
+
+class LoadResult(NamedTuple):
+    """The result of loading a single file with `WsvDocument.load_many`.
+
+    Attributes:
+        path:
+            The path of the loaded file
+        document:
+            The loaded document or None if loading failed
+        error:
+            The error raised while loading or None
+    """
+
+    path: StrPath
+    document: WsvDocument | None
+    error: Exception | None
+
+
+def _serialize_lines(
+    lines: list[WsvLine], mode: SerializationMode, widths: list[int] | None
+) -> list[str]:
+    """Serializes the lines without memoizing the results, they would outlive the dump."""
+    if widths is not None:
+        return prettify_values(
+            [line.serialized_values(False) for line in lines],
+            [line.comment for line in lines],
+            widths,
+        )
+    return [line.serialize(mode, False) for line in lines]
+
+
+def _range_widths(key: int, start: int) -> list[int]:
+    """The column widths of a range of the lines of a parallel save."""
+    lines = _SAVE_LINES[key][start : start + _SAVE_RANGE]
+    return column_widths([line.serialized_values(False) for line in lines])
+
+
+def _serialize_range(
+    key: int, start: int, mode: SerializationMode, widths: list[int] | None, encoding: str
+) -> bytes:
+    """Serializes and encodes a range of the lines of a parallel save."""
+    lines = _SAVE_LINES[key][start : start + _SAVE_RANGE]
+    return ("\n".join(_serialize_lines(lines, mode, widths)) + "\n").encode(encoding)
+
 
 class WsvDocument:
     """A class representing a WSV document."""
@@ -49,6 +121,23 @@ class WsvDocument:
     def __repr__(self) -> str:
         return f"Document(lines={self.lines})"
 
+    @classmethod
+    def from_lines_unchecked(cls, lines: list[WsvLine]) -> Self:
+        """Creates a document which takes ownership of the list of lines without copying it.
+
+        The list must not be used by the caller afterwards.
+        """
+        document = cls.__new__(cls)
+        document.lines = lines
+        return document
+
+    def extend_rows(self, rows: Iterable[Iterable[str | None]]) -> None:
+        """Appends a line for each row of values without whitespaces and comments.
+
+        Values need no validation, so the lines are created without it.
+        """
+        self.lines.extend([WsvLine.from_trusted(values) for values in rows])
+
     @classmethod
     def parse(cls, text: str) -> Self:
         """Parses the content to a WsvDocument.
@@ -60,8 +149,7 @@ class WsvDocument:
         Returns:
             The parsed WsvDocument
         """
-        lines = parse_lines(text)
-        return cls(lines)
+        return cls.from_lines_unchecked(parse_lines(text))
 
     def serialize(
         self, mode: Literal["preserve", "compact", "pretty"] | SerializationMode = "preserve"
@@ -71,6 +159,7 @@ class WsvDocument:
         Args:
             mode: If mode is `preserve`, the values are serialized
                 with the original whitespaces and comments.
+                Unchanged parsed lines are copied from their source.
                 If mode is `compact`, the values are serialized
                 without whitespaces and comments.
                 If mode is `pretty`, the values are serialized with
@@ -81,41 +170,170 @@ class WsvDocument:
         """
         mode = SerializationMode(mode)
 
-        values = [
-            [serialize_value(value) for value in line.values]  # noqa: PD011
-            for line in self.lines
-        ]
-
-        if mode == SM.COMPACT:
-            serialized = [" ".join(x) for x in values]
-        elif mode == SM.PRETTY:
-            serialized = prettify_values(values, [line.comment for line in self.lines])
-        elif mode == SM.PRESERVE:
-            serialized = [
-                serialize_line(line_values, line.whitespaces, line.comment)
-                for line_values, line in zip(values, self.lines)
-            ]
-        else:
-            raise RuntimeError(f"Invalid mode: {mode}")  # pragma: no cover
+        if mode == SM.PRETTY:
+            return prettify_values(
+                [line.serialized_values() for line in self.lines],
+                [line.comment for line in self.lines],
+            )
 
-        return serialized
+        return [line.serialize(mode) for line in self.lines]
 
     @classmethod
-    def load(cls, file_path: StrPath) -> Self:
+    def load(
+        cls,
+        file_path: StrPath,
+        compression: CompressionOption = "infer",
+        cache: DocumentCache | None = None,
+    ) -> Self:
         """Loads the content from a file into a WsvDocument.
 
         Args:
             file_path:
                 The path to the file to load
+            compression:
+                The compression of the file, inferred from the suffix by default.
+                For more information see `whitespacesv.txt.open_binary`
+            cache:
+                An optional on-disk cache of parsed files,
+                for more information see `DocumentCache`
 
         Returns:
             The WsvDocument
+
+        Raises:
+            ValueError: If the file is empty or has no new line at the end
+            WsvParserError: If a line is invalid, the index of the error is relative
+                to the text of the file. An invalid line before the last line
+                is raised before a missing new line at the end
         """
-        file = TxtDocument.load(file_path)
-        text = file.text
-        if not text or not text[-1] == "\n":
-            raise ValueError("Empty file or no new line at the end")
-        return cls.parse(file.text)
+        if cache is not None:
+            return cls.from_lines_unchecked(cache.load_lines(file_path, compression))
+        return cls.from_lines_unchecked(list(iter_lines(file_path, compression)))
+
+    @classmethod
+    def load_many(
+        cls,
+        paths: Iterable[StrPath],
+        workers: int | None = None,
+        executor: Literal["thread", "process"] = "thread",
+        ordered: bool = True,
+        compression: CompressionOption = "infer",
+    ) -> Iterator[LoadResult]:
+        """Loads many files concurrently with a worker pool.
+
+        Errors are reported per file instead of aborting the whole batch.
+
+        Args:
+            paths:
+                The paths to the files to load
+            workers:
+                The maximum number of workers,
+                for the default see `concurrent.futures`
+            executor:
+                Whether to use a thread or a process pool.
+                Threads overlap the file I/O, processes also parallelize the parsing
+            ordered:
+                Whether to yield the results in input order or as they complete
+            compression:
+                The compression of the files,
+                for more information see `whitespacesv.txt.open_binary`
+
+        Yields:
+            A `LoadResult` for each file
+        """
+        pool: Executor
+        if executor == "thread":
+            pool = ThreadPoolExecutor(max_workers=workers)
+        elif executor == "process":
+            pool = ProcessPoolExecutor(max_workers=workers)
+        else:
+            raise ValueError(f"Invalid executor: {executor}")
+
+        try:
+            futures = {pool.submit(cls.load, path, compression): path for path in paths}
+            for future in futures if ordered else as_completed(futures):
+                error = future.exception()
+                if error is None:
+                    yield LoadResult(futures[future], future.result(), None)
+                elif isinstance(error, Exception):
+                    yield LoadResult(futures[future], None, error)
+                else:  # pragma: no cover
+                    raise error
+        finally:
+            # don't start pending loads if the consumer stopped early
+            pool.shutdown(cancel_futures=True)
+
+    def diff(self, other: WsvDocument, mode: DiffMode = "compact") -> list[DiffOp]:
+        """Computes the line operations turning this document into the other.
+
+        Args:
+            other:
+                The new document
+            mode:
+                If `compact`, lines with the same values are equal.
+                If `preserve`, the whitespaces and comments must be equal too.
+
+        Returns:
+            The operations covering the lines of both documents in order.
+            For more information see `whitespacesv.diff.DiffOp`
+        """
+        return diff_lines(self.lines, other.lines, mode)
+
+    def fingerprint(self, logical: bool = True) -> str:
+        """Computes a stable hash of the content of the document.
+
+        Args:
+            logical:
+                If True, only the values of lines with values are hashed,
+                so whitespaces, comments and empty lines are ignored.
+                If False, the lines are hashed including their formatting.
+
+        Returns:
+            The hex digest, for more information see `whitespacesv.fingerprint`
+        """
+        return fingerprint_lines(self.lines, logical)
+
+    @overload
+    def memory_usage(
+        self, deep: bool = True, by: Literal["document"] = "document"
+    ) -> MemoryUsage: ...
+
+    @overload
+    def memory_usage(self, deep: bool, by: Literal["line", "column"]) -> list[MemoryUsage]: ...
+
+    @overload
+    def memory_usage(
+        self, deep: bool = True, *, by: Literal["line", "column"]
+    ) -> list[MemoryUsage]: ...
+
+    def memory_usage(
+        self, deep: bool = True, by: MemoryUsageBy = "document"
+    ) -> MemoryUsage | list[MemoryUsage]:
+        """Estimates the memory used by the document in bytes.
+
+        Args:
+            deep:
+                Whether to include the strings,
+                otherwise only the objects and their containers are counted
+            by:
+                Whether to report the usage of the whole `document`,
+                per `line` or of the values per `column`
+
+        Returns:
+            The memory usage or a list of usages,
+            for more information see `whitespacesv.memory.MemoryUsage`
+        """
+        return memory_usage(self.lines, deep, by)
+
+    def estimate_memory(self) -> MemoryEstimate:
+        """Estimates the memory of the document in more compact representations.
+
+        Returns:
+            The estimated bytes of the current document and of values only,
+            interned and columnar representations,
+            for more information see `whitespacesv.memory.MemoryEstimate`
+        """
+        return estimate_memory(self.lines)
 
     def to_string(self, mode: Literal["preserve", "compact", "pretty"] = "preserve") -> str:
         """Serializes the document to a string.
@@ -130,8 +348,110 @@ class WsvDocument:
         """
         return "\n".join(self.serialize(mode)) + "\n"
 
-    def save(
-        self, file_path: StrPath, mode: Literal["preserve", "compact", "pretty"] = "preserve"
+    def _text_chunks(self, mode: SerializationMode, buffer_size: int) -> Iterator[str]:
+        """Yields the serialized lines with new lines in chunks of about buffer_size characters."""
+        if not self.lines:
+            yield "\n"
+            return
+
+        widths: list[int] | None = None
+        if mode == SM.PRETTY:
+            widths = []
+            for start in range(0, len(self.lines), _DUMP_SLICE):
+                lines = self.lines[start : start + _DUMP_SLICE]
+                merge_column_widths(
+                    widths, column_widths([line.serialized_values(False) for line in lines])
+                )
+
+        batch: list[str] = []
+        size = 0
+        for start in range(0, len(self.lines), _DUMP_SLICE):
+            serialized = _serialize_lines(self.lines[start : start + _DUMP_SLICE], mode, widths)
+            batch.extend(serialized)
+            size += sum(map(len, serialized)) + len(serialized)
+            if size >= buffer_size:
+                yield "\n".join(batch) + "\n"
+                batch = []
+                size = 0
+        if batch:
+            yield "\n".join(batch) + "\n"
+
+    def _parallel_chunks(
+        self, mode: SerializationMode, workers: int, encoding: str
+    ) -> Iterator[bytes]:
+        """Yields the encoded ranges of lines in order, serialized by forked processes.
+
+        The workers inherit the lines from the fork, so only the ranges
+        and the encoded results are sent between the processes.
+        """
+        key = next(_SAVE_KEYS)
+        _SAVE_LINES[key] = self.lines
+        starts = range(0, len(self.lines), _SAVE_RANGE)
+        try:
+            # the inherited objects are excluded from the garbage collection of the workers,
+            # which would otherwise scan and copy the whole document in each worker
+            with ProcessPoolExecutor(
+                workers, multiprocessing.get_context("fork"), initializer=gc.freeze
+            ) as pool:
+                widths: list[int] | None = None
+                if mode == SM.PRETTY:
+                    widths = []
+                    for range_widths in pool.map(_range_widths, itertools.repeat(key), starts):
+                        merge_column_widths(widths, range_widths)
+
+                # a bounded number of ranges ahead of the writer
+                pending: deque[Future[bytes]] = deque()
+                for start in starts:
+                    if len(pending) >= 2 * workers:
+                        yield pending.popleft().result()
+                    pending.append(
+                        pool.submit(_serialize_range, key, start, mode, widths, encoding)
+                    )
+                while pending:
+                    yield pending.popleft().result()
+        finally:
+            del _SAVE_LINES[key]
+
+    def dump(
+        self,
+        fp: IO[bytes],
+        mode: Literal["preserve", "compact", "pretty"] = "preserve",
+        buffer_size: int = 1024 * 1024,
+        encoding: str = "utf-8",
+    ) -> None:
+        """Writes the encoded document to a binary file with a new line appended.
+
+        The lines are serialized and encoded in chunks, so only about one chunk
+        is held in memory in addition to the lines, e.g. for sockets or upload streams.
+        The serializations are not memoized on the lines.
+
+        Args:
+            fp:
+                The binary file or buffer, it is not closed
+            mode:
+                The serialization mode,
+                for more information see `SerializationMode`
+            buffer_size:
+                The approximate number of characters encoded and written at once
+            encoding:
+                The encoding of the text, no byte order mark is written
+        """
+        for chunk in self._text_chunks(SerializationMode(mode), buffer_size):
+            fp.write(chunk.encode(encoding))
+
+    def to_bytes(self, mode: Literal["preserve", "compact", "pretty"] = "preserve") -> bytes:
+        """Serializes the document to utf-8 encoded bytes, equal to the encoded `to_string`."""
+        buffer = io.BytesIO()
+        self.dump(buffer, mode)
+        return buffer.getvalue()
+
+    def save(  # noqa: PLR0913
+        self,
+        file_path: StrPath,
+        mode: Literal["preserve", "compact", "pretty"] = "preserve",
+        append: bool = False,
+        compression: CompressionOption = "infer",
+        workers: int = 1,
     ) -> None:
         """Saves the document to a file with a new line appended.
 
@@ -141,12 +461,84 @@ class WsvDocument:
             mode:
                 The serialization mode,
                 for more information see `SerializationMode`
+            append:
+                Whether to append the lines to an existing file instead of
+                rewriting it. The file has to end with a new line, which requires
+                decompressing a whole compressed file once.
+                The lines are written in the encoding of the file.
+                In `pretty` mode, the column widths only consider the appended lines.
+            compression:
+                The compression of the file, inferred from the suffix by default.
+                For more information see `whitespacesv.txt.open_binary`
+            workers:
+                The number of forked processes serializing ranges of lines,
+                which are written in order. In `pretty` mode, the column widths
+                of the ranges are computed in parallel first and then merged.
+                Without the fork start method, e.g. on Windows, the lines are saved serially
         """
         if not self.lines:
             raise ValueError("Can't save empty document")
-        content = self.to_string(mode)
-        file = TxtDocument(content)
-        file.save(file_path)
+        if workers < 1:
+            raise ValueError(f"Invalid number of workers: {workers}")
+        path = Path(file_path)
+        if (
+            append
+            and path.is_file()
+            and path.stat().st_size
+            and not ends_with_new_line(path, compression)
+        ):
+            raise ValueError("Can't append to a file without new line at the end")
+
+        encoding = detect_file_encoding(file_path, compression) if append else "utf-8"
+        with open_binary(file_path, "ab" if append else "wb", compression) as file:
+            if workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+                for chunk in self._parallel_chunks(SerializationMode(mode), workers, encoding):
+                    file.write(chunk)
+            else:
+                self.dump(file, mode, encoding=encoding)
+
+    def to_binary(self) -> bytes:
+        """Encodes the values of the document to the binary WSV format of this package.
+
+        Whitespaces and comments are dropped,
+        for more information see `whitespacesv.binary`.
+        """
+        return encode_lines(self.lines)
+
+    @classmethod
+    def from_binary(cls, data: bytes) -> Self:
+        """Decodes a document in the binary WSV format of this package."""
+        return cls.from_lines_unchecked(decode_lines(data))
+
+    def save_binary(self, file_path: StrPath, compression: CompressionOption = "infer") -> None:
+        """Saves the values of the document in the binary WSV format to a file.
+
+        Args:
+            file_path:
+                The path to the file to save
+            compression:
+                The compression of the file, inferred from the suffix by default.
+                For more information see `whitespacesv.txt.open_binary`
+        """
+        with open_binary(file_path, "wb", compression) as file:
+            file.write(self.to_binary())
+
+    @classmethod
+    def load_binary(cls, file_path: StrPath, compression: CompressionOption = "infer") -> Self:
+        """Loads a file in the binary WSV format into a WsvDocument.
+
+        Args:
+            file_path:
+                The path to the file to load
+            compression:
+                The compression of the file, inferred from the suffix by default.
+                For more information see `whitespacesv.txt.open_binary`
+
+        Returns:
+            The WsvDocument
+        """
+        with open_binary(file_path, "rb", compression) as file:
+            return cls.from_binary(file.read())
 
     def to_pandas(self, header: bool = True, infer_types: bool = True) -> pd.DataFrame:
         """Converts the document to a pandas DataFrame.
@@ -190,5 +582,6 @@ class WsvDocument:
         values = [[str(x) if pd.notna(x) else None for x in row] for row in values]
         if header:
             values.insert(0, list(input_df.columns))
-        lines = [WsvLine(x) for x in values]
-        return cls(lines)
+        document = cls()
+        document.extend_rows(values)
+        return document
@@ -0,0 +1,74 @@
+"""The fingerprint module contains stable content hashes of WSV documents and files.
+
+A logical fingerprint only covers the values of the lines with values,
+so files that differ only in whitespaces, comments or empty lines hash the same.
+An exact fingerprint covers the serialized lines including their formatting.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING
+
+from whitespacesv.binary import encode_values
+from whitespacesv.stream import iter_lines
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from whitespacesv.line import WsvLine
+    from whitespacesv.stream import StrPathOrFile
+    from whitespacesv.txt import CompressionOption
+
+# the personalization separates the fingerprints of both modes
+_LOGICAL = b"wsv-logical-v1"
+_EXACT = b"wsv-exact-v1"
+
+
+def fingerprint_lines(lines: Iterable[WsvLine], logical: bool = True) -> str:
+    """Computes the fingerprint of the lines in constant memory.
+
+    The values are hashed in their binary WSV encoding, which distinguishes
+    None from `-` and needs no escaping.
+
+    Args:
+        lines:
+            The lines, e.g. streamed from a file
+        logical:
+            If True, only the values of lines with values are hashed.
+            If False, the lines are hashed as serialized in `preserve` mode.
+
+    Returns:
+        The hex digest
+    """
+    digest = hashlib.blake2b(person=_LOGICAL if logical else _EXACT)
+    if logical:
+        for line in lines:
+            values = line.values  # noqa: PD011
+            if values:
+                digest.update(encode_values(values))
+    else:
+        for line in lines:
+            digest.update(line.serialize().encode("utf-8") + b"\n")
+    return digest.hexdigest()
+
+
+def fingerprint_file(
+    source: StrPathOrFile, logical: bool = True, compression: CompressionOption = "infer"
+) -> str:
+    """Computes the fingerprint of a WSV file while streaming it.
+
+    Args:
+        source:
+            The path to the file or an open text file
+        logical:
+            If True, only the values of lines with values are hashed.
+            If False, the lines are hashed including whitespaces and comments.
+        compression:
+            The compression of the file,
+            for more information see `whitespacesv.txt.open_binary`
+
+    Returns:
+        The hex digest, equal to the fingerprint of the loaded document
+    """
+    return fingerprint_lines(iter_lines(source, compression), logical)
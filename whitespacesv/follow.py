@@ -0,0 +1,119 @@
+"""The follow module contains a reader for growing WSV files."""
+
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from whitespacesv.parser import parse_line
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from whitespacesv.line import WsvLine
+    from whitespacesv.txt import StrPath
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+class FollowCheckpoint(NamedTuple):
+    """The position of a follower, which can be stored to resume following.
+
+    Attributes:
+        offset:
+            The byte offset after the last yielded line
+        line_ix:
+            The index of the next line, used in the positions of parser errors
+        inode:
+            The inode of the followed file or None if it was not read yet.
+            If the file is replaced, it is read again from the start
+    """
+
+    offset: int
+    line_ix: int = 0
+    inode: int | None = None
+
+
+class WsvFollower:
+    """Follows a growing WSV file like `tail -f`.
+
+    Only completed lines, i.e. lines terminated by a line feed, are yielded.
+    A partial trailing line is held back until it is completed.
+    The checkpoint after the last yielded line can be stored
+    and passed to a new follower to resume without re-parsing the file.
+    """
+
+    def __init__(
+        self, file_path: StrPath, offset: int | FollowCheckpoint = 0, poll_interval: float = 1.0
+    ) -> None:
+        """Initializes the follower.
+
+        Args:
+            file_path:
+                The path to the followed file
+            offset:
+                A stored checkpoint or the byte offset to start reading from.
+                With a plain offset, line numbers in parser errors start at 1
+            poll_interval:
+                The seconds to wait between polls in `follow`
+        """
+        checkpoint = offset if isinstance(offset, FollowCheckpoint) else FollowCheckpoint(offset)
+        self._path = Path(file_path)
+        self._offset, self._line_ix, self._inode = checkpoint
+        self.poll_interval = poll_interval
+
+    @property
+    def offset(self) -> int:
+        """The byte offset after the last yielded line."""
+        return self._offset
+
+    @property
+    def checkpoint(self) -> FollowCheckpoint:
+        """The position after the last yielded line, for more information see `FollowCheckpoint`."""
+        return FollowCheckpoint(self._offset, self._line_ix, self._inode)
+
+    def poll(self) -> Iterator[WsvLine]:
+        """Yields the lines completed since the last poll.
+
+        If the file was truncated below the current offset or replaced,
+        it is read again from the start.
+        """
+        with self._path.open("rb") as file:
+            stat = os.fstat(file.fileno())
+            if stat.st_size < self._offset or (
+                self._inode is not None and stat.st_ino != self._inode
+            ):
+                self._offset = 0
+                self._line_ix = 0
+            self._inode = stat.st_ino
+
+            file.seek(self._offset)
+            for raw in file:
+                # hold back the partial trailing line
+                if not raw.endswith(b"\n"):
+                    break
+
+                content = raw[:-1]
+                if self._offset == 0 and content.startswith(_UTF8_BOM):
+                    content = content[len(_UTF8_BOM) :]
+
+                line = parse_line(content.decode("utf-8"), self._line_ix)
+                self._offset += len(raw)
+                self._line_ix += 1
+                yield line
+
+    def follow(self, stop: Callable[[], bool] | None = None) -> Iterator[WsvLine]:
+        """Yields the completed lines and waits for new ones.
+
+        Args:
+            stop:
+                Called after each poll, following ends if it returns True.
+                If not provided, the file is followed forever.
+        """
+        while True:
+            yield from self.poll()
+            if stop is not None and stop():
+                return
+            time.sleep(self.poll_interval)
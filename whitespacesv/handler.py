@@ -0,0 +1,26 @@
+"""The handler module contains the callbacks of the event parser.
+
+It is kept apart from the parser, so it can be subclassed
+when the parser is compiled with mypyc.
+"""
+
+from __future__ import annotations
+
+
+class WsvHandler:
+    """The callbacks of `parse_events`, which do nothing by default.
+
+    Subclasses override the events they need.
+    """
+
+    def on_value(self, value: str | None) -> None:
+        """Called with each value, None for the null value."""
+
+    def on_whitespace(self, whitespace: str) -> None:
+        """Called with the whitespaces between values."""
+
+    def on_comment(self, comment: str) -> None:
+        """Called with the comment text without the hash."""
+
+    def on_line_end(self) -> None:
+        """Called at the end of each line."""
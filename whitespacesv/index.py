@@ -0,0 +1,343 @@
+"""The index module contains a persistent key index for point lookups in WSV files."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+from typing_extensions import Self
+
+from whitespacesv.parser import parse_line
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+    from whitespacesv.line import WsvLine
+    from whitespacesv.txt import StrPath
+
+_SUFFIX = ".wsvindex"
+_VERSION = 3
+# the number of appended records after which the index file is rewritten compactly
+_MAX_RECORDS = 64
+_UTF8_BOM = b"\xef\xbb\xbf"
+# the tail of the indexed part used to detect changes other than appends
+_TAIL_SIZE = 4096
+
+
+def _line_values(raw: bytes, line_ix: int) -> list[str | None]:
+    """The values of the raw line without its line feed."""
+    # bytes.split splits exactly at the ascii whitespaces of WSV
+    if raw.isascii() and b'"' not in raw and b"#" not in raw:
+        return [None if value == b"-" else value.decode("ascii") for value in raw.split()]
+    return parse_line(raw.decode("utf-8"), line_ix).values  # noqa: PD011
+
+
+class WsvIndexedFile:
+    """A WSV file with a persistent index from the values of a key column to line offsets.
+
+    The index is stored in a sidecar file. When the WSV file has only been appended to,
+    only the new lines are indexed and their offsets are appended to the sidecar file,
+    which is rewritten compactly from time to time. Otherwise, e.g. when the file
+    was replaced, the index is rebuilt.
+    A lookup seeks to the line and parses only this line.
+    If a key occurs multiple times, `get` returns the last line and `get_all` all lines.
+    """
+
+    def __init__(
+        self,
+        file_path: StrPath,
+        key: int | str = 0,
+        header: bool = False,
+        index_path: StrPath | None = None,
+    ) -> None:
+        """Initializes the indexed file and builds or updates the index.
+
+        Args:
+            file_path:
+                The path to the uncompressed, utf-8 encoded WSV file
+            key:
+                The index or, with a header, the name of the key column
+            header:
+                Whether the first line with values is the header
+            index_path:
+                The path of the index, defaults to the file path with `.wsvindex` appended
+        """
+        if isinstance(key, str) and not header:
+            raise ValueError("A key column name requires a header")
+
+        self._path = Path(file_path)
+        self._index_path = (
+            Path(index_path)
+            if index_path is not None
+            else self._path.with_name(self._path.name + _SUFFIX)
+        )
+        self._key = key
+        self._header = header
+        self._file: IO[bytes] | None = None
+
+        self._reset()
+        self.refresh()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._offsets
+
+    @property
+    def key(self) -> int | str:
+        """The index or name of the key column."""
+        return self._key
+
+    @property
+    def header(self) -> list[str | None] | None:
+        """The values of the header or None without a header or before it is indexed."""
+        return self._header_values
+
+    @property
+    def index_path(self) -> Path:
+        """The path of the index."""
+        return self._index_path
+
+    def _reset(self) -> None:
+        """Resets the index to an empty file."""
+        self.close()
+        self._column = self._key if isinstance(self._key, int) else None
+        self._header_seen = False
+        self._header_values: list[str | None] | None = None
+        # the offset of the last line per key and the earlier offsets of repeated keys
+        self._offsets: dict[str, int] = {}
+        self._duplicates: dict[str, list[int]] = {}
+        self._size = 0
+        self._line_ix = 0
+        self._tail = b""
+        self._identity: tuple[int, int] | None = None
+        # the keys and offsets not yet stored
+        self._pending: list[tuple[str, int]] = []
+        # the end of the last valid record in the index file, 0 if it must be rewritten
+        self._index_end = 0
+        self._records = 0
+
+    def _tail_digest(self, file: IO[bytes], size: int) -> bytes:
+        """The digest of the bytes before the size."""
+        start = max(0, size - _TAIL_SIZE)
+        file.seek(start)
+        return hashlib.blake2b(file.read(size - start)).digest()
+
+    def _state(self) -> tuple[object, ...]:
+        """The options the index depends on."""
+        return (_VERSION, self._key, self._header)
+
+    def _record(self, offsets: list[tuple[str, int]]) -> tuple[object, ...]:
+        """The keys and offsets in file order with the state after indexing them."""
+        return (
+            offsets,
+            self._column,
+            self._header_seen,
+            self._header_values,
+            self._size,
+            self._line_ix,
+            self._tail,
+            self._identity,
+        )
+
+    def _load(self) -> None:
+        """Loads the stored index if it matches the options.
+
+        The index file holds the options followed by records of indexed offsets.
+        A truncated last record, e.g. after a crash, is ignored.
+        """
+        try:
+            file = self._index_path.open("rb")
+        except OSError:
+            return
+
+        with file:
+            try:
+                if pickle.load(file) != self._state():
+                    return
+            except (EOFError, TypeError, ValueError, pickle.UnpicklingError):
+                return
+
+            end = file.tell()
+            records = 0
+            while True:
+                try:
+                    offsets, *stored = pickle.load(file)
+                except (EOFError, TypeError, ValueError, pickle.UnpicklingError):
+                    break
+                for key, offset in offsets:
+                    self._add(key, offset)
+                (
+                    self._column,
+                    self._header_seen,
+                    self._header_values,
+                    self._size,
+                    self._line_ix,
+                    self._tail,
+                    self._identity,
+                ) = stored
+                end = file.tell()
+                records += 1
+
+        self._index_end = end if records else 0
+        self._records = records
+
+    def _save(self) -> None:
+        """Appends the pending offsets to the index file or rewrites it."""
+        if self._index_end and self._records < _MAX_RECORDS:
+            try:
+                self._append_record()
+            except FileNotFoundError:
+                self._rewrite()
+        else:
+            self._rewrite()
+        self._pending = []
+
+    def _append_record(self) -> None:
+        """Appends a record of the pending offsets after the last valid record."""
+        with self._index_path.open("r+b") as file:
+            file.seek(self._index_end)
+            file.truncate()
+            pickle.dump(self._record(self._pending), file, protocol=pickle.HIGHEST_PROTOCOL)
+            self._index_end = file.tell()
+        self._records += 1
+
+    def _rewrite(self) -> None:
+        """Writes the whole index atomically as a single record."""
+        with tempfile.NamedTemporaryFile(
+            "wb",
+            dir=self._index_path.parent,
+            prefix=self._index_path.name,
+            suffix=".tmp",
+            delete=False,
+        ) as file:
+            pickle.dump(self._state(), file, protocol=pickle.HIGHEST_PROTOCOL)
+            offsets = [
+                (key, offset)
+                for key, last in self._offsets.items()
+                for offset in (*self._duplicates.get(key, ()), last)
+            ]
+            pickle.dump(self._record(offsets), file, protocol=pickle.HIGHEST_PROTOCOL)
+            self._index_end = file.tell()
+        Path(file.name).replace(self._index_path)
+        self._records = 1
+
+    def refresh(self) -> None:
+        """Indexes the lines appended since the last refresh.
+
+        If the indexed part of the file was changed or the file was replaced,
+        the index is rebuilt. A partial trailing line is indexed once it is completed.
+        """
+        if not self._size:
+            self._load()
+
+        with self._path.open("rb") as file:
+            stat = os.fstat(file.fileno())
+            identity = (stat.st_dev, stat.st_ino)
+            size = file.seek(0, os.SEEK_END)
+            # a replaced file is rebuilt even if it starts with the indexed content
+            if self._size and (
+                identity != self._identity
+                or size < self._size
+                or self._tail_digest(file, self._size) != self._tail
+            ):
+                self._reset()
+            self._identity = identity
+
+            if size == self._size:
+                return
+
+            file.seek(self._size)
+            offset = self._size
+            for raw in file:
+                # hold back the partial trailing line
+                if not raw.endswith(b"\n"):
+                    break
+                self._index_line(raw, offset)
+                offset += len(raw)
+                self._line_ix += 1
+
+            if offset == self._size:
+                return
+            self._size = offset
+            self._tail = self._tail_digest(file, offset)
+
+        self._save()
+
+    def _index_line(self, raw: bytes, offset: int) -> None:
+        """Adds the key of the raw line at the offset to the index."""
+        content = raw[:-1]
+        if offset == 0 and content.startswith(_UTF8_BOM):
+            content = content[len(_UTF8_BOM) :]
+
+        values = _line_values(content, self._line_ix)
+        if not values:
+            return
+
+        if self._header and not self._header_seen:
+            self._header_seen = True
+            self._header_values = values
+            if isinstance(self._key, str):
+                if self._key not in values:
+                    raise ValueError(f"Key column not in header: {self._key}")
+                self._column = values.index(self._key)
+            return
+
+        if self._column is not None and self._column < len(values):
+            key = values[self._column]
+            if key is not None:
+                self._add(key, offset)
+                self._pending.append((key, offset))
+
+    def _add(self, key: str, offset: int) -> None:
+        """Adds the offset of a line of the key after the earlier lines."""
+        previous = self._offsets.get(key)
+        if previous is not None:
+            self._duplicates.setdefault(key, []).append(previous)
+        self._offsets[key] = offset
+
+    def get(self, key: str) -> WsvLine | None:
+        """The last line of the key or None if the key is not indexed."""
+        offset = self._offsets.get(key)
+        if offset is None:
+            return None
+        return self._line_at(offset)
+
+    def get_all(self, key: str) -> list[WsvLine]:
+        """All lines of the key in file order, empty if the key is not indexed."""
+        offset = self._offsets.get(key)
+        if offset is None:
+            return []
+        return [self._line_at(offset) for offset in (*self._duplicates.get(key, ()), offset)]
+
+    def _line_at(self, offset: int) -> WsvLine:
+        """Parses the line at the offset."""
+        if self._file is None:
+            self._file = self._path.open("rb")
+        self._file.seek(offset)
+        raw = self._file.readline()[:-1]
+        if offset == 0 and raw.startswith(_UTF8_BOM):
+            raw = raw[len(_UTF8_BOM) :]
+        return parse_line(raw.decode("utf-8"))
+
+    def close(self) -> None:
+        """Closes the file handle used for lookups."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
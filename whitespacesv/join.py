@@ -0,0 +1,175 @@
+"""The join module contains a hash join of two WSV files on key columns."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from typing_extensions import TypeAlias
+
+from whitespacesv.query import iter_rows
+from whitespacesv.stream import WsvWriter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator, Sequence
+
+    from whitespacesv.index import WsvIndexedFile
+    from whitespacesv.stream import StrPathOrFile
+    from whitespacesv.txt import CompressionOption
+
+_Key: TypeAlias = "tuple[str | None, ...]"
+_Lookup: TypeAlias = "Callable[[_Key, list[list[str | None]]], list[list[str | None]]]"
+
+
+def _header(
+    source: StrPathOrFile, compression: CompressionOption
+) -> tuple[list[str], Iterator[list[str | None]]]:
+    """The header and the rows of a file."""
+    rows = iter_rows(source, compression)
+    header = next(rows, None)
+    if header is None:
+        raise ValueError("File has no header")
+    return [str(name) for name in header], rows
+
+
+def _right_header(
+    right: StrPathOrFile, index: WsvIndexedFile | None, compression: CompressionOption
+) -> tuple[list[str], Iterator[list[str | None]]]:
+    """The header and the rows of the right file, no rows are read with an index."""
+    if index is None:
+        return _header(right, compression)
+    if index.header is None:
+        raise ValueError("The index must have a header")
+    return [str(name) for name in index.header], iter(())
+
+
+def _indices(header: list[str], columns: Sequence[str]) -> list[int]:
+    """The indices of the columns in the header."""
+    missing = [column for column in columns if column not in header]
+    if missing:
+        raise ValueError(f"Join column not in header: {missing[0]}")
+    return [header.index(column) for column in columns]
+
+
+def _is_smaller(left: StrPathOrFile, right: StrPathOrFile) -> bool:
+    """True if both sources are paths and the left file is smaller."""
+    if isinstance(left, (str, os.PathLike)) and isinstance(right, (str, os.PathLike)):
+        return Path(left).stat().st_size < Path(right).stat().st_size
+    return False
+
+
+def _key(values: list[str | None], key_columns: list[int]) -> _Key:
+    """The key of a row."""
+    return tuple([values[ix] for ix in key_columns])
+
+
+def _hash(
+    rows: Iterable[list[str | None]], key_columns: list[int], columns: Sequence[int]
+) -> dict[_Key, list[list[str | None]]]:
+    """Maps the keys of the rows without null keys to the values of the columns."""
+    table: dict[_Key, list[list[str | None]]] = {}
+    for values in rows:
+        key = _key(values, key_columns)
+        if None not in key:
+            table.setdefault(key, []).append([values[ix] for ix in columns])
+    return table
+
+
+def _index_lookup(index: WsvIndexedFile, columns: list[int]) -> _Lookup:
+    """A lookup of the values of the columns in the indexed file like `dict.get`."""
+
+    def lookup(key: _Key, default: list[list[str | None]]) -> list[list[str | None]]:
+        lines = [] if key[0] is None else index.get_all(key[0])
+        if not lines:
+            return default
+        matches: list[list[str | None]] = []
+        for line in lines:
+            values = line.values  # noqa: PD011
+            matches.append([values[ix] if ix < len(values) else None for ix in columns])
+        return matches
+
+    return lookup
+
+
+def join(  # noqa: PLR0913
+    left: StrPathOrFile,
+    right: StrPathOrFile,
+    dst: StrPathOrFile,
+    on: str | Sequence[str],
+    how: Literal["inner", "left"] = "inner",
+    index: WsvIndexedFile | None = None,
+    compression: CompressionOption = "infer",
+) -> int:
+    """Joins two WSV files with headers on key columns.
+
+    A hash table is built from one file and the other file is streamed.
+    For an inner join, the smaller file is hashed, for a left join the right file.
+    The output rows follow the order of the streamed file.
+    Null keys never match. The joined rows are written as compact lines.
+
+    Args:
+        left:
+            The path to the left file or an open text file
+        right:
+            The path to the right file or an open text file
+        dst:
+            The path to the joined file or an open text file
+        on:
+            The name of the key column or the names of multiple key columns
+        how:
+            `inner` writes only matched rows,
+            `left` also writes the unmatched left rows with null right values
+        index:
+            An index of the right file with a header on the single key column.
+            If given, the right rows are looked up in the index instead of reading
+            the right file, with the same matches as hashing it
+        compression:
+            The compression of all files,
+            for more information see `whitespacesv.txt.open_binary`
+
+    Returns:
+        The number of joined rows without the header
+    """
+    if how not in ("inner", "left"):
+        raise ValueError(f"Invalid join: {how}")
+    keys = [on] if isinstance(on, str) else list(on)
+
+    left_header, left_rows = _header(left, compression)
+    right_header, right_rows = _right_header(right, index, compression)
+    left_keys = _indices(left_header, keys)
+    right_keys = _indices(right_header, keys)
+    right_other = [ix for ix in range(len(right_header)) if ix not in right_keys]
+    empty_right: list[str | None] = [None] * len(right_other)
+
+    if index is not None and (len(keys) > 1 or index.key not in (keys[0], right_keys[0])):
+        raise ValueError("The index must be on the single join column")
+
+    count = 0
+    with WsvWriter(dst, "compact", compression=compression) as writer:
+        writer.write_values(left_header + [right_header[ix] for ix in right_other])
+
+        if how == "inner" and index is None and _is_smaller(left, right):
+            # hash the left file and stream the right file
+            table = _hash(left_rows, left_keys, range(len(left_header)))
+            for values in right_rows:
+                right_values = [values[ix] for ix in right_other]
+                for left_values in table.get(_key(values, right_keys), []):
+                    writer.write_values(left_values + right_values)
+                    count += 1
+            return count
+
+        lookup: _Lookup
+        if index is None:
+            lookup = _hash(right_rows, right_keys, right_other).get
+        else:
+            lookup = _index_lookup(index, right_other)
+
+        for values in left_rows:
+            matches = lookup(_key(values, left_keys), [])
+            if not matches and how == "left":
+                matches = [empty_right]
+            for right_values in matches:
+                writer.write_values(values + right_values)
+                count += 1
+    return count
@@ -2,33 +2,230 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import sys
+from typing import TYPE_CHECKING, Callable, Literal, TypeVar, overload
 
-from typing_extensions import override
+from typing_extensions import Self, override
 
+from whitespacesv.memory import MemoryUsage
+from whitespacesv.serializer import SerializationMode, serialize_line, serialize_value
 from whitespacesv.utils import is_string_whitespace
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Sequence
+    from typing import SupportsIndex
+
+    from _typeshed import SupportsRichComparison
+
+_T = TypeVar("_T")
+
+
+class _TrackedList(list[_T]):
+    """A list which marks its owning line as modified whenever it is modified in place."""
+
+    __slots__ = ("_line",)
+
+    _line: WsvLine
+
+    @override
+    def __reduce__(self) -> tuple[type[list[_T]], tuple[list[_T]]]:
+        # the owning line is not part of the list, pickle as a plain list
+        return list, (list(self),)
+
+    @overload
+    def __setitem__(self, key: SupportsIndex, value: _T) -> None: ...
+
+    @overload
+    def __setitem__(self, key: slice, value: Iterable[_T]) -> None: ...
+
+    @override
+    def __setitem__(self, key: SupportsIndex | slice, value: _T | Iterable[_T]) -> None:
+        super().__setitem__(key, value)  # type: ignore[index,assignment]
+        self._line._invalidate()  # noqa: SLF001
+
+    @override
+    def __delitem__(self, key: SupportsIndex | slice) -> None:
+        super().__delitem__(key)
+        self._line._invalidate()  # noqa: SLF001
+
+    @override
+    def __iadd__(self, value: Iterable[_T]) -> Self:  # type: ignore[override]
+        result = super().__iadd__(value)
+        self._line._invalidate()  # noqa: SLF001
+        return result
+
+    @override
+    def __imul__(self, value: SupportsIndex) -> Self:
+        result = super().__imul__(value)
+        self._line._invalidate()  # noqa: SLF001
+        return result
+
+    @override
+    def append(self, value: _T) -> None:
+        super().append(value)
+        self._line._invalidate()  # noqa: SLF001
+
+    @override
+    def extend(self, iterable: Iterable[_T]) -> None:
+        super().extend(iterable)
+        self._line._invalidate()  # noqa: SLF001
+
+    @override
+    def insert(self, index: SupportsIndex, value: _T) -> None:
+        super().insert(index, value)
+        self._line._invalidate()  # noqa: SLF001
+
+    @override
+    def pop(self, index: SupportsIndex = -1) -> _T:
+        value = super().pop(index)
+        self._line._invalidate()  # noqa: SLF001
+        return value
+
+    @override
+    def remove(self, value: _T) -> None:
+        super().remove(value)
+        self._line._invalidate()  # noqa: SLF001
+
+    @override
+    def clear(self) -> None:
+        super().clear()
+        self._line._invalidate()  # noqa: SLF001
+
+    @override
+    def sort(
+        self, *, key: Callable[[_T], SupportsRichComparison] | None = None, reverse: bool = False
+    ) -> None:
+        super().sort(key=key, reverse=reverse)
+        self._line._invalidate()  # noqa: SLF001
+
+    @override
+    def reverse(self) -> None:
+        super().reverse()
+        self._line._invalidate()  # noqa: SLF001
+
+
+def _restore_line(
+    cls: type[WsvLine],
+    values: list[str | None],
+    whitespaces: list[str | None] | None,
+    comment: str | None,
+    source: str | None,
+) -> WsvLine:
+    """Recreates a pickled line, the source is reduced to the line itself."""
+    span = (source, 0, len(source)) if source is not None else None
+    return cls.from_trusted(values, whitespaces, comment, span)
 
 
 class WsvLine:
-    """The WsvLine class represents a line in a WSV document."""
+    """The WsvLine class represents a line in a WSV document.
+
+    Lines parsed from a text keep a reference to their original source span.
+    As long as a line is not modified, it is serialized by slicing the original text
+    in `preserve` mode. Any modification of the values, whitespaces or comment
+    marks the line as dirty.
+
+    The serialized forms are memoized per serialization mode
+    and invalidated on modification.
+
+    The tracking costs memory: the values and whitespaces are list subclasses
+    referencing the line and the span adds two integers. A parsed line takes
+    about 80 bytes or an eighth more than an untracked line, and the parsed lines
+    keep the original text alive. The memoized serializations are only allocated
+    when they are first stored.
+    """
+
+    __slots__ = (
+        "_comment",
+        "_end",
+        "_serialized",
+        "_serialized_values",
+        "_start",
+        "_text",
+        "_values",
+        "_whitespaces",
+    )
 
     def __init__(
         self,
         values: Sequence[str | None] | None = None,
         whitespaces: Sequence[str | None] | None = None,
         comment: str | None = None,
+        *,
+        source: tuple[str, int, int] | None = None,
     ) -> None:
-        """Initializes the WsvLine."""
-        self.values = list(values) if values is not None else []
+        """Initializes the WsvLine.
 
+        Args:
+            values:
+                The values of the line
+            whitespaces:
+                The whitespaces before, between and after the values
+            comment:
+                The comment of the line without the leading hash
+            source:
+                The original text and the span (start, end) of the line in it
+        """
         WsvLine.validate_whitespaces(whitespaces)
         WsvLine.validate_comment(comment)
+        self._init(values if values is not None else [], whitespaces, comment, source)
 
-        self._whitespaces = list(whitespaces) if whitespaces is not None else None
+    def _init(
+        self,
+        values: Iterable[str | None],
+        whitespaces: Iterable[str | None] | None,
+        comment: str | None,
+        source: tuple[str, int, int] | None,
+    ) -> None:
+        """Sets the parts of the line without validating them."""
+        self._values = self._tracked(values)
+        self._whitespaces = self._tracked(whitespaces) if whitespaces is not None else None
         self._comment = comment
+        self._text: str | None
+        self._start = 0
+        self._end = 0
+        if source is None:
+            self._text = None
+        else:
+            self._text, self._start, self._end = source
+        self._serialized: dict[SerializationMode, str] | None = None
+        self._serialized_values: list[str] | None = None
+
+    def _tracked(self, items: Iterable[_T]) -> _TrackedList[_T]:
+        """Copies the items to a list which invalidates this line when modified."""
+        tracked = _TrackedList(items)
+        tracked._line = self  # noqa: SLF001
+        return tracked
+
+    @classmethod
+    def from_trusted(
+        cls,
+        values: Iterable[str | None],
+        whitespaces: Iterable[str | None] | None = None,
+        comment: str | None = None,
+        source: tuple[str, int, int] | None = None,
+    ) -> Self:
+        """Creates a line from trusted parts without validating them.
+
+        This is the fast path for parser output and generated data.
+        The caller guarantees that the whitespaces only contain whitespace characters
+        and that the comment contains no line feed.
+
+        Args:
+            values:
+                The values of the line
+            whitespaces:
+                The whitespaces before, between and after the values
+            comment:
+                The comment of the line without the leading hash
+            source:
+                The original text and the span (start, end) of the line in it
+
+        Returns:
+            The line
+        """
+        line = cls.__new__(cls)
+        line._init(values, whitespaces, comment, source)  # noqa: SLF001
+        return line
 
     @override
     def __repr__(self) -> str:
@@ -45,16 +242,182 @@ class WsvLine:
             and self.comment == value.comment
         )
 
+    @override
+    def __reduce__(
+        self,
+    ) -> tuple[
+        Callable[..., WsvLine],
+        tuple[type[WsvLine], list[str | None], list[str | None] | None, str | None, str | None],
+    ]:
+        whitespaces = list(self._whitespaces) if self._whitespaces is not None else None
+        return _restore_line, (
+            type(self),
+            list(self._values),
+            whitespaces,
+            self._comment,
+            self.source,
+        )
+
+    def _invalidate(self) -> None:
+        """Marks the line as modified and drops the memoized serializations."""
+        self._text = None
+        self._serialized = None
+        self._serialized_values = None
+
+    @property
+    def values(self) -> list[str | None]:
+        """The values of the line."""
+        return self._values
+
+    @values.setter
+    def values(self, values: Sequence[str | None]) -> None:
+        self._values = self._tracked(values)
+        self._invalidate()
+
     @property
     def whitespaces(self) -> list[str | None] | None:
         """The whitespaces of the line."""
         return self._whitespaces
 
+    @whitespaces.setter
+    def whitespaces(self, whitespaces: Sequence[str | None] | None) -> None:
+        WsvLine.validate_whitespaces(whitespaces)
+        self._whitespaces = self._tracked(whitespaces) if whitespaces is not None else None
+        self._invalidate()
+
     @property
     def comment(self) -> str | None:
         """The comment of the line."""
         return self._comment
 
+    @comment.setter
+    def comment(self, comment: str | None) -> None:
+        WsvLine.validate_comment(comment)
+        self._comment = comment
+        self._invalidate()
+
+    @property
+    def dirty(self) -> bool:
+        """True if the line was not parsed or has been modified since."""
+        return self._text is None
+
+    @property
+    def source(self) -> str | None:
+        """The original text of the line or None if the line is dirty."""
+        if self._text is None:
+            return None
+        return self._text[self._start : self._end]
+
+    def serialized_values(self, cache: bool = True) -> list[str]:
+        """The serialized values of the line.
+
+        Args:
+            cache:
+                Whether to memoize the serialized values,
+                an existing memoized list is returned either way
+
+        Returns:
+            The serialized values, a memoized list must not be modified
+        """
+        if self._serialized_values is not None:
+            return self._serialized_values
+        serialized = [serialize_value(value) for value in self._values]
+        if cache:
+            self._serialized_values = serialized
+        return serialized
+
+    def serialize(
+        self,
+        mode: Literal["preserve", "compact"] | SerializationMode = "preserve",
+        cache: bool = True,
+    ) -> str:
+        """Serializes the line.
+
+        Args:
+            mode:
+                The serialization mode, for more information see `SerializationMode`.
+                The `pretty` mode depends on the other lines of the document
+                and is therefore not supported.
+            cache:
+                Whether to memoize the serialization,
+                a memoized serialization is returned either way
+
+        Returns:
+            The serialized line without line feed
+        """
+        mode = SerializationMode(mode)
+
+        if self._serialized is not None:
+            serialized = self._serialized.get(mode)
+            if serialized is not None:
+                return serialized
+
+        if mode == SerializationMode.PRETTY:
+            raise ValueError("Pretty serialization requires the whole document")
+
+        if mode == SerializationMode.COMPACT:
+            serialized = " ".join(self.serialized_values(cache))
+        else:
+            serialized = self.source
+            if serialized is None:
+                serialized = serialize_line(
+                    self.serialized_values(cache), self._whitespaces, self._comment
+                )
+
+        if cache:
+            if self._serialized is None:
+                self._serialized = {}
+            self._serialized[mode] = serialized
+        return serialized
+
+    def memory_usage(self, deep: bool = True) -> MemoryUsage:
+        """Estimates the memory used by the line in bytes.
+
+        Args:
+            deep:
+                Whether to include the strings,
+                otherwise only the line object and its containers are counted.
+                The source is the share of the original text spanned by the line
+
+        Returns:
+            The memory usage, for more information see `whitespacesv.memory`
+        """
+        overhead = sys.getsizeof(self) + sys.getsizeof(self._values)
+        if self._whitespaces is not None:
+            overhead += sys.getsizeof(self._whitespaces)
+        caches = 0
+        if self._serialized is not None:
+            caches += sys.getsizeof(self._serialized)
+        if self._serialized_values is not None:
+            caches += sys.getsizeof(self._serialized_values)
+        if not deep:
+            return MemoryUsage(0, 0, 0, 0, caches, overhead)
+
+        values = sum(sys.getsizeof(value) for value in self._values if value is not None)
+        whitespaces = sum(
+            sys.getsizeof(whitespace)
+            for whitespace in self._whitespaces or []
+            if whitespace is not None
+        )
+        comments = sys.getsizeof(self._comment) if self._comment is not None else 0
+        sources = 0
+        if self._text is not None:
+            # including the line feed after the line
+            sources = (
+                sys.getsizeof(self._text) * (self._end - self._start + 1) // max(len(self._text), 1)
+            )
+
+        if self._serialized is not None:
+            caches += sum(sys.getsizeof(serialized) for serialized in self._serialized.values())
+        if self._serialized_values is not None:
+            # unescaped values are the value strings themselves
+            caches += sum(
+                sys.getsizeof(serialized)
+                for value, serialized in zip(self._values, self._serialized_values)
+                if serialized is not value
+            )
+        return MemoryUsage(values, whitespaces, comments, sources, caches, overhead)
+
     @staticmethod
     def validate_whitespaces(whitespaces: Sequence[str | None] | None) -> None:
         """Validates the whitespaces: no non-whitespace character allowed."""
@@ -0,0 +1,193 @@
+"""The memory module contains estimates of the memory used by WSV lines.
+
+The sizes are computed with `sys.getsizeof`, similar to `DataFrame.memory_usage`.
+They include the line objects, their lists with callbacks and the strings,
+but not the allocator overhead. A string referenced by several lines is counted
+for each line, except for the shared original texts of parsed lines.
+"""
+
+from __future__ import annotations
+
+import struct
+import sys
+from typing import TYPE_CHECKING, Literal, NamedTuple, overload
+
+from typing_extensions import TypeAlias
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from whitespacesv.line import WsvLine
+
+MemoryUsageBy: TypeAlias = Literal["document", "line", "column"]
+
+_POINTER_SIZE = struct.calcsize("P")
+_EMPTY_LIST_SIZE = sys.getsizeof([])
+
+
+class MemoryUsage(NamedTuple):
+    """The estimated memory used by lines in bytes.
+
+    Attributes:
+        values:
+            The value strings
+        whitespaces:
+            The whitespace strings
+        comments:
+            The comment strings
+        sources:
+            The share of the original texts referenced by unmodified parsed lines
+        caches:
+            The memoized serializations
+        overhead:
+            The line objects and their lists
+    """
+
+    values: int
+    whitespaces: int
+    comments: int
+    sources: int
+    caches: int
+    overhead: int
+
+    @property
+    def total(self) -> int:
+        """The sum of all parts."""
+        return sum(self)
+
+
+class MemoryEstimate(NamedTuple):
+    """The estimated memory of lines in bytes, in the current and more compact representations.
+
+    Attributes:
+        current:
+            The lines as they are, the total of `MemoryUsage`
+        values_only:
+            Lines with values only, without whitespaces, comments, sources and caches
+        interned:
+            Lines with values only, where equal values are stored once
+        columnar:
+            One list of values per column without line objects,
+            where equal values are stored once. Lines without values are dropped
+    """
+
+    current: int
+    values_only: int
+    interned: int
+    columnar: int
+
+
+def _list_size(length: int) -> int:
+    """The size of a list of the length without over-allocation."""
+    return _EMPTY_LIST_SIZE + _POINTER_SIZE * length
+
+
+def _column_usages(lines: Sequence[WsvLine], deep: bool) -> list[MemoryUsage]:
+    """The memory of the values per column, the overhead are the list slots."""
+    values: list[int] = []
+    overhead: list[int] = []
+    for line in lines:
+        line_values = line.values  # noqa: PD011
+        if len(line_values) > len(values):
+            values.extend([0] * (len(line_values) - len(values)))
+            overhead.extend([0] * (len(line_values) - len(overhead)))
+        for ix, value in enumerate(line_values):
+            overhead[ix] += _POINTER_SIZE
+            if deep and value is not None:
+                values[ix] += sys.getsizeof(value)
+    return [MemoryUsage(size, 0, 0, 0, 0, slots) for size, slots in zip(values, overhead)]
+
+
+@overload
+def memory_usage(
+    lines: Sequence[WsvLine], deep: bool = True, by: Literal["document"] = "document"
+) -> MemoryUsage: ...
+
+
+@overload
+def memory_usage(
+    lines: Sequence[WsvLine], deep: bool, by: Literal["line", "column"]
+) -> list[MemoryUsage]: ...
+
+
+@overload
+def memory_usage(
+    lines: Sequence[WsvLine], deep: bool = True, *, by: Literal["line", "column"]
+) -> list[MemoryUsage]: ...
+
+
+def memory_usage(
+    lines: Sequence[WsvLine], deep: bool = True, by: MemoryUsageBy = "document"
+) -> MemoryUsage | list[MemoryUsage]:
+    """Estimates the memory used by the lines.
+
+    Args:
+        lines:
+            The lines
+        deep:
+            Whether to include the strings,
+            otherwise only the objects and their containers are counted
+        by:
+            If `document`, the usage of all lines and their list is summed.
+            If `line`, the usage of each line is returned.
+            If `column`, the usage of the values of each column is returned,
+            the overhead are the slots of the values in the line lists.
+
+    Returns:
+        The memory usage of the document or a list of usages per line or column
+    """
+    if by == "line":
+        return [line.memory_usage(deep) for line in lines]
+    if by == "column":
+        return _column_usages(lines, deep)
+    if by != "document":
+        raise ValueError(f"Invalid memory usage grouping: {by}")
+
+    parts = [0, 0, 0, 0, 0, sys.getsizeof(lines)]
+    for line in lines:
+        for ix, size in enumerate(line.memory_usage(deep)):
+            parts[ix] += size
+    return MemoryUsage(*parts)
+
+
+def estimate_memory(lines: Sequence[WsvLine]) -> MemoryEstimate:
+    """Estimates the memory of the lines in more compact representations.
+
+    Args:
+        lines:
+            The lines
+
+    Returns:
+        The estimated bytes of the current and the compact representations,
+        for more information see `MemoryEstimate`
+    """
+    current = memory_usage(lines, deep=True)
+    if not lines:
+        return MemoryEstimate(current.total, current.total, current.total, current.total)
+
+    # a line without values, its list of values is added per line
+    line_size = type(lines[0]).from_trusted([]).memory_usage(deep=False).total - _EMPTY_LIST_SIZE
+
+    lines_size = sys.getsizeof(lines)
+    value_size = 0
+    distinct: dict[str, int] = {}
+    rows = 0
+    columns = 0
+    for line in lines:
+        values = line.values  # noqa: PD011
+        lines_size += line_size + _list_size(len(values))
+        if values:
+            rows += 1
+            columns = max(columns, len(values))
+        for value in values:
+            if value is not None:
+                size = distinct.setdefault(value, sys.getsizeof(value))
+                value_size += size
+
+    distinct_size = sum(distinct.values())
+    return MemoryEstimate(
+        current=current.total,
+        values_only=lines_size + value_size,
+        interned=lines_size + distinct_size,
+        columnar=_list_size(columns) + columns * _list_size(rows) + distinct_size,
+    )
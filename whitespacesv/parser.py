@@ -2,8 +2,146 @@
 
 from __future__ import annotations
 
+import re
+from enum import Enum
+from typing import TYPE_CHECKING, NoReturn
+
 from whitespacesv.line import WsvLine
-from whitespacesv.utils import WsvCharIterator
+from whitespacesv.utils import WsvCharIterator, WsvParserError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from whitespacesv.handler import WsvHandler
+
+
+class TokenKind(Enum):
+    """The kind of a token of a WSV document.
+
+    Attributes:
+        WHITESPACE:
+            Whitespaces between values
+        VALUE:
+            An unquoted value
+        NULL:
+            The null value `-`
+        STRING:
+            A double-quoted string including the quotes
+        COMMENT:
+            A comment including the hash
+        LINE_END:
+            The line feed or an empty span at the end of the last line
+    """
+
+    WHITESPACE = "whitespace"
+    VALUE = "value"
+    NULL = "null"
+    STRING = "string"
+    COMMENT = "comment"
+    LINE_END = "line_end"
+
+
+_WHITESPACE = "\t\x0b-\r \x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000"
+# a value or string must be followed by a whitespace, a comment or the line end
+_TOKEN = re.compile(
+    f"(?P<whitespace>[{_WHITESPACE}]+)"
+    "|(?P<comment>#[^\n]*)"
+    f'|(?P<string>"(?:[^"\n]|""|"/")*")(?=[{_WHITESPACE}#\n]|\\Z)'
+    f'|(?P<value>[^{_WHITESPACE}\n"#]+)(?=[{_WHITESPACE}#\n]|\\Z)'
+    "|(?P<line_end>\n)"
+)
+_KINDS = {kind.value: kind for kind in TokenKind}
+_ESCAPE = re.compile('""|"/"')
+
+
+def _unescape(match: re.Match[str]) -> str:
+    return '"' if match.group() == '""' else "\n"
+
+
+def decode_string(token: str) -> str:
+    """Decodes the value of a STRING token."""
+    value = token[1:-1]
+    if '"' not in value:
+        return value
+    return _ESCAPE.sub(_unescape, value)
+
+
+def _raise_at(text: str, ix: int) -> NoReturn:
+    """Raises the error of the parser for the invalid line at the index."""
+    line_start = text.rfind("\n", 0, ix) + 1
+    line_end = text.find("\n", ix)
+    line_ix = text.count("\n", 0, line_start)
+    try:
+        parse_line(text[line_start : line_end if line_end != -1 else len(text)], line_ix)
+    except WsvParserError as exc:
+        raise WsvParserError(
+            exc.ix + line_start, exc.line_ix, exc.line_position, exc.message
+        ) from None
+    raise WsvParserError(ix, line_ix, ix - line_start, "Invalid value")
+
+
+def iter_tokens(text: str) -> Iterator[tuple[TokenKind, int, int]]:
+    """Tokenizes a WSV document without building lines or decoding values.
+
+    Each line, including the last one, ends with a LINE_END token.
+
+    Args:
+        text:
+            The WSV document
+
+    Yields:
+        The kind, start and end index of each token in the text
+
+    Raises:
+        WsvParserError: If the document is invalid, raised when the invalid token is reached
+    """
+    ix = 0
+    end = len(text)
+    match = _TOKEN.match
+    while ix < end:
+        token = match(text, ix)
+        if token is None:
+            _raise_at(text, ix)
+
+        kind = token.lastgroup
+        token_end = token.end()
+        if kind == "value" and token_end - ix == 1 and text[ix] == "-":
+            yield TokenKind.NULL, ix, token_end
+        else:
+            yield _KINDS[kind], ix, token_end  # type: ignore[index]
+
+        ix = token_end
+        if kind != "line_end" and ix == end:
+            yield TokenKind.LINE_END, end, end
+
+
+def parse_events(text: str, handler: WsvHandler) -> None:
+    """Parses a WSV document and pushes the parsed parts to the handler.
+
+    No lines are built, the handler decides which structures to build.
+
+    Args:
+        text:
+            The WSV document
+        handler:
+            The handler receiving the events
+
+    Raises:
+        WsvParserError: If the document is invalid, after the events before the error
+    """
+    for kind, start, end in iter_tokens(text):
+        if kind is TokenKind.VALUE:
+            handler.on_value(text[start:end])
+        elif kind is TokenKind.STRING:
+            handler.on_value(decode_string(text[start:end]))
+        elif kind is TokenKind.NULL:
+            handler.on_value(None)
+        elif kind is TokenKind.WHITESPACE:
+            handler.on_whitespace(text[start:end])
+        elif kind is TokenKind.COMMENT:
+            handler.on_comment(text[start + 1 : end])
+        else:
+            handler.on_line_end()
 
 
 def _parse_value_wrapper(iterator: WsvCharIterator) -> str | None:
@@ -33,6 +171,7 @@ def _try_parse_comment(
 
 def _parse_line(iterator: WsvCharIterator) -> WsvLine:
     """Parses a WSV line."""
+    start_ix = iterator.ix
     values: list[str | None] = []
     whitespaces: list[str | None] = []
 
@@ -44,14 +183,14 @@ def _parse_line(iterator: WsvCharIterator) -> WsvLine:
     while not iterator.is_end_of_section():
         value = None
 
-        if comment := _try_parse_comment(iterator, whitespace, whitespaces):
+        if (comment := _try_parse_comment(iterator, whitespace, whitespaces)) is not None:
             break
 
         value = _parse_value_wrapper(iterator)
 
         values.append(value)
 
-        if comment := _try_parse_comment(iterator, whitespace, whitespaces):
+        if (comment := _try_parse_comment(iterator, whitespace, whitespaces)) is not None:
             break
 
         whitespace = iterator.read_whitespace_or_null()
@@ -61,7 +200,10 @@ def _parse_line(iterator: WsvCharIterator) -> WsvLine:
 
         whitespaces.append(whitespace)
 
-    return WsvLine(values, whitespaces, comment)
+    # keep the span to write the line back verbatim as long as it is unchanged
+    return WsvLine.from_trusted(
+        values, whitespaces, comment, (iterator.text, start_ix, iterator.ix)
+    )
 
 
 def parse_lines(text: str) -> list[WsvLine]:
@@ -77,3 +219,54 @@ def parse_lines(text: str) -> list[WsvLine]:
         iterator.forward()
 
     return lines
+
+
+def parse_line(text: str, line_ix: int = 0) -> WsvLine:
+    """Parses a single WSV line.
+
+    Args:
+        text:
+            The line without the line feed
+        line_ix:
+            The index of the line in its document, used for error messages.
+            The index of a `WsvParserError` is relative to the line.
+
+    Returns:
+        The parsed line
+    """
+    if "\n" in text:
+        raise ValueError("Line feed in line is not allowed")
+
+    iterator = WsvCharIterator(text)
+    try:
+        return _parse_line(iterator)
+    except WsvParserError as exc:
+        raise WsvParserError(
+            exc.ix, exc.line_ix + line_ix, exc.line_position, exc.message
+        ) from None
+
+
+def parse_stream(lines: Iterable[str]) -> Iterator[WsvLine]:
+    """Parses the WSV lines lazily, e.g. from a text file.
+
+    Args:
+        lines:
+            The lines with or without their trailing line feed
+
+    Yields:
+        The parsed lines
+
+    Raises:
+        WsvParserError: If a line is invalid, when it is reached. As for a whole document,
+            the index of the error is relative to the joined lines
+    """
+    # the index of the line in the joined lines
+    offset = 0
+    for line_ix, line in enumerate(lines):
+        try:
+            yield parse_line(line.removesuffix("\n"), line_ix)
+        except WsvParserError as exc:
+            raise WsvParserError(
+                exc.ix + offset, exc.line_ix, exc.line_position, exc.message
+            ) from None
+        offset += len(line)
@@ -0,0 +1,209 @@
+"""The query module contains streaming select, where and group-by queries over WSV files.
+
+The first line with values is the header, which names the columns.
+The files are processed line by line, group-by aggregates need constant memory per group.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable, Literal, Union, cast
+
+from typing_extensions import TypeAlias
+
+from whitespacesv.stream import iter_lines
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Mapping, Sequence
+
+    from whitespacesv.stream import StrPathOrFile
+    from whitespacesv.txt import CompressionOption
+
+Row: TypeAlias = "dict[str, str | None]"
+Where: TypeAlias = "Callable[[Row], bool]"
+AggregateFunction: TypeAlias = Literal["count", "sum", "min", "max", "mean"]
+AggregateValue: TypeAlias = Union[int, float, None]
+
+_AGGREGATE_FUNCTIONS = ("count", "sum", "min", "max", "mean")
+
+
+def _column_index(header: list[str], column: str) -> int:
+    """The index of the column in the header."""
+    if column not in header:
+        raise ValueError(f"Column not in header: {column}")
+    return header.index(column)
+
+
+def iter_rows(
+    source: StrPathOrFile, compression: CompressionOption = "infer"
+) -> Iterator[list[str | None]]:
+    """Yields the header and then the values of each row, all padded to the header length.
+
+    Lines without values are skipped.
+
+    Raises:
+        ValueError: If the header contains None or a row has more values than the header
+    """
+    width = None
+    for line_ix, line in enumerate(iter_lines(source, compression)):
+        values = line.values  # noqa: PD011
+        if not values:
+            continue
+
+        if width is None:
+            if None in values:
+                raise ValueError("Header must not contain null values")
+            width = len(values)
+        elif len(values) > width:
+            raise ValueError(f"Row has more values than the header ({line_ix + 1})")
+        else:
+            values = values + [None] * (width - len(values))
+        yield values
+
+
+def _rows(
+    source: StrPathOrFile, where: Where | None, compression: CompressionOption
+) -> tuple[list[str], Iterator[list[str | None]]]:
+    """The header and the values of the rows matching the filter."""
+    rows = iter_rows(source, compression)
+    header = cast("list[str]", next(rows, []))
+    if where is None:
+        return header, rows
+    return header, (values for values in rows if where(dict(zip(header, values))))
+
+
+def select(
+    source: StrPathOrFile,
+    columns: Sequence[str] | None = None,
+    where: Where | None = None,
+    compression: CompressionOption = "infer",
+) -> Iterator[list[str | None]]:
+    """Selects columns of the rows matching a filter.
+
+    Args:
+        source:
+            The path to the file or an open text file
+        columns:
+            The names of the selected columns, defaults to all columns
+        where:
+            A filter called with each row as mapping from column name to value
+        compression:
+            The compression of the file,
+            for more information see `whitespacesv.txt.open_binary`
+
+    Yields:
+        The values of the selected columns, not including the header
+    """
+    header, rows = _rows(source, where, compression)
+    if columns is None:
+        yield from rows
+        return
+
+    indices = [_column_index(header, column) for column in columns]
+    for values in rows:
+        yield [values[ix] for ix in indices]
+
+
+class _Accumulator:
+    """The running state of the aggregates of one column in one group."""
+
+    __slots__ = ("count", "maximum", "minimum", "total")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.minimum: float | None = None
+        self.maximum: float | None = None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def result(self, function: AggregateFunction) -> AggregateValue:
+        if function == "count":
+            return self.count
+        if function == "sum":
+            return self.total
+        if function == "min":
+            return self.minimum
+        if function == "max":
+            return self.maximum
+        return self.total / self.count if self.count else None
+
+
+def group_by(
+    source: StrPathOrFile,
+    by: Sequence[str],
+    aggregates: Mapping[str, tuple[AggregateFunction, str | None]],
+    where: Where | None = None,
+    compression: CompressionOption = "infer",
+) -> dict[tuple[str | None, ...], dict[str, AggregateValue]]:
+    """Computes aggregates per group in one pass with a hash table.
+
+    Null values are skipped by the aggregates. Except for `count`, the values are
+    converted to float. `count` with the column None counts the rows of the group.
+
+    Args:
+        source:
+            The path to the file or an open text file
+        by:
+            The names of the grouping columns, an empty sequence aggregates all rows
+        aggregates:
+            The output names mapped to the aggregate function and the column name,
+            e.g. `{"total": ("sum", "amount"), "rows": ("count", None)}`
+        where:
+            A filter called with each row as mapping from column name to value
+        compression:
+            The compression of the file,
+            for more information see `whitespacesv.txt.open_binary`
+
+    Returns:
+        The values of the grouping columns mapped to the aggregates of the group
+    """
+    for function, _ in aggregates.values():
+        if function not in _AGGREGATE_FUNCTIONS:
+            raise ValueError(f"Invalid aggregate function: {function}")
+
+    header, rows = _rows(source, where, compression)
+    group_indices = [_column_index(header, column) for column in by]
+    # the aggregates of a column share one accumulator
+    columns = list(dict.fromkeys(column for _, column in aggregates.values()))
+    column_indices = [
+        None if column is None else _column_index(header, column) for column in columns
+    ]
+    # values are only converted for columns with other aggregates than count
+    numeric = [
+        any(function != "count" and other == column for function, other in aggregates.values())
+        for column in columns
+    ]
+
+    groups: dict[tuple[str | None, ...], list[_Accumulator]] = {}
+    for values in rows:
+        group = tuple([values[ix] for ix in group_indices])
+        accumulators = groups.get(group)
+        if accumulators is None:
+            accumulators = groups[group] = [_Accumulator() for _ in columns]
+
+        for accumulator, ix, is_numeric in zip(accumulators, column_indices, numeric):
+            if ix is None:
+                accumulator.count += 1
+                continue
+            value = values[ix]
+            if value is None:
+                continue
+            if is_numeric:
+                accumulator.add(float(value))
+            else:
+                accumulator.count += 1
+
+    positions = {column: position for position, column in enumerate(columns)}
+    return {
+        group: {
+            name: accumulators[positions[column]].result(function)
+            for name, (function, column) in aggregates.items()
+        }
+        for group, accumulators in groups.items()
+    }
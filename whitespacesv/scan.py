@@ -0,0 +1,174 @@
+"""The scan module contains fast row counting, head and sampling of WSV files.
+
+The functions work on the raw bytes of utf-8 encoded files
+and only parse the lines they return. The files are not validated.
+"""
+
+# ruff: noqa: PLR2004
+from __future__ import annotations
+
+import io
+import os
+import random
+from contextlib import nullcontext
+from itertools import islice
+from typing import IO, TYPE_CHECKING
+
+from whitespacesv.parser import parse_line
+from whitespacesv.stream import iter_lines
+from whitespacesv.txt import open_binary
+from whitespacesv.utils import is_ord_whitespace
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from contextlib import AbstractContextManager
+
+    from whitespacesv.line import WsvLine
+    from whitespacesv.stream import StrPathOrFile
+    from whitespacesv.txt import CompressionOption, StrPath
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+_ASCII_WHITESPACES = b"\t\n\x0b\x0c\r "
+
+
+def _open(
+    source: StrPath | IO[bytes], compression: CompressionOption
+) -> AbstractContextManager[IO[bytes]]:
+    """Opens a path in binary mode or passes an open binary file through."""
+    if isinstance(source, (str, os.PathLike)):
+        return open_binary(source, "rb", compression)
+    return nullcontext(source)
+
+
+def _is_row(raw: bytes, skip_empty: bool, skip_comment_only: bool) -> bool:
+    """True if the raw line is neither a skipped empty nor a skipped comment-only line."""
+    stripped = raw.lstrip(_ASCII_WHITESPACES)
+    if not stripped:
+        return not skip_empty
+
+    first = stripped[0]
+    if first == 0x23:  # HASH
+        return not skip_comment_only
+    if first < 0x80:
+        return True
+
+    # slow path for non-ascii whitespaces
+    for char in stripped.decode("utf-8"):
+        if char == "#":
+            return not skip_comment_only
+        if char != "\n" and not is_ord_whitespace(ord(char)):
+            return True
+    return not skip_empty
+
+
+def _raw_lines(file: IO[bytes]) -> Iterator[bytes]:
+    """Yields the raw lines without utf-8 BOM."""
+    for line_ix, raw in enumerate(file):
+        yield raw[len(_UTF8_BOM) :] if line_ix == 0 and raw.startswith(_UTF8_BOM) else raw
+
+
+def count_rows(
+    source: StrPath | IO[bytes],
+    skip_empty: bool = True,
+    skip_comment_only: bool = True,
+    compression: CompressionOption = "infer",
+) -> int:
+    """Counts the rows of a WSV file without parsing it.
+
+    Args:
+        source:
+            The path to the file or an open binary file
+        skip_empty:
+            Whether lines with only whitespaces are skipped
+        skip_comment_only:
+            Whether lines with only a comment are skipped
+        compression:
+            The compression of the file,
+            for more information see `whitespacesv.txt.open_binary`
+
+    Returns:
+        The number of rows
+    """
+    with _open(source, compression) as file:
+        if skip_empty or skip_comment_only:
+            return sum(_is_row(raw, skip_empty, skip_comment_only) for raw in _raw_lines(file))
+
+        count = 0
+        last = b"\n"
+        while chunk := file.read(io.DEFAULT_BUFFER_SIZE * 16):
+            count += chunk.count(b"\n")
+            last = chunk
+        # a missing line feed at the end still counts as a line
+        return count + (not last.endswith(b"\n"))
+
+
+def head(
+    source: StrPathOrFile, n: int = 10, compression: CompressionOption = "infer"
+) -> list[WsvLine]:
+    """Parses only the first n lines of a WSV file.
+
+    Args:
+        source:
+            The path to the file or an open text file
+        n:
+            The number of lines
+        compression:
+            The compression of the file,
+            for more information see `whitespacesv.txt.open_binary`
+
+    Returns:
+        The first n lines
+    """
+    return list(islice(iter_lines(source, compression), n))
+
+
+def sample(
+    source: StrPath | IO[bytes],
+    k: int,
+    seed: int | None = None,
+    skip_empty: bool = True,
+    skip_comment_only: bool = True,
+    compression: CompressionOption = "infer",
+) -> list[WsvLine]:
+    """Samples k rows of a WSV file uniformly with reservoir sampling.
+
+    Only the sampled rows are parsed.
+
+    Args:
+        source:
+            The path to the file or an open binary file
+        k:
+            The number of rows to sample
+        seed:
+            The seed of the random number generator
+        skip_empty:
+            Whether lines with only whitespaces are skipped
+        skip_comment_only:
+            Whether lines with only a comment are skipped
+        compression:
+            The compression of the file,
+            for more information see `whitespacesv.txt.open_binary`
+
+    Returns:
+        The sampled rows in file order
+    """
+    rng = random.Random(seed)  # noqa: S311
+    reservoir: list[tuple[int, bytes]] = []
+
+    with _open(source, compression) as file:
+        seen = 0
+        for line_ix, raw in enumerate(_raw_lines(file)):
+            if not _is_row(raw, skip_empty, skip_comment_only):
+                continue
+            if seen < k:
+                reservoir.append((line_ix, raw))
+            else:
+                ix = rng.randrange(seen + 1)
+                if ix < k:
+                    reservoir[ix] = (line_ix, raw)
+            seen += 1
+
+    reservoir.sort()
+    return [
+        parse_line(raw.decode("utf-8").removesuffix("\n"), line_ix) for line_ix, raw in reservoir
+    ]
@@ -4,12 +4,13 @@
 from __future__ import annotations
 
 from enum import Enum
+from itertools import zip_longest
 from typing import TYPE_CHECKING
 
-from whitespacesv.utils import chars_to_ords, contains_string_special_chars, ords_to_chars
+from whitespacesv.utils import contains_string_special_chars
 
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterable, Iterator, Sequence
 
 
 class SerializationMode(Enum):
@@ -30,11 +31,31 @@ class SerializationMode(Enum):
     PRETTY = "pretty"
 
 
-def prettify_values(values: list[list[str]], comments: list[str | None]) -> list[str]:
-    """Prettifies the values and adds comments if present."""
-    # Get the maximum length of each column
-    transposed_it: Iterator[tuple[str, ...]] = zip(*values)
-    col_sizes = [max(len(x) for x in col) for col in transposed_it]
+def column_widths(values: Iterable[Sequence[str]]) -> list[int]:
+    """The maximum length of each column of the serialized values."""
+    # lines may have different lengths
+    transposed_it: Iterator[tuple[str, ...]] = zip_longest(*values, fillvalue="")
+    return [max(len(x) for x in col) for col in transposed_it]
+
+
+def merge_column_widths(widths: list[int], other: Sequence[int]) -> None:
+    """Widens the column widths in place to the maximum of both."""
+    for ix, width in enumerate(other):
+        if ix < len(widths):
+            widths[ix] = max(widths[ix], width)
+        else:
+            widths.append(width)
+
+
+def prettify_values(
+    values: list[list[str]], comments: list[str | None], col_sizes: Sequence[int] | None = None
+) -> list[str]:
+    """Prettifies the values and adds comments if present.
+
+    The column widths are computed from the values, unless they are passed.
+    """
+    if col_sizes is None:
+        col_sizes = column_widths(values)
 
     min_spacing = "\t"
 
@@ -69,25 +90,9 @@ def serialize_value(value: str | None) -> str:
     # If spaces, new lines, etc. are in the string,
     # we have to escape it with double quotes
     if contains_string_special_chars(value):
-        result: list[int] = []
-        ords = chars_to_ords(value)
-        result.append(0x22)  # DOUBLE_QUOTE
-        for c in ords:
-            # New line is escaped with double quote, slash, double quote
-            if c == 0x0A:  # NEW_LINE
-                result.append(0x22)  # DOUBLE_QUOTE
-                result.append(0x2F)  # SLASH
-                result.append(0x22)  # DOUBLE_QUOTE
-
-            # Double quote is escaped with double quote
-            elif c == 0x22:  # DOUBLE_QUOTE
-                result.append(0x22)  # DOUBLE_QUOTE
-                result.append(0x22)  # DOUBLE_QUOTE
-            else:
-                result.append(c)
-
-        result.append(0x22)  # DOUBLE_QUOTE
-        return ords_to_chars(result)
+        # Double quote is escaped with double quote,
+        # new line is escaped with double quote, slash, double quote
+        return '"' + value.replace('"', '""').replace("\n", '"/"') + '"'
 
     return value
 
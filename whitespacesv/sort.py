@@ -0,0 +1,168 @@
+"""The sort module contains an external merge sort of WSV files by columns.
+
+The rows are sorted in runs that fit into the memory limit.
+The runs are spilled to temporary WSV files and merged with `heapq.merge`,
+so files larger than the memory can be sorted.
+"""
+
+from __future__ import annotations
+
+import heapq
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal
+
+from typing_extensions import TypeAlias
+
+from whitespacesv.stream import WsvWriter, iter_lines
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
+    from whitespacesv.line import WsvLine
+    from whitespacesv.serializer import SerializationMode
+    from whitespacesv.stream import StrPathOrFile
+    from whitespacesv.txt import CompressionOption, StrPath
+
+# a row with the lines without values before it, e.g. comments
+_Record: TypeAlias = "tuple[list[WsvLine], WsvLine]"
+_SortKey: TypeAlias = "tuple[tuple[bool, str | float], ...]"
+
+# the estimated memory of a parsed line in addition to its text
+_LINE_OVERHEAD = 256
+
+
+def _records(lines: Iterable[WsvLine], trailing: list[WsvLine]) -> Iterator[_Record]:
+    """Groups the lines without values with the next row.
+
+    The lines after the last row are appended to trailing.
+    """
+    attached: list[WsvLine] = []
+    for line in lines:
+        if line.values:  # noqa: PD011
+            yield attached, line
+            attached = []
+        else:
+            attached.append(line)
+    trailing.extend(attached)
+
+
+def _write_records(writer: WsvWriter, records: Iterable[_Record]) -> int:
+    """Writes the records and returns their number."""
+    count = 0
+    for attached, row in records:
+        writer.write_lines(attached)
+        writer.write_line(row)
+        count += 1
+    return count
+
+
+def _resolve_columns(key: Sequence[int | str], header: WsvLine | None) -> list[int]:
+    """The indices of the key columns."""
+    columns = []
+    for column in key:
+        if isinstance(column, int):
+            columns.append(column)
+            continue
+        if header is None:
+            raise ValueError("A key column name requires a header")
+        names = header.values  # noqa: PD011
+        if column not in names:
+            raise ValueError(f"Key column not in header: {column}")
+        columns.append(names.index(column))
+    return columns
+
+
+def sort_file(  # noqa: PLR0913
+    src: StrPathOrFile,
+    dst: StrPathOrFile,
+    key: int | str | Sequence[int | str] = 0,
+    numeric: bool = False,
+    reverse: bool = False,
+    header: bool = False,
+    memory_limit: int = 64 * 1024 * 1024,
+    mode: Literal["preserve", "compact"] | SerializationMode = "preserve",
+    temp_dir: StrPath | None = None,
+    compression: CompressionOption = "infer",
+) -> int:
+    """Sorts the rows of a WSV file by columns in bounded memory.
+
+    The sort is stable. Missing and None values sort before all other values.
+    Lines without values, e.g. comments, stay attached to the next row,
+    the lines after the last row stay at the end.
+
+    Args:
+        src:
+            The path to the file or an open text file
+        dst:
+            The path to the sorted file or an open text file
+        key:
+            The index or, with a header, the name of the key column
+            or a sequence of them for multiple columns
+        numeric:
+            Whether the key values are compared as numbers instead of strings
+        reverse:
+            Whether to sort in descending order
+        header:
+            Whether the first row is the header, which stays first
+        memory_limit:
+            The approximate memory in bytes used for sorting before runs are spilled
+        mode:
+            The serialization mode of the sorted file,
+            for more information see `SerializationMode`
+        temp_dir:
+            The directory of the temporary run files, defaults to the system default
+        compression:
+            The compression of both files,
+            for more information see `whitespacesv.txt.open_binary`
+
+    Returns:
+        The number of sorted rows without the header
+    """
+    keys = [key] if isinstance(key, (int, str)) else list(key)
+    if any(isinstance(column, str) for column in keys) and not header:
+        raise ValueError("A key column name requires a header")
+
+    trailing: list[WsvLine] = []
+    records = _records(iter_lines(src, compression), trailing)
+    header_record = next(records, None) if header else None
+    columns = _resolve_columns(keys, header_record[1] if header_record else None)
+
+    def sort_key(record: _Record) -> _SortKey:
+        values = record[1].values  # noqa: PD011
+        sort_values: list[tuple[bool, str | float]] = []
+        for column in columns:
+            value = values[column] if column < len(values) else None
+            if value is None:
+                sort_values.append((False, ""))
+            else:
+                sort_values.append((True, float(value) if numeric else value))
+        return tuple(sort_values)
+
+    with tempfile.TemporaryDirectory(dir=temp_dir) as directory:
+        runs: list[Path] = []
+        run: list[_Record] = []
+        size = 0
+        for attached, row in records:
+            run.append((attached, row))
+            size += sum(len(line.serialize()) + _LINE_OVERHEAD for line in [*attached, row])
+            if size >= memory_limit:
+                run.sort(key=sort_key, reverse=reverse)
+                path = Path(directory) / f"run{len(runs)}.txt"
+                with WsvWriter(path) as writer:
+                    _write_records(writer, run)
+                runs.append(path)
+                run = []
+                size = 0
+
+        run.sort(key=sort_key, reverse=reverse)
+        # the runs are read back after all lines were read
+        spilled = [_records(iter_lines(path), []) for path in runs]
+        sorted_records = heapq.merge(*spilled, run, key=sort_key, reverse=reverse)
+
+        with WsvWriter(dst, mode, compression=compression) as writer:
+            if header_record is not None:
+                _write_records(writer, [header_record])
+            count = _write_records(writer, sorted_records)
+            writer.write_lines(trailing)
+    return count
@@ -0,0 +1,145 @@
+"""The stream module contains functions to process WSV files line by line."""
+
+from __future__ import annotations
+
+import os
+from contextlib import nullcontext
+from typing import IO, TYPE_CHECKING, Literal
+
+from typing_extensions import Self, TypeAlias
+
+from whitespacesv.parser import parse_stream
+from whitespacesv.serializer import SerializationMode, serialize_value
+from whitespacesv.txt import open_text
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+    from contextlib import AbstractContextManager
+    from types import TracebackType
+
+    from whitespacesv.line import WsvLine
+    from whitespacesv.txt import CompressionOption, StrPath
+
+StrPathOrFile: TypeAlias = "StrPath | IO[str]"
+
+
+def open_source(
+    source: StrPathOrFile,
+    mode: Literal["r", "w", "a"] = "r",
+    compression: CompressionOption = "infer",
+) -> AbstractContextManager[IO[str]]:
+    """Opens a path as text file or passes an open text file through without closing it."""
+    if isinstance(source, (str, os.PathLike)):
+        return open_text(source, mode, compression)
+    return nullcontext(source)
+
+
+def _checked_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Yields the lines and checks the new line at the end.
+
+    Only the last line of a file can miss the line feed,
+    so the missing new line is raised before the last line is parsed.
+    The BOM is already skipped by `open_text`.
+    """
+    line = ""
+    for line in lines:
+        if not line.endswith("\n"):
+            break
+        yield line
+
+    if not line.endswith("\n"):
+        raise ValueError("Empty file or no new line at the end")
+
+
+def iter_lines(
+    source: StrPathOrFile, compression: CompressionOption = "infer"
+) -> Iterator[WsvLine]:
+    """Parses the lines of a WSV file lazily.
+
+    The file is read, decompressed and parsed line by line.
+
+    Args:
+        source:
+            The path to the file or an open text file, e.g. `sys.stdin`
+        compression:
+            The compression of the file,
+            for more information see `whitespacesv.txt.open_binary`
+
+    Yields:
+        The parsed lines
+
+    Raises:
+        ValueError: If the file is empty or its last line has no line feed,
+            before the last line is parsed
+        WsvParserError: If a line is invalid, when it is reached.
+            Unlike parsing the whole text, the lines before are yielded first
+            and an invalid line raises before a missing line feed at the end
+    """
+    with open_source(source, "r", compression) as file:
+        yield from parse_stream(_checked_lines(file))
+
+
+class WsvWriter:
+    """Writes WSV lines incrementally to a file.
+
+    Each line is serialized and written with its line feed as soon as it is passed.
+    `pretty` mode is not supported, since it depends on all lines.
+    """
+
+    def __init__(
+        self,
+        target: StrPathOrFile,
+        mode: Literal["preserve", "compact"] | SerializationMode = "preserve",
+        append: bool = False,
+        compression: CompressionOption = "infer",
+    ) -> None:
+        """Initializes the writer.
+
+        Args:
+            target:
+                The path to the file or an open text file, e.g. `sys.stdout`.
+                Open files are not closed by the writer.
+            mode:
+                The serialization mode of `write_line`,
+                for more information see `SerializationMode`
+            append:
+                Whether to append to the file instead of rewriting it,
+                in the encoding of the file
+            compression:
+                The compression of the file,
+                for more information see `whitespacesv.txt.open_binary`
+        """
+        self.mode = SerializationMode(mode)
+        if self.mode == SerializationMode.PRETTY:
+            raise ValueError("Pretty serialization requires the whole document")
+
+        self._context = open_source(target, "a" if append else "w", compression)
+        self._file = self._context.__enter__()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def write_line(self, line: WsvLine) -> None:
+        """Writes the serialized line."""
+        self._file.write(line.serialize(self.mode) + "\n")
+
+    def write_lines(self, lines: Iterable[WsvLine]) -> None:
+        """Writes the serialized lines."""
+        for line in lines:
+            self.write_line(line)
+
+    def write_values(self, values: Sequence[str | None]) -> None:
+        """Writes the values as compact line."""
+        self._file.write(" ".join([serialize_value(value) for value in values]) + "\n")
+
+    def close(self) -> None:
+        """Closes the file if it was opened by the writer."""
+        self._context.__exit__(None, None, None)
@@ -3,8 +3,14 @@
 # ruff: noqa: PLR2004
 from __future__ import annotations
 
+import bz2
+import codecs
+import gzip
+import io
+import lzma
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING, Literal, cast
 
 from typing_extensions import Self, TypeAlias
 
@@ -12,6 +18,24 @@ if TYPE_CHECKING:
     from os import PathLike
 
 StrPath: TypeAlias = "str | PathLike[str]"
+Compression: TypeAlias = Literal["gzip", "bz2", "xz"]
+CompressionOption: TypeAlias = "Compression | Literal['infer'] | None"
+
+_COMPRESSION_SUFFIXES: dict[str, Compression] = {
+    ".gz": "gzip",
+    ".bz2": "bz2",
+    ".xz": "xz",
+    ".lzma": "xz",
+}
+
+# the byte order marks of ReliableTXT, the utf-32 little-endian mark starts with the utf-16 one
+_BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF32_LE, "utf-32-le"),
+    (codecs.BOM_UTF32_BE, "utf-32-be"),
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
 
 
 def chars_to_ords(chars: str) -> list[int]:
@@ -38,6 +62,127 @@ def ords_to_chars(ords: list[int]) -> str:
     return "".join([chr(c) for c in ords])
 
 
+def infer_compression(file_path: StrPath) -> Compression | None:
+    """The compression of the file inferred from its suffix."""
+    return _COMPRESSION_SUFFIXES.get(Path(file_path).suffix.lower())
+
+
+def open_binary(
+    file_path: StrPath,
+    mode: Literal["rb", "wb", "ab"] = "rb",
+    compression: CompressionOption = "infer",
+) -> IO[bytes]:
+    """Opens a file in binary mode with transparent (de)compression.
+
+    Args:
+        file_path:
+            The path to the file
+        mode:
+            The mode to open the file in
+        compression:
+            The compression of the file. If `infer`, it is inferred from the suffix
+            (`.gz`, `.bz2`, `.xz` or `.lzma`). If None, the file is not compressed.
+
+    Returns:
+        The file object, compressed files are (de)compressed while streaming
+    """
+    if compression == "infer":
+        compression = infer_compression(file_path)
+    if compression not in (None, "gzip", "bz2", "xz"):
+        raise ValueError(f"Invalid compression: {compression}")
+
+    if compression == "gzip":
+        return cast("IO[bytes]", gzip.open(file_path, mode))
+    if compression == "bz2":
+        return bz2.open(file_path, mode)
+    if compression == "xz":
+        return lzma.open(file_path, mode)
+    return open(file_path, mode)  # noqa: PTH123, SIM115
+
+
+def detect_encoding(prefix: bytes) -> tuple[str, int]:
+    """Detects the encoding of ReliableTXT data from its byte order mark.
+
+    UTF-8, UTF-16 and UTF-32 in both byte orders are detected,
+    data without byte order mark is UTF-8.
+
+    Args:
+        prefix:
+            The first (up to) four bytes of the data
+
+    Returns:
+        The name of the codec and the length of the byte order mark
+    """
+    for mark, encoding in _BYTE_ORDER_MARKS:
+        if prefix.startswith(mark):
+            return encoding, len(mark)
+    return "utf-8", 0
+
+
+def _peek_encoding(file: IO[bytes]) -> tuple[str, int]:
+    """Detects the encoding of a file opened for reading without consuming its bytes."""
+    # all files opened for reading by open_binary are buffered
+    return detect_encoding(cast("io.BufferedReader", file).peek(4)[:4])
+
+
+def detect_file_encoding(file_path: StrPath, compression: CompressionOption = "infer") -> str:
+    """The encoding of a ReliableTXT file, utf-8 if the file does not exist.
+
+    Only the byte order mark is read, for more information see `detect_encoding`.
+    """
+    try:
+        with open_binary(file_path, "rb", compression) as file:
+            return _peek_encoding(file)[0]
+    except FileNotFoundError:
+        return "utf-8"
+
+
+def open_text(
+    file_path: StrPath, mode: Literal["r", "w", "a"] = "r", compression: CompressionOption = "infer"
+) -> io.TextIOWrapper:
+    r"""Opens a ReliableTXT file in text mode with transparent (de)compression.
+
+    When reading, the encoding is detected from the byte order mark and the mark is skipped,
+    for more information see `detect_encoding`. The bytes are decoded incrementally.
+    Written text keeps its '\\n' line endings and is utf-8 encoded,
+    except when appending to a file with another encoding, which is kept.
+    For more information see `open_binary`.
+    """
+    if mode == "r":
+        file = open_binary(file_path, "rb", compression)
+        encoding, size = _peek_encoding(file)
+        file.read(size)
+        return io.TextIOWrapper(file, encoding=encoding, newline=None)
+
+    encoding = detect_file_encoding(file_path, compression) if mode == "a" else "utf-8"
+    return io.TextIOWrapper(
+        open_binary(file_path, "wb" if mode == "w" else "ab", compression),
+        encoding=encoding,
+        newline="\n",
+    )
+
+
+def ends_with_new_line(file_path: StrPath, compression: CompressionOption = "infer") -> bool:
+    """True if the file ends with a line feed in the encoding of the file.
+
+    Only the first and last bytes of uncompressed files are read.
+    Compressed files can't be read from the end, they are decompressed while streaming,
+    which costs as much as reading the whole file but needs constant memory.
+    """
+    with open_binary(file_path, "rb", compression) as file:
+        new_line = "\n".encode(_peek_encoding(file)[0])
+        if not isinstance(file, io.BufferedReader):
+            last = b""
+            while chunk := file.read(io.DEFAULT_BUFFER_SIZE):
+                last = (last + chunk)[-len(new_line) :]
+            return last == new_line
+
+        if file.seek(0, os.SEEK_END) < len(new_line):
+            return False
+        file.seek(-len(new_line), os.SEEK_END)
+        return file.read(len(new_line)) == new_line
+
+
 class TxtDocument:
     """A class representing a text document."""
 
@@ -50,24 +195,29 @@ class TxtDocument:
         """The text of the document."""
         return self._text
 
-    def save(self, file_path: StrPath) -> None:
-        r"""Writes the text with '\\n' line endings to a file."""
-        with open(file_path, "w", newline="\n", encoding="utf-8") as file:  # noqa: PTH123
+    def save(
+        self, file_path: StrPath, append: bool = False, compression: CompressionOption = "infer"
+    ) -> None:
+        r"""Writes the text with '\\n' line endings to a file.
+
+        If append is True, the text is appended to the file instead,
+        in the encoding of the file. The compression is inferred from the suffix by default,
+        for more information see `open_binary`.
+        """
+        with open_text(file_path, "a" if append else "w", compression) as file:
             file.write(self._text)
 
     @classmethod
-    def load(cls, file_path: StrPath) -> Self:
+    def load(cls, file_path: StrPath, compression: CompressionOption = "infer") -> Self:
         """Loads a text document from a file.
 
-        If the file has a utf-8 BOM, it is ignored.
+        The encoding is detected from the byte order mark, which is not part of the text,
+        for more information see `detect_encoding`.
+        The compression is inferred from the suffix by default,
+        for more information see `open_binary`.
         """
-        text = Path(file_path).read_text(encoding="utf-8")
-
-        # Allow for utf-8 BOM but ignore it
-        if text and text[0] and text[0] == "\ufeff":
-            text = text[1:]
-
-        return cls(text)
+        with open_text(file_path, "r", compression) as file:
+            return cls(file.read())
 
 
 class TxtCharIterator:
@@ -75,9 +225,15 @@ class TxtCharIterator:
 
     def __init__(self, text: str) -> None:
         """Initializes the iterator with a text."""
+        self._text = text
         self._chars = chars_to_ords(text)
         self._ix = 0
 
+    @property
+    def text(self) -> str:
+        """The iterated text."""
+        return self._text
+
     @property
     def ix(self) -> int:
         """The current index in the text."""
@@ -3,6 +3,7 @@
 # ruff: noqa: PLR2004
 from __future__ import annotations
 
+import re
 from io import StringIO
 from typing import TYPE_CHECKING
 
@@ -31,14 +32,15 @@ def is_string_whitespace(string: str) -> bool:
     return all(is_ord_whitespace(c) for c in ords)
 
 
+# whitespace characters, new line, double quote and hash
+_SPECIAL_CHARS = re.compile(
+    '[\t\n\x0b-\r "#\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000]'
+)
+
+
 def contains_string_special_chars(value: str) -> bool:
     """True if the string contains special characters."""
-    ords = chars_to_ords(value)
-
-    return any(
-        c == 10 or is_ord_whitespace(c) or c in {34, 35}  # HASH
-        for c in ords
-    )
+    return _SPECIAL_CHARS.search(value) is not None
 
 
 class WsvParserError(Exception):
@@ -56,6 +58,7 @@ class WsvParserError(Exception):
             message (str): The error message
         """
         super().__init__(f"{message} ({line_ix + 1}, {line_position + 1})")
+        self.message = message
         self.ix = ix
         self.line_ix = line_ix
         self.line_position = line_position
@@ -0,0 +1,119 @@
+"""The vectorized module contains a NumPy tokenizer for large WSV documents.
+
+The text is viewed as an array of code points, uint8 for ascii and uint32 otherwise.
+Whitespaces and line feeds are classified with vectorized masks and the boundaries
+of values and whitespaces are found with `np.flatnonzero` for the whole document.
+Lines containing a double quote or a hash are parsed by the scalar parser.
+"""
+
+# ruff: noqa: PLR2004
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from whitespacesv.line import WsvLine
+from whitespacesv.parser import parse_line
+from whitespacesv.utils import WsvParserError
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+# the code points of the whitespace characters of WSV without the line feed
+_WHITESPACES = np.array(
+    [
+        *(9, 11, 12, 13, 32, 0x85, 0xA0, 0x1680),
+        *range(0x2000, 0x200B),
+        *(0x2028, 0x2029, 0x202F, 0x205F, 0x3000),
+    ],
+    dtype=np.uint32,
+)
+_ASCII_WHITESPACES = _WHITESPACES[_WHITESPACES < 0x80].astype(np.uint8)
+
+
+def _code_points(text: str) -> npt.NDArray[np.uint8] | npt.NDArray[np.uint32]:
+    """The code points of the text, one array element per character."""
+    if text.isascii():
+        return np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    return np.frombuffer(text.encode("utf-32-le"), dtype="<u4")
+
+
+def _runs(mask: npt.NDArray[np.bool_]) -> tuple[list[int], list[int]]:
+    """The start and end indices of the runs of True in the mask."""
+    padded = np.concatenate(([False], mask, [False]))
+    edges = np.flatnonzero(np.diff(padded.view(np.int8)))
+    return edges[::2].tolist(), edges[1::2].tolist()
+
+
+def _parse_slow(text: str, start: int, end: int, line_ix: int) -> WsvLine:
+    """Parses a line with strings or comments with the scalar parser."""
+    try:
+        line = parse_line(text[start:end], line_ix)
+    except WsvParserError as exc:
+        raise WsvParserError(exc.ix + start, exc.line_ix, exc.line_position, exc.message) from None
+    return line
+
+
+def parse_lines_vectorized(text: str) -> list[WsvLine]:
+    """Parses the WSV lines like `parse_lines` with vectorized tokenization.
+
+    This is faster for large documents with many unquoted values,
+    e.g. wide numeric tables.
+
+    Args:
+        text:
+            The WSV document
+
+    Returns:
+        The parsed lines, equal to the result of `parse_lines`
+    """
+    if not text:
+        return []
+
+    codes = _code_points(text)
+    whitespaces = _ASCII_WHITESPACES if codes.dtype == np.uint8 else _WHITESPACES
+    is_line_feed = codes == 10  # NEW_LINE
+    is_whitespace = np.isin(codes, whitespaces)
+    is_special = (codes == 34) | (codes == 35)  # DOUBLE_QUOTE  # HASH
+
+    line_feeds = np.flatnonzero(is_line_feed)
+    # a line feed at the end of the text does not start another line
+    line_starts = np.concatenate(([0], line_feeds + 1))
+    line_starts = line_starts[line_starts < len(text)]
+    line_ends = np.concatenate((line_feeds, [len(text)]))[: len(line_starts)]
+
+    special_lines = set(np.searchsorted(line_feeds, np.flatnonzero(is_special)).tolist())
+    value_starts, value_ends = _runs(~(is_whitespace | is_line_feed))
+    whitespace_starts, whitespace_ends = _runs(is_whitespace)
+    value_bounds = np.searchsorted(value_starts, line_starts).tolist()
+    whitespace_bounds = np.searchsorted(whitespace_starts, line_starts).tolist()
+    value_bounds.append(len(value_starts))
+    whitespace_bounds.append(len(whitespace_starts))
+
+    lines: list[WsvLine] = []
+    for line_ix, (start, end) in enumerate(zip(line_starts.tolist(), line_ends.tolist())):
+        if line_ix in special_lines:
+            lines.append(_parse_slow(text, start, end, line_ix))
+            continue
+
+        first, last = value_bounds[line_ix], value_bounds[line_ix + 1]
+        values: list[str | None] = [
+            text[value_start:value_end]
+            for value_start, value_end in zip(value_starts[first:last], value_ends[first:last])
+        ]
+        values = [None if value == "-" else value for value in values]
+
+        first, last = whitespace_bounds[line_ix], whitespace_bounds[line_ix + 1]
+        line_whitespaces: list[str | None] = [
+            text[whitespace_start:whitespace_end]
+            for whitespace_start, whitespace_end in zip(
+                whitespace_starts[first:last], whitespace_ends[first:last]
+            )
+        ]
+        # the first whitespace is the one before the first value
+        if first == last or whitespace_starts[first] != start:
+            line_whitespaces.insert(0, None)
+
+        lines.append(WsvLine.from_trusted(values, line_whitespaces, None, (text, start, end)))
+    return lines